@@ -2,6 +2,7 @@
 
 from fontTools.ttLib import TTFont, newTable
 from fontTools.misc.cliTools import makeOutputFileName
+from fontTools.misc.psCharStrings import T2CharString, encodeIntT2
 from fontTools.cffLib import (
     TopDictIndex,
     buildOrder,
@@ -54,6 +55,14 @@ def _convertCFF2ToCFF(cff, otFont):
     fdArray = topDict.FDArray
     charStrings = topDict.CharStrings
 
+    # Load the subroutines while the Private dicts are still in CFF2 mode,
+    # since their INDEX format differs between CFF and CFF2.
+    subrSets = [cff.GlobalSubrs]
+    for fd in fdArray:
+        subrs = getattr(fd.Private, "Subrs", None)
+        if subrs is not None and not any(subrs is s for s in subrSets):
+            subrSets.append(subrs)
+
     defaults = buildDefaults(privateDictOperators)
     order = buildOrder(privateDictOperators)
     for fd in fdArray:
@@ -69,14 +78,14 @@ def _convertCFF2ToCFF(cff, otFont):
                 if hasattr(privateDict, key):
                     delattr(privateDict, key)
 
+    # CFF and CFF2 charstrings only differ in the terminating endchar/return
+    # operators and the width, so patch those directly on the bytecode where
+    # we have it, instead of decompiling and recompiling every charstring.
     for cs in charStrings.values():
-        cs.decompile()
-        cs.program.append("endchar")
-    for subrSets in [cff.GlobalSubrs] + [
-        getattr(fd.Private, "Subrs", []) for fd in fdArray
-    ]:
-        for cs in subrSets:
-            cs.program.append("return")
+        _appendOperator(cs, "endchar")
+    for subrs in subrSets:
+        for cs in subrs:
+            _appendOperator(cs, "return")
 
     # Add (optimal) width to CharStrings that need it.
     widths = defaultdict(list)
@@ -98,7 +107,10 @@ def _convertCFF2ToCFF(cff, otFont):
         private = fdArray[fdIndex].Private
         width = metrics[glyphName][0]
         if width != private.defaultWidthX:
-            cs.program.insert(0, width - private.nominalWidthX)
+            if cs.bytecode is not None:
+                cs.setBytecode(encodeIntT2(width - private.nominalWidthX) + cs.bytecode)
+            else:
+                cs.program.insert(0, width - private.nominalWidthX)
 
     mapping = {
         name: ("cid" + str(n) if n else ".notdef")
@@ -116,6 +128,13 @@ def _convertCFF2ToCFF(cff, otFont):
     # topDict.ROS = ("Adobe", "Identity", 0)
 
 
+def _appendOperator(cs, operator):
+    if cs.bytecode is not None:
+        cs.setBytecode(cs.bytecode + bytes(T2CharString.opcodes[operator]))
+    else:
+        cs.program.append(operator)
+
+
 def convertCFF2ToCFF(font, *, updatePostTable=True):
     cff = font["CFF2"].cff
     _convertCFF2ToCFF(cff, font)
@@ -2,7 +2,7 @@
 
 from fontTools.ttLib import TTFont, newTable
 from fontTools.misc.cliTools import makeOutputFileName
-from fontTools.misc.psCharStrings import T2WidthExtractor
+from fontTools.misc.psCharStrings import T2WidthExtractor, calcSubrBias
 from fontTools.cffLib import (
     TopDictIndex,
     FDArrayIndex,
@@ -22,12 +22,52 @@ __all__ = ["convertCFFToCFF2", "main"]
 log = logging.getLogger("fontTools.cffLib")
 
 
-class _NominalWidthUsedError(Exception):
-    def __add__(self, other):
-        raise self
-
-    def __radd__(self, other):
-        raise self
+class _T2WidthScanner(T2WidthExtractor):
+    """Runs a glyph charstring to find out whether it encodes an explicit width,
+    noting the position of its first two and its last token, without
+    decompiling it. Subroutines are decompiled as usual."""
+
+    def __init__(self, localSubrs, globalSubrs):
+        T2WidthExtractor.__init__(self, localSubrs, globalSubrs, 0, 0)
+
+    def reset(self):
+        T2WidthExtractor.reset(self)
+        self.hasWidth = False
+        self.firstTokens = []
+        self.lastToken = None
+        self.lastTokenIndex = None
+
+    def popallWidth(self, evenOdd=0):
+        if not self.gotWidth:
+            self.hasWidth = bool(evenOdd ^ (len(self.operandStack) % 2))
+        return T2WidthExtractor.popallWidth(self, evenOdd)
+
+    def execute(self, charString):
+        if self.callingStack:
+            return T2WidthExtractor.execute(self, charString)
+        self.callingStack.append(charString)
+        pushToStack = self.operandStack.append
+        index = 0
+        while True:
+            tokenIndex = index
+            token, isOperator, index = charString.getToken(index)
+            if token is None:
+                break
+            if len(self.firstTokens) < 2:
+                self.firstTokens.append((token, index))
+            self.lastToken = token
+            self.lastTokenIndex = tokenIndex
+            if isOperator:
+                handler = getattr(self, "op_" + token, None)
+                if handler is not None:
+                    rv = handler(index)
+                    if rv:
+                        hintMaskBytes, index = rv
+                else:
+                    self.popall()
+            else:
+                pushToStack(token)
+        del self.callingStack[-1]
 
 
 def _convertCFFToCFF2(cff, otFont):
@@ -53,9 +93,32 @@ def _convertCFFToCFF2(cff, otFont):
         )
     )
 
+    def getLocalSubrs(fdIndex):
+        if fdIndex is not None:
+            return localSubrs[fdIndex]
+        if hasattr(topDict, "Private"):
+            return getattr(topDict.Private, "Subrs", [])
+        return []
+
+    # Find out where the width and endchar of each glyph are. Glyphs are
+    # not decompiled, except for the few whose width has to be dug out of
+    # a subroutine; the rest get their bytecode sliced.
+    glyphSlices = {}
     for glyphName in charStrings.keys():
         cs, fdIndex = charStrings.getItemAndSelector(glyphName)
-        cs.decompile()
+        scanner = _T2WidthScanner(getLocalSubrs(fdIndex), globalSubrs)
+        scanner.execute(cs)
+        firstTokens = scanner.firstTokens
+        if (
+            scanner.hasWidth
+            and len(firstTokens) >= 2
+            and firstTokens[1][0] in ("callsubr", "callgsubr")
+        ):
+            cs.decompile()
+            continue
+        start = firstTokens[0][1] if scanner.hasWidth else 0
+        end = scanner.lastTokenIndex if scanner.lastToken == "endchar" else None
+        glyphSlices[glyphName] = (start, end)
 
     # Clean up subroutines first
     for subrs in [globalSubrs] + localSubrs:
@@ -74,49 +137,35 @@ def _convertCFFToCFF2(cff, otFont):
 
     # Clean up glyph charstrings
     removeUnusedSubrs = False
-    nominalWidthXError = _NominalWidthUsedError()
     for glyphName in charStrings.keys():
         cs, fdIndex = charStrings.getItemAndSelector(glyphName)
-        program = cs.program
 
-        thisLocalSubrs = (
-            localSubrs[fdIndex]
-            if fdIndex is not None
-            else (
-                getattr(topDict.Private, "Subrs", [])
-                if hasattr(topDict, "Private")
-                else []
-            )
-        )
+        if glyphName in glyphSlices:
+            start, end = glyphSlices[glyphName]
+            if cs.bytecode is not None:
+                cs.setBytecode(cs.bytecode[start:end])
+            else:
+                cs.program = cs.program[start:end]
+            continue
 
-        # Intentionally use custom type for nominalWidthX, such that any
-        # CharString that has an explicit width encoded will throw back to us.
-        extractor = T2WidthExtractor(
-            thisLocalSubrs,
-            globalSubrs,
-            nominalWidthXError,
-            0,
-        )
-        try:
-            extractor.execute(cs)
-        except _NominalWidthUsedError:
-            # Program has explicit width. We want to drop it, but can't
-            # just pop the first number since it may be a subroutine call.
-            # Instead, when seeing that, we embed the subroutine and recurse.
-            # If this ever happened, we later prune unused subroutines.
-            while len(program) >= 2 and program[1] in ["callsubr", "callgsubr"]:
-                removeUnusedSubrs = True
-                subrNumber = program.pop(0)
-                assert isinstance(subrNumber, int), subrNumber
-                op = program.pop(0)
-                bias = extractor.localBias if op == "callsubr" else extractor.globalBias
-                subrNumber += bias
-                subrSet = thisLocalSubrs if op == "callsubr" else globalSubrs
-                subrProgram = subrSet[subrNumber].program
-                program[:0] = subrProgram
-            # Now pop the actual width
-            assert len(program) >= 1, program
-            program.pop(0)
+        # Program has explicit width. We want to drop it, but can't
+        # just pop the first number since it may be a subroutine call.
+        # Instead, when seeing that, we embed the subroutine and recurse.
+        # If this ever happened, we later prune unused subroutines.
+        program = cs.program
+        thisLocalSubrs = getLocalSubrs(fdIndex)
+        while len(program) >= 2 and program[1] in ["callsubr", "callgsubr"]:
+            removeUnusedSubrs = True
+            subrNumber = program.pop(0)
+            assert isinstance(subrNumber, int), subrNumber
+            op = program.pop(0)
+            subrSet = thisLocalSubrs if op == "callsubr" else globalSubrs
+            subrNumber += calcSubrBias(subrSet)
+            subrProgram = subrSet[subrNumber].program
+            program[:0] = subrProgram
+        # Now pop the actual width
+        assert len(program) >= 1, program
+        program.pop(0)
 
         if program and program[-1] == "endchar":
             program.pop()
@@ -927,15 +927,13 @@ class FDSelect(object):
                 for i in range(nRanges):
                     first = readCard16(file)
                     if prev is not None:
-                        for glyphID in range(prev, first):
-                            gidArray[glyphID] = fd
+                        gidArray[prev:first] = [fd] * (first - prev)
                     prev = first
                     fd = readCard8(file)
                 if prev is not None:
                     first = readCard16(file)
-                    for glyphID in range(prev, first):
-                        gidArray[glyphID] = fd
-                self.gidArray = gidArray
+                    gidArray[prev:first] = [fd] * (first - prev)
+                self.gidArray = gidArray[:numGlyphs]
             elif self.format == 4:
                 gidArray = [None] * numGlyphs
                 nRanges = readCard32(file)
@@ -944,15 +942,13 @@ class FDSelect(object):
                 for i in range(nRanges):
                     first = readCard32(file)
                     if prev is not None:
-                        for glyphID in range(prev, first):
-                            gidArray[glyphID] = fd
+                        gidArray[prev:first] = [fd] * (first - prev)
                     prev = first
                     fd = readCard16(file)
                 if prev is not None:
                     first = readCard32(file)
-                    for glyphID in range(prev, first):
-                        gidArray[glyphID] = fd
-                self.gidArray = gidArray
+                    gidArray[prev:first] = [fd] * (first - prev)
+                self.gidArray = gidArray[:numGlyphs]
             else:
                 assert False, "unsupported FDSelect format: %s" % format
         else:
@@ -1505,8 +1501,10 @@ class CharsetCompiler(object):
     def __init__(self, strings, charset, parent):
         assert charset[0] == ".notdef"
         isCID = hasattr(parent.dictObj, "ROS")
-        data0 = packCharset0(charset, isCID, strings)
-        data = packCharset(charset, isCID, strings)
+        # Resolve the SIDs/CIDs once and pack both formats from them.
+        nameIDs = _getCharsetNameIDs(charset, isCID, strings)
+        data0 = _packCharset0(nameIDs)
+        data = _packCharset(nameIDs)
         if len(data) < len(data0):
             self.data = data
         else:
@@ -1553,66 +1551,66 @@ def getSIDfromName(name, strings):
     return strings.getSID(name)
 
 
-def packCharset0(charset, isCID, strings):
-    fmt = 0
-    data = [packCard8(fmt)]
+def _getCharsetNameIDs(charset, isCID, strings):
     if isCID:
         getNameID = getCIDfromName
     else:
         getNameID = getSIDfromName
+    return [getNameID(name, strings) for name in charset[1:]]
 
-    for name in charset[1:]:
-        data.append(packCard16(getNameID(name, strings)))
-    return bytesjoin(data)
+
+def _packCharset0(nameIDs):
+    fmt = 0
+    return packCard8(fmt) + struct.pack(">%dH" % len(nameIDs), *nameIDs)
 
 
-def packCharset(charset, isCID, strings):
+def _packCharset(nameIDs):
     fmt = 1
     ranges = []
     first = None
     end = 0
-    if isCID:
-        getNameID = getCIDfromName
-    else:
-        getNameID = getSIDfromName
 
-    for name in charset[1:]:
-        SID = getNameID(name, strings)
+    for SID in nameIDs:
         if first is None:
             first = SID
         elif end + 1 != SID:
             nLeft = end - first
             if nLeft > 255:
                 fmt = 2
-            ranges.append((first, nLeft))
+            ranges.append(first)
+            ranges.append(nLeft)
             first = SID
         end = SID
     if end:
         nLeft = end - first
         if nLeft > 255:
             fmt = 2
-        ranges.append((first, nLeft))
+        ranges.append(first)
+        ranges.append(nLeft)
 
-    data = [packCard8(fmt)]
     if fmt == 1:
-        nLeftFunc = packCard8
+        rangeFormat = "HB"
     else:
-        nLeftFunc = packCard16
-    for first, nLeft in ranges:
-        data.append(packCard16(first) + nLeftFunc(nLeft))
-    return bytesjoin(data)
+        rangeFormat = "HH"
+    return struct.pack(">B" + rangeFormat * (len(ranges) // 2), fmt, *ranges)
+
+
+def packCharset0(charset, isCID, strings):
+    return _packCharset0(_getCharsetNameIDs(charset, isCID, strings))
+
+
+def packCharset(charset, isCID, strings):
+    return _packCharset(_getCharsetNameIDs(charset, isCID, strings))
 
 
 def parseCharset0(numGlyphs, file, strings, isCID):
     charset = [".notdef"]
+    count = numGlyphs - 1
+    nameIDs = struct.unpack(">%dH" % count, file.read(2 * count)) if count > 0 else ()
     if isCID:
-        for i in range(numGlyphs - 1):
-            CID = readCard16(file)
-            charset.append("cid" + str(CID).zfill(5))
+        charset.extend("cid" + str(CID).zfill(5) for CID in nameIDs)
     else:
-        for i in range(numGlyphs - 1):
-            SID = readCard16(file)
-            charset.append(strings[SID])
+        charset.extend(strings[SID] for SID in nameIDs)
     return charset
 
 
@@ -1872,54 +1870,43 @@ class VarStoreConverter(SimpleConverter):
         return varStore
 
 
+def _getFDSelectRanges(fdSelectArray):
+    # Flat list of (firstGID, fdIndex) pairs, one per run of equal FD indices.
+    fdRanges = []
+    lastFDIndex = -1
+    for i, fdIndex in enumerate(fdSelectArray):
+        if lastFDIndex != fdIndex:
+            fdRanges.append(i)
+            fdRanges.append(fdIndex)
+            lastFDIndex = fdIndex
+    return fdRanges
+
+
 def packFDSelect0(fdSelectArray):
     fmt = 0
-    data = [packCard8(fmt)]
-    for index in fdSelectArray:
-        data.append(packCard8(index))
-    return bytesjoin(data)
+    return packCard8(fmt) + struct.pack(">%dB" % len(fdSelectArray), *fdSelectArray)
 
 
-def packFDSelect3(fdSelectArray):
+def packFDSelect3(fdSelectArray, fdRanges=None):
     fmt = 3
-    fdRanges = []
-    lenArray = len(fdSelectArray)
-    lastFDIndex = -1
-    for i in range(lenArray):
-        fdIndex = fdSelectArray[i]
-        if lastFDIndex != fdIndex:
-            fdRanges.append([i, fdIndex])
-            lastFDIndex = fdIndex
-    sentinelGID = i + 1
-
-    data = [packCard8(fmt)]
-    data.append(packCard16(len(fdRanges)))
-    for fdRange in fdRanges:
-        data.append(packCard16(fdRange[0]))
-        data.append(packCard8(fdRange[1]))
-    data.append(packCard16(sentinelGID))
-    return bytesjoin(data)
+    if fdRanges is None:
+        fdRanges = _getFDSelectRanges(fdSelectArray)
+    nRanges = len(fdRanges) // 2
+    sentinelGID = len(fdSelectArray)
+    return struct.pack(
+        ">BH" + "HB" * nRanges + "H", fmt, nRanges, *fdRanges, sentinelGID
+    )
 
 
-def packFDSelect4(fdSelectArray):
+def packFDSelect4(fdSelectArray, fdRanges=None):
     fmt = 4
-    fdRanges = []
-    lenArray = len(fdSelectArray)
-    lastFDIndex = -1
-    for i in range(lenArray):
-        fdIndex = fdSelectArray[i]
-        if lastFDIndex != fdIndex:
-            fdRanges.append([i, fdIndex])
-            lastFDIndex = fdIndex
-    sentinelGID = i + 1
-
-    data = [packCard8(fmt)]
-    data.append(packCard32(len(fdRanges)))
-    for fdRange in fdRanges:
-        data.append(packCard32(fdRange[0]))
-        data.append(packCard16(fdRange[1]))
-    data.append(packCard32(sentinelGID))
-    return bytesjoin(data)
+    if fdRanges is None:
+        fdRanges = _getFDSelectRanges(fdSelectArray)
+    nRanges = len(fdRanges) // 2
+    sentinelGID = len(fdSelectArray)
+    return struct.pack(
+        ">BL" + "LH" * nRanges + "L", fmt, nRanges, *fdRanges, sentinelGID
+    )
 
 
 class FDSelectCompiler(object):
@@ -1933,14 +1920,16 @@ class FDSelectCompiler(object):
         elif fmt == 4:
             self.data = packFDSelect4(fdSelectArray)
         else:
-            # choose smaller of the two formats
-            data0 = packFDSelect0(fdSelectArray)
-            data3 = packFDSelect3(fdSelectArray)
-            if len(data0) < len(data3):
-                self.data = data0
+            # choose smaller of the two formats; their sizes are known
+            # without packing anything
+            fdRanges = _getFDSelectRanges(fdSelectArray)
+            size0 = 1 + len(fdSelectArray)
+            size3 = 5 + 3 * (len(fdRanges) // 2)
+            if size0 < size3:
+                self.data = packFDSelect0(fdSelectArray)
                 fdSelect.format = 0
             else:
-                self.data = data3
+                self.data = packFDSelect3(fdSelectArray, fdRanges)
                 fdSelect.format = 3
 
         self.parent = parent
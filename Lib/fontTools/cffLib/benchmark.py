@@ -0,0 +1,113 @@
+"""Benchmark charset/FDSelect compilation and width optimization for a large
+CID-keyed font."""
+
+from fontTools.cffLib import (
+    FDSelect,
+    packCharset,
+    packCharset0,
+    packFDSelect0,
+    packFDSelect3,
+)
+from fontTools.cffLib.width import optimizeWidths, optimizeWidthsBruteforce
+from io import BytesIO
+import random
+import timeit
+
+NUM_GLYPHS = 65000
+NUM_FDS = 20
+
+
+def generate_charset():
+    # Mostly contiguous CIDs with a few gaps, like a Source Han font.
+    cids = sorted(random.sample(range(1, 65535), NUM_GLYPHS - 1))
+    return [".notdef"] + ["cid%05d" % cid for cid in cids]
+
+
+def generate_fdselect():
+    gidArray = []
+    while len(gidArray) < NUM_GLYPHS:
+        gidArray.extend([random.randrange(NUM_FDS)] * random.randint(1, 500))
+    return gidArray[:NUM_GLYPHS]
+
+
+def setup_packCharset():
+    return generate_charset(), True, None
+
+
+def setup_packCharset0():
+    return generate_charset(), True, None
+
+
+def setup_packFDSelect0():
+    return (generate_fdselect(),)
+
+
+def setup_packFDSelect3():
+    return (generate_fdselect(),)
+
+
+def parseFDSelect3(file, numGlyphs):
+    file.seek(0)
+    return FDSelect(file, numGlyphs)
+
+
+def setup_parseFDSelect3():
+    return BytesIO(packFDSelect3(generate_fdselect())), NUM_GLYPHS
+
+
+def generate_widths(numGlyphs, maxWidth):
+    return [random.randint(0, maxWidth) for _ in range(numGlyphs)]
+
+
+def setup_optimizeWidths():
+    return (generate_widths(NUM_GLYPHS, 3000),)
+
+
+def setup_optimizeWidths_wide():
+    # Few distinct widths spread over a large range.
+    distinct = generate_widths(500, 60000)
+    return ([random.choice(distinct) for _ in range(NUM_GLYPHS)],)
+
+
+def setup_optimizeWidths_small():
+    return (generate_widths(20, 300),)
+
+
+def setup_optimizeWidthsBruteforce_small():
+    return (generate_widths(20, 300),)
+
+
+def run_benchmark(function, setup_suffix="", repeat=5, number=10):
+    setup_func = "setup_" + function
+    if setup_suffix:
+        print("%s with %s:" % (function, setup_suffix), end="")
+        setup_func += "_" + setup_suffix
+    else:
+        print("%s:" % function, end="")
+
+    setup_func = globals()[setup_func]
+    args = setup_func()
+    function = globals()[function]
+
+    def wrapped():
+        return function(*args)
+
+    results = timeit.repeat(wrapped, repeat=repeat, number=number)
+    print("\t%5.2fms" % (min(results) * 1000.0 / number))
+
+
+def main():
+    run_benchmark("packCharset")
+    run_benchmark("packCharset0")
+    run_benchmark("packFDSelect0")
+    run_benchmark("packFDSelect3")
+    run_benchmark("parseFDSelect3")
+    run_benchmark("optimizeWidths")
+    run_benchmark("optimizeWidths", "wide")
+    run_benchmark("optimizeWidths", "small")
+    run_benchmark("optimizeWidthsBruteforce", "small", repeat=1, number=1)
+
+
+if __name__ == "__main__":
+    random.seed(1)
+    main()
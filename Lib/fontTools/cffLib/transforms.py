@@ -328,14 +328,20 @@ def _cs_drop_hints(charstring):
                 )
 
     if hints.has_hintmask:
-        i = 0
+        # Drop all hintmask/cntrmask operators with their mask bytes in a
+        # single pass, rather than deleting them from the list one by one.
         p = charstring.program
+        newProgram = []
+        i = 0
         while i < len(p):
-            if p[i] in ["hintmask", "cntrmask"]:
+            token = p[i]
+            if token == "hintmask" or token == "cntrmask":
                 assert i + 1 <= len(p)
-                del p[i : i + 2]
+                i += 2
                 continue
+            newProgram.append(token)
             i += 1
+        p[:] = newProgram
 
     assert len(charstring.program)
 
@@ -8,6 +8,7 @@ This module determines the optimum ``defaultWidthX`` and ``nominalWidthX``
 values for a font, when provided with a list of glyph widths."""
 
 from fontTools.ttLib import TTFont
+from bisect import bisect_left, bisect_right
 from collections import defaultdict
 from operator import add
 from functools import reduce
@@ -101,7 +102,16 @@ def optimizeWidths(widths):
     """Given a list of glyph widths, or dictionary mapping glyph width to number of
     glyphs having that, returns a tuple of best CFF default and nominal glyph widths.
 
-    This algorithm is linear in UPEM+numGlyphs."""
+    The byte cost of a nominal width choice only changes at a handful of
+    offsets around each distinct glyph width, so only those candidates are
+    evaluated, using prefix sums/maxima over the sorted widths.  This algorithm
+    is O(n log n) in the number of distinct widths, independent of UPEM.
+
+    >>> optimizeWidths([500, 500, 500, 600, 1000])
+    (500, 500)
+    >>> optimizeWidths({0: 10, 1000: 90, 1500: 1})
+    (1000, 0)
+    """
 
     if not hasattr(widths, "items"):
         d = defaultdict(int)
@@ -110,56 +120,65 @@ def optimizeWidths(widths):
         widths = d
 
     keys = sorted(widths.keys())
+    freqs = [widths[w] for w in keys]
     minw, maxw = keys[0], keys[-1]
-    domain = list(range(minw, maxw + 1))
-
-    # Cumulative sum/max forward/backward.
-    cumFrqU = cumSum(widths, op=add)
-    cumMaxU = cumSum(widths, op=max)
-    cumFrqD = cumSum(widths, op=add, decreasing=True)
-    cumMaxD = cumSum(widths, op=max, decreasing=True)
+    n = len(keys)
+
+    # Cumulative frequency, and cumulative max frequency forward/backward.
+    cumFrq = [0]
+    cumMaxU = [0]
+    for f in freqs:
+        cumFrq.append(cumFrq[-1] + f)
+        cumMaxU.append(max(cumMaxU[-1], f))
+    cumMaxD = [0]
+    for f in reversed(freqs):
+        cumMaxD.append(max(cumMaxD[-1], f))
+    cumMaxD.reverse()
+    total = cumFrq[-1]
+
+    def nomnCost(x):
+        # Cost per nominal choice, without default consideration: every width
+        # costs 5 bytes, minus 3 if within 1131 of nominal, minus 1 more if
+        # within 107.
+        near = cumFrq[bisect_right(keys, x + 107)] - cumFrq[bisect_left(keys, x - 107)]
+        mid = cumFrq[bisect_right(keys, x + 1131)] - cumFrq[bisect_left(keys, x - 1131)]
+        return total * 5 - mid * 3 - near
+
+    def dfltCost(x):
+        # Cost-saving per nominal choice, by best default choice.
+        return max(
+            cumMaxU[bisect_right(keys, x)],
+            cumMaxU[bisect_right(keys, x - 108)] * 2,
+            cumMaxU[bisect_right(keys, x - 1132)] * 5,
+            cumMaxD[bisect_left(keys, x)],
+            cumMaxD[bisect_left(keys, x + 108)] * 2,
+            cumMaxD[bisect_left(keys, x + 1132)] * 5,
+        )
 
-    # Cost per nominal choice, without default consideration.
-    nomnCostU = missingdict(
-        lambda x: cumFrqU[x] + cumFrqU[x - 108] + cumFrqU[x - 1132] * 3
-    )
-    nomnCostD = missingdict(
-        lambda x: cumFrqD[x] + cumFrqD[x + 108] + cumFrqD[x + 1132] * 3
-    )
-    nomnCost = missingdict(lambda x: nomnCostU[x] + nomnCostD[x] - widths[x])
+    # Both costs are piecewise-constant in the nominal width, and only change
+    # at these offsets from each glyph width.  Evaluating the left end of each
+    # piece finds the smallest best nominal.
+    candidates = {minw}
+    for w in keys:
+        for x in (w - 1131, w - 107, w, w + 1, w + 108, w + 1132):
+            if minw < x <= maxw:
+                candidates.add(x)
 
-    # Cost-saving per nominal choice, by best default choice.
-    dfltCostU = missingdict(
-        lambda x: max(cumMaxU[x], cumMaxU[x - 108] * 2, cumMaxU[x - 1132] * 5)
-    )
-    dfltCostD = missingdict(
-        lambda x: max(cumMaxD[x], cumMaxD[x + 108] * 2, cumMaxD[x + 1132] * 5)
-    )
-    dfltCost = missingdict(lambda x: max(dfltCostU[x], dfltCostD[x]))
+    # Best nominal.
+    nominal = min(sorted(candidates), key=lambda x: nomnCost(x) - dfltCost(x))
 
-    # Combined cost per nominal choice.
-    bestCost = missingdict(lambda x: nomnCost[x] - dfltCost[x])
+    # Work back the best default: the width whose encoding against the
+    # nominal costs the most bytes in total.
+    def saving(w):
+        diff = abs(w - nominal)
+        if diff <= 107:
+            return widths[w]
+        elif diff <= 1131:
+            return widths[w] * 2
+        else:
+            return widths[w] * 5
 
-    # Best nominal.
-    nominal = min(domain, key=lambda x: bestCost[x])
-
-    # Work back the best default.
-    bestC = bestCost[nominal]
-    dfltC = nomnCost[nominal] - bestCost[nominal]
-    ends = []
-    if dfltC == dfltCostU[nominal]:
-        starts = [nominal, nominal - 108, nominal - 1132]
-        for start in starts:
-            while cumMaxU[start] and cumMaxU[start] == cumMaxU[start - 1]:
-                start -= 1
-            ends.append(start)
-    else:
-        starts = [nominal, nominal + 108, nominal + 1132]
-        for start in starts:
-            while cumMaxD[start] and cumMaxD[start] == cumMaxD[start + 1]:
-                start += 1
-            ends.append(start)
-    default = min(ends, key=lambda default: byteCost(widths, default, nominal))
+    default = max(keys, key=saving)
 
     return default, nominal
 
@@ -7,6 +7,7 @@ from contextlib import closing
 from functools import partial
 
 import fontTools
+from fontTools.misc.cliTools import cpuCount
 from .ufo import font_to_quadratic, fonts_to_quadratic
 
 ufo_module = None
@@ -22,13 +23,6 @@ except ImportError:
 logger = logging.getLogger("fontTools.cu2qu")
 
 
-def _cpu_count():
-    try:
-        return mp.cpu_count()
-    except NotImplementedError:  # pragma: no cover
-        return 1
-
-
 def open_ufo(path):
     if hasattr(ufo_module.Font, "open"):  # ufoLib2
         return ufo_module.Font.open(path)
@@ -110,7 +104,7 @@ def _main(args=None):
         type=int,
         nargs="?",
         default=1,
-        const=_cpu_count(),
+        const=cpuCount(),
         metavar="N",
         help="Convert using N multiple processes (default: %(default)s)",
     )
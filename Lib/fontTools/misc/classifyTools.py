@@ -5,9 +5,19 @@
 class Classifier(object):
     """
     Main Classifier object, used to classify things into similar sets.
+
+    Things are classified by their signature: the list of the distinct sets
+    added so far that contain them.  Things with the same signature form a
+    class.  This refines the classes in time linear in the total size of the
+    distinct sets; adding a set again costs no more than hashing it.
     """
 
     def __init__(self, sort=True):
+        self._setIndices = {}  # map from distinct sets added to their index
+        self._firstAdded = []  # when each distinct set was first added
+        self._lastAdded = []  # when each distinct set was last added
+        self._count = 0  # number of non-empty sets added so far
+        self._signatures = {}  # map from things to the indices of their sets
         self._things = set()  # set of all things known so far
         self._sets = []  # list of class sets produced so far
         self._mapping = {}  # map from things to their class set
@@ -23,38 +33,26 @@ class Classifier(object):
 
         self._dirty = True
 
-        things, sets, mapping = self._things, self._sets, self._mapping
-
-        s = set(set_of_things)
-        intersection = s.intersection(things)  # existing things
-        s.difference_update(intersection)  # new things
-        difference = s
-        del s
-
-        # Add new class for new things
-        if difference:
-            things.update(difference)
-            sets.append(difference)
-            for thing in difference:
-                mapping[thing] = difference
-        del difference
-
-        while intersection:
-            # Take one item and process the old class it belongs to
-            old_class = mapping[next(iter(intersection))]
-            old_class_intersection = old_class.intersection(intersection)
+        count = self._count
+        self._count += 1
 
-            # Update old class to remove items from new set
-            old_class.difference_update(old_class_intersection)
-
-            # Remove processed items from todo list
-            intersection.difference_update(old_class_intersection)
-
-            # Add new class for the intersection with old class
-            sets.append(old_class_intersection)
-            for thing in old_class_intersection:
-                mapping[thing] = old_class_intersection
-            del old_class_intersection
+        s = frozenset(set_of_things)
+        index = self._setIndices.get(s)
+        if index is not None:
+            # Adding the same set again does not refine the classes.
+            self._lastAdded[index] = count
+            return
+        index = self._setIndices[s] = len(self._firstAdded)
+        self._firstAdded.append(count)
+        self._lastAdded.append(count)
+
+        signatures = self._signatures
+        for thing in s:
+            signature = signatures.get(thing)
+            if signature is None:
+                signatures[thing] = [index]
+            else:
+                signature.append(index)
 
     def update(self, list_of_sets):
         """
@@ -67,9 +65,28 @@ class Classifier(object):
         if not self._dirty:
             return
 
-        # Do any deferred processing
-        sets = self._sets
-        self._sets = [s for s in sets if s]
+        # Group things by signature.
+        classes = {}
+        for thing, signature in self._signatures.items():
+            key = tuple(signature)
+            s = classes.get(key)
+            if s is None:
+                classes[key] = {thing}
+            else:
+                s.add(thing)
+
+        # Order the classes as they would be identified adding the sets one
+        # by one: by when the last set containing them was added, with the
+        # class of things new to that set first.
+        firstAdded, lastAdded = self._firstAdded, self._lastAdded
+
+        def identified(key):
+            last = max(lastAdded[i] for i in key)
+            return last, len(key) > 1 or firstAdded[key[0]] != last
+
+        self._sets = [classes[key] for key in sorted(classes, key=identified)]
+        self._things = set(self._signatures)
+        self._mapping = {thing: s for s in self._sets for thing in s}
 
         if self._sort:
             self._sets = sorted(self._sets, key=lambda s: (-len(s), sorted(s)))
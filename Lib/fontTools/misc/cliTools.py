@@ -1,5 +1,6 @@
 """Collection of utilities for command-line interfaces and console scripts."""
 
+import multiprocessing
 import os
 import re
 
@@ -51,3 +52,14 @@ def makeOutputFileName(
             )
             n += 1
     return output
+
+
+def cpuCount():
+    """Returns the number of CPUs, to use as the default number of jobs.
+
+    Falls back to 1 if the number of CPUs cannot be determined.
+    """
+    try:
+        return multiprocessing.cpu_count()
+    except NotImplementedError:  # pragma: no cover
+        return 1
@@ -0,0 +1,104 @@
+# cython: language_level=3
+# distutils: define_macros=CYTHON_TRACE_NOGIL=1
+
+"""Minimum cost perfect matching in a bipartite graph, aka the linear sum
+assignment problem, solved with the Hungarian algorithm in O(n³).
+
+This is a pure-Python fallback for :func:`scipy.optimize.linear_sum_assignment`,
+optionally compiled with Cython. It finds the shortest augmenting path for
+one row at a time, as in the Jonker–Volgenant algorithm, keeping the dual
+potentials of rows and columns so that all reduced costs stay non-negative.
+"""
+
+try:
+    import cython
+except (AttributeError, ImportError):
+    # if cython not installed, use mock module with no-op decorators and types
+    from fontTools.misc import cython
+COMPILED = cython.compiled
+
+
+__all__ = ["linearSumAssignment"]
+
+
+@cython.locals(
+    n=cython.int,
+    i=cython.int,
+    i0=cython.int,
+    j=cython.int,
+    j0=cython.int,
+    j1=cython.int,
+    delta=cython.double,
+    cur=cython.double,
+    ui0=cython.double,
+)
+def linearSumAssignment(costMatrix):
+    """Return the column assigned to each row of a square cost matrix, so
+    that the sum of the costs of the assignment is minimal.
+
+    >>> linearSumAssignment([[4, 1, 3], [2, 0, 5], [3, 2, 2]])
+    [1, 0, 2]
+    >>> linearSumAssignment([])
+    []
+    """
+    n = len(costMatrix)
+    if any(len(row) != n for row in costMatrix):
+        raise ValueError("cost matrix is not square")
+    inf = float("inf")
+
+    # Row potentials u, column potentials v; 1-based, with column 0 acting
+    # as the root of the alternating tree. p[j] is the row matched to column
+    # j, and way[j] the previous column on the augmenting path to j.
+    u = [0.0] * (n + 1)
+    v = [0.0] * (n + 1)
+    p = [0] * (n + 1)
+    way = [0] * (n + 1)
+    for i in range(1, n + 1):
+        p[0] = i
+        j0 = 0
+        minv = [inf] * (n + 1)
+        used = [False] * (n + 1)
+        while True:
+            used[j0] = True
+            i0 = p[j0]
+            row = costMatrix[i0 - 1]
+            ui0 = u[i0]
+            delta = inf
+            j1 = 0
+            for j in range(1, n + 1):
+                if not used[j]:
+                    cur = row[j - 1] - ui0 - v[j]
+                    if cur < minv[j]:
+                        minv[j] = cur
+                        way[j] = j0
+                    if minv[j] < delta:
+                        delta = minv[j]
+                        j1 = j
+            if j1 == 0:
+                raise ValueError("cost matrix is infeasible")
+            for j in range(n + 1):
+                if used[j]:
+                    u[p[j]] += delta
+                    v[j] -= delta
+                else:
+                    minv[j] -= delta
+            j0 = j1
+            if p[j0] == 0:
+                break
+        # Augment the matching along the path found.
+        while j0:
+            j1 = way[j0]
+            p[j0] = p[j1]
+            j0 = j1
+
+    cols = [0] * n
+    for j in range(1, n + 1):
+        cols[p[j] - 1] = j - 1
+    return cols
+
+
+if __name__ == "__main__":
+    import sys
+    import doctest
+
+    sys.exit(doctest.testmod().failed)
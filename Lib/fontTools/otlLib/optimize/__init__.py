@@ -1,6 +1,7 @@
 from argparse import RawTextHelpFormatter
 from fontTools.otlLib.optimize.gpos import COMPRESSION_LEVEL, compact
 from fontTools.ttLib import TTFont
+from fontTools.misc.cliTools import cpuCount
 
 
 def main(args=None):
@@ -25,6 +26,16 @@ def main(args=None):
         choices=list(range(10)),
         type=int,
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        nargs="?",
+        default=1,
+        const=cpuCount(),
+        metavar="N",
+        help="Compact the lookups in N parallel processes (default: %(default)s)",
+    )
     logging_group = parser.add_mutually_exclusive_group(required=False)
     logging_group.add_argument(
         "-v", "--verbose", action="store_true", help="Run more verbosely."
@@ -39,7 +50,7 @@ def main(args=None):
     )
 
     font = TTFont(options.font)
-    compact(font, options.gpos_compression_level)
+    compact(font, options.gpos_compression_level, jobs=options.jobs)
     font.save(options.outfile or options.font)
 
 
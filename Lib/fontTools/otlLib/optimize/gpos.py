@@ -1,8 +1,10 @@
 import logging
+import multiprocessing as mp
 import os
 from collections import defaultdict, namedtuple
+from contextlib import closing
 from functools import reduce
-from itertools import chain
+from heapq import heapify, heappop, heappush
 from math import log2
 from typing import DefaultDict, Dict, Iterable, List, Sequence, Tuple
 
@@ -39,7 +41,12 @@ def _compression_level_from_env() -> int:
     raise ValueError(f"Bad {GPOS_COMPACT_MODE_ENV_KEY}={env_level}")
 
 
-def compact(font: TTFont, level: int) -> TTFont:
+def compact(font: TTFont, level: int, jobs: int = 1) -> TTFont:
+    """Compact the PairPos lookups of the font's GPOS table in place.
+
+    If ``jobs`` is greater than one, the lookups are compacted independently
+    in that many worker processes.
+    """
     # Ideal plan:
     #  1. Find lookups of Lookup Type 2: Pair Adjustment Positioning Subtable
     #     https://docs.microsoft.com/en-us/typography/opentype/spec/gpos#lookup-type-2-pair-adjustment-positioning-subtable
@@ -54,32 +61,86 @@ def compact(font: TTFont, level: int) -> TTFont:
     #     independently, so currently this step is:
     #     Split existing subtables into more smaller subtables
     gpos = font["GPOS"]
-    for lookup in gpos.table.LookupList.Lookup:
-        if lookup.LookupType == 2:
-            compact_lookup(font, level, lookup)
-        elif lookup.LookupType == 9 and lookup.SubTable[0].ExtensionLookupType == 2:
-            compact_ext_lookup(font, level, lookup)
+    lookups = [
+        lookup
+        for lookup in gpos.table.LookupList.Lookup
+        if lookup.LookupType == 2
+        or (lookup.LookupType == 9 and lookup.SubTable[0].ExtensionLookupType == 2)
+    ]
+    jobs = min(len(lookups), jobs)
+    if jobs > 1:
+        log.info("Running %d parallel processes", jobs)
+        for lookup in lookups:
+            # Don't send lazily loaded tables, which refer to the font.
+            lookup.ensureDecompiled(recurse=True)
+        pool = mp.Pool(
+            jobs,
+            initializer=_init_compact_worker,
+            initargs=(font.getGlyphOrder(), level),
+        )
+        with closing(pool):
+            new_subtables = pool.imap(
+                _compact_worker, [_pair_pos_subtables(l) for l in lookups]
+            )
+            for lookup, subtables in zip(lookups, new_subtables):
+                _set_pair_pos_subtables(lookup, subtables)
+    else:
+        for lookup in lookups:
+            if lookup.LookupType == 2:
+                compact_lookup(font, level, lookup)
+            else:
+                compact_ext_lookup(font, level, lookup)
     return font
 
 
+# The font and compression level of the worker processes of compact()
+_worker_font = None
+_worker_level = None
+
+
+def _init_compact_worker(glyphOrder: List[str], level: int) -> None:
+    global _worker_font, _worker_level
+    # Compaction only needs the glyph IDs from the font.
+    _worker_font = TTFont()
+    _worker_font.setGlyphOrder(glyphOrder)
+    _worker_level = level
+
+
+def _compact_worker(
+    subtables: Sequence[otTables.PairPos],
+) -> Sequence[otTables.PairPos]:
+    return compact_pair_pos(_worker_font, _worker_level, subtables)
+
+
+def _pair_pos_subtables(lookup: otTables.Lookup) -> List[otTables.PairPos]:
+    if lookup.LookupType == 9:
+        return [ext_subtable.ExtSubTable for ext_subtable in lookup.SubTable]
+    return lookup.SubTable
+
+
+def _set_pair_pos_subtables(
+    lookup: otTables.Lookup, subtables: Sequence[otTables.PairPos]
+) -> None:
+    if lookup.LookupType == 9:
+        new_ext_subtables = []
+        for subtable in subtables:
+            ext_subtable = otTables.ExtensionPos()
+            ext_subtable.Format = 1
+            ext_subtable.ExtSubTable = subtable
+            new_ext_subtables.append(ext_subtable)
+        subtables = new_ext_subtables
+    lookup.SubTable = subtables
+    lookup.SubTableCount = len(subtables)
+
+
 def compact_lookup(font: TTFont, level: int, lookup: otTables.Lookup) -> None:
     new_subtables = compact_pair_pos(font, level, lookup.SubTable)
-    lookup.SubTable = new_subtables
-    lookup.SubTableCount = len(new_subtables)
+    _set_pair_pos_subtables(lookup, new_subtables)
 
 
 def compact_ext_lookup(font: TTFont, level: int, lookup: otTables.Lookup) -> None:
-    new_subtables = compact_pair_pos(
-        font, level, [ext_subtable.ExtSubTable for ext_subtable in lookup.SubTable]
-    )
-    new_ext_subtables = []
-    for subtable in new_subtables:
-        ext_subtable = otTables.ExtensionPos()
-        ext_subtable.Format = 1
-        ext_subtable.ExtSubTable = subtable
-        new_ext_subtables.append(ext_subtable)
-    lookup.SubTable = new_ext_subtables
-    lookup.SubTableCount = len(new_ext_subtables)
+    new_subtables = compact_pair_pos(font, level, _pair_pos_subtables(lookup))
+    _set_pair_pos_subtables(lookup, new_subtables)
 
 
 def compact_pair_pos(
@@ -151,20 +212,13 @@ def _getClassRanges(glyphIDs: Iterable[int]):
 
 
 # Adapted from https://github.com/fonttools/fonttools/blob/f64f0b42f2d1163b2d85194e0979def539f5dca3/Lib/fontTools/ttLib/tables/otTables.py#L960-L989
-def _classDef_bytes(
-    class_data: List[Tuple[List[Tuple[int, int]], int, int]],
-    class_ids: List[int],
-    coverage=False,
-):
-    if not class_ids:
+def _classDef_bytes(glyphs_bitmask: int, range_count: int) -> int:
+    # The glyphs of the classes are given as a bitmask of glyph IDs, and
+    # range_count is the total number of ranges of the classes.
+    if not glyphs_bitmask:
         return 0
-    first_ranges, min_glyph_id, max_glyph_id = class_data[class_ids[0]]
-    range_count = len(first_ranges)
-    for i in class_ids[1:]:
-        data = class_data[i]
-        range_count += len(data[0])
-        min_glyph_id = min(min_glyph_id, data[1])
-        max_glyph_id = max(max_glyph_id, data[2])
+    min_glyph_id = (glyphs_bitmask & -glyphs_bitmask).bit_length() - 1
+    max_glyph_id = glyphs_bitmask.bit_length() - 1
     glyphCount = max_glyph_id - min_glyph_id + 1
     # https://docs.microsoft.com/en-us/typography/opentype/spec/chapter2#class-definition-table-format-1
     format1_bytes = 6 + glyphCount * 2
@@ -173,6 +227,10 @@ def _classDef_bytes(
     return min(format1_bytes, format2_bytes)
 
 
+def _glyphs_bitmask(glyphIDs: Iterable[int]) -> int:
+    return reduce(int.__or__, (1 << glyphID for glyphID in glyphIDs), 0)
+
+
 ClusteringContext = namedtuple(
     "ClusteringContext",
     [
@@ -182,6 +240,12 @@ ClusteringContext = namedtuple(
         "all_class2_data",
         "valueFormat1_bytes",
         "valueFormat2_bytes",
+        # Bitmasks of the glyph IDs of each class
+        "all_class1_glyphs",
+        "all_class2_glyphs",
+        # Bit planes of the range counts of the Class2 classes: bit k of the
+        # range count of class j is set iff bit j of class2_range_planes[k] is.
+        "class2_range_planes",
     ],
 )
 
@@ -189,7 +253,16 @@ ClusteringContext = namedtuple(
 class Cluster:
     # TODO(Python 3.7): Turn this into a dataclass
     # ctx: ClusteringContext
-    # indices: int
+    # indices_bitmask: int
+    # columns_bitmask: int
+    # Bitmasks of glyph IDs of the Coverage and of the ClassDef2, the number
+    # of glyphs and of ranges of the classes in the ClassDef1, and the index
+    # of its biggest class; all of these are cheaply combined on merge.
+    # coverage_glyphs: int
+    # class2_glyphs: int
+    # glyph_count: int
+    # range_count: int
+    # biggest_index: int
     # Caches
     # TODO(Python 3.8): use functools.cached_property instead of the
     # manually cached properties, and remove the cache fields listed below.
@@ -197,7 +270,19 @@ class Cluster:
     # _column_indices: Optional[List[int]] = None
     # _cost: Optional[int] = None
 
-    __slots__ = "ctx", "indices_bitmask", "_indices", "_column_indices", "_cost"
+    __slots__ = (
+        "ctx",
+        "indices_bitmask",
+        "columns_bitmask",
+        "coverage_glyphs",
+        "class2_glyphs",
+        "glyph_count",
+        "range_count",
+        "biggest_index",
+        "_indices",
+        "_column_indices",
+        "_cost",
+    )
 
     def __init__(self, ctx: ClusteringContext, indices_bitmask: int):
         self.ctx = ctx
@@ -205,6 +290,45 @@ class Cluster:
         self._indices = None
         self._column_indices = None
         self._cost = None
+        indices = self.indices
+        # Indices of columns that have a 1 in at least 1 line
+        #   => binary OR all the lines
+        self.columns_bitmask = reduce(int.__or__, (ctx.lines[i] for i in indices))
+        self.coverage_glyphs = reduce(
+            int.__or__, (ctx.all_class1_glyphs[i] for i in indices)
+        )
+        self.class2_glyphs = reduce(
+            int.__or__, (ctx.all_class2_glyphs[j] for j in self.column_indices)
+        )
+        self.glyph_count = sum(len(ctx.all_class1[i]) for i in indices)
+        self.range_count = sum(len(ctx.all_class1_data[i][0]) for i in indices)
+        # Going through all options takes too long, pick the biggest class
+        # = what happens in otlLib.builder.ClassDefBuilder.classes()
+        self.biggest_index = max(indices, key=lambda i: len(ctx.all_class1[i]))
+
+    def merge(self, other: "Cluster") -> "Cluster":
+        """Return the cluster of the lines of both clusters, which must
+        not have any line in common."""
+        ctx = self.ctx
+        merged = Cluster.__new__(Cluster)
+        merged.ctx = ctx
+        merged.indices_bitmask = self.indices_bitmask | other.indices_bitmask
+        merged.columns_bitmask = self.columns_bitmask | other.columns_bitmask
+        merged.coverage_glyphs = self.coverage_glyphs | other.coverage_glyphs
+        merged.class2_glyphs = self.class2_glyphs | other.class2_glyphs
+        merged.glyph_count = self.glyph_count + other.glyph_count
+        merged.range_count = self.range_count + other.range_count
+        # Same as max() over the indices in order: ties go to the lowest index
+        biggest, other_biggest = self.biggest_index, other.biggest_index
+        size = len(ctx.all_class1[biggest])
+        other_size = len(ctx.all_class1[other_biggest])
+        if other_size > size or (other_size == size and other_biggest < biggest):
+            biggest = other_biggest
+        merged.biggest_index = biggest
+        merged._indices = None
+        merged._column_indices = None
+        merged._cost = None
+        return merged
 
     @property
     def indices(self):
@@ -215,16 +339,13 @@ class Cluster:
     @property
     def column_indices(self):
         if self._column_indices is None:
-            # Indices of columns that have a 1 in at least 1 line
-            #   => binary OR all the lines
-            bitmask = reduce(int.__or__, (self.ctx.lines[i] for i in self.indices))
-            self._column_indices = bit_indices(bitmask)
+            self._column_indices = bit_indices(self.columns_bitmask)
         return self._column_indices
 
     @property
     def width(self):
         # Add 1 because Class2=0 cannot be used but needs to be encoded.
-        return len(self.column_indices) + 1
+        return bit_count(self.columns_bitmask) + 1
 
     @property
     def cost(self):
@@ -255,7 +376,7 @@ class Cluster:
                 + 2
                 # Class1Record	class1Records[class1Count]	Array of Class1 records, ordered by classes in classDef1.
                 + (self.ctx.valueFormat1_bytes + self.ctx.valueFormat2_bytes)
-                * len(self.indices)
+                * bit_count(self.indices_bitmask)
                 * self.width
             )
         return self._cost
@@ -268,17 +389,13 @@ class Cluster:
             # uint16	glyphCount	Number of glyphs in the glyph array
             4
             # uint16	glyphArray[glyphCount]	Array of glyph IDs — in numerical order
-            + sum(len(self.ctx.all_class1[i]) for i in self.indices) * 2
-        )
-        ranges = sorted(
-            chain.from_iterable(self.ctx.all_class1_data[i][0] for i in self.indices)
+            + self.glyph_count * 2
         )
-        merged_range_count = 0
-        last = None
-        for start, end in ranges:
-            if last is not None and start != last + 1:
-                merged_range_count += 1
-            last = end
+        # The classes are disjoint, so the ranges of the coverage are the
+        # runs of 1's in its glyphs bitmask, each starting with a 1 that
+        # has a 0 below it. Count the gaps between the merged ranges.
+        glyphs = self.coverage_glyphs
+        merged_range_count = bit_count(glyphs & ~(glyphs << 1)) - 1
         format2_bytes = (
             # From https://docs.microsoft.com/en-us/typography/opentype/spec/chapter2#coverage-format-2
             # uint16	coverageFormat	Format identifier — format = 2
@@ -297,17 +414,21 @@ class Cluster:
         # We can skip encoding one of the Class1 definitions, and use
         # Class1=0 to represent it instead, because Class1 is gated by the
         # Coverage definition. Use Class1=0 for the highest byte savings.
-        # Going through all options takes too long, pick the biggest class
-        # = what happens in otlLib.builder.ClassDefBuilder.classes()
-        biggest_index = max(self.indices, key=lambda i: len(self.ctx.all_class1[i]))
+        biggest_index = self.biggest_index
         return _classDef_bytes(
-            self.ctx.all_class1_data, [i for i in self.indices if i != biggest_index]
+            self.coverage_glyphs & ~self.ctx.all_class1_glyphs[biggest_index],
+            self.range_count - len(self.ctx.all_class1_data[biggest_index][0]),
         )
 
     @property
     def classDef2_bytes(self):
         # All Class2 need to be encoded because we can't use Class2=0
-        return _classDef_bytes(self.ctx.all_class2_data, self.column_indices)
+        columns = self.columns_bitmask
+        range_count = sum(
+            bit_count(columns & plane) << k
+            for k, plane in enumerate(self.ctx.class2_range_planes)
+        )
+        return _classDef_bytes(self.class2_glyphs, range_count)
 
 
 def cluster_pairs_by_class2_coverage_custom_cost(
@@ -334,13 +455,30 @@ def cluster_pairs_by_class2_coverage_custom_cost(
 
     # Map glyph names to ids and work with ints throughout for ClassDef formats
     name_to_id = font.getReverseGlyphMap()
-    # Each entry in the arrays below is (range_count, min_glyph_id, max_glyph_id)
+    # Each entry in the arrays below is (ranges, min_glyph_id, max_glyph_id)
     all_class1_data = [
         _getClassRanges(name_to_id[name] for name in cls) for cls in all_class1
     ]
     all_class2_data = [
         _getClassRanges(name_to_id[name] for name in cls) for cls in all_class2
     ]
+    all_class1_glyphs = [
+        _glyphs_bitmask(name_to_id[name] for name in cls) for cls in all_class1
+    ]
+    all_class2_glyphs = [
+        _glyphs_bitmask(name_to_id[name] for name in cls) for cls in all_class2
+    ]
+    class2_range_planes = []
+    for j, data in enumerate(all_class2_data):
+        range_count = len(data[0])
+        k = 0
+        while range_count:
+            if k == len(class2_range_planes):
+                class2_range_planes.append(0)
+            if range_count & 1:
+                class2_range_planes[k] |= 1 << j
+            range_count >>= 1
+            k += 1
 
     format1 = 0
     format2 = 0
@@ -357,50 +495,55 @@ def cluster_pairs_by_class2_coverage_custom_cost(
         all_class2_data,
         valueFormat1_bytes,
         valueFormat2_bytes,
+        all_class1_glyphs,
+        all_class2_glyphs,
+        class2_range_planes,
     )
 
-    cluster_cache: Dict[int, Cluster] = {}
-
-    def make_cluster(indices: int) -> Cluster:
-        cluster = cluster_cache.get(indices, None)
-        if cluster is not None:
-            return cluster
-        cluster = Cluster(ctx, indices)
-        cluster_cache[indices] = cluster
-        return cluster
-
-    def merge(cluster: Cluster, other: Cluster) -> Cluster:
-        return make_cluster(cluster.indices_bitmask | other.indices_bitmask)
-
     # Agglomerative clustering by hand, checking the cost gain of the new
     # cluster against the previously separate clusters
     # Start with 1 cluster per line
     # cluster = set of lines = new subtable
-    clusters = [make_cluster(1 << i) for i in range(len(lines))]
+    # Clusters are keyed by their lowest line index, which is kept on merge.
+    clusters = {i: Cluster(ctx, 1 << i) for i in range(len(lines))}
 
     # Cost of 1 cluster with everything
     # `(1 << len) - 1` gives a bitmask full of 1's of length `len`
-    cost_before_splitting = make_cluster((1 << len(lines)) - 1).cost
+    cost_before_splitting = Cluster(ctx, (1 << len(lines)) - 1).cost
+    cost_after_splitting = sum(c.cost for c in clusters.values())
     log.debug(f"        len(clusters) = {len(clusters)}")
 
+    # Heap of the cost changes of merging any two clusters, with the lowest
+    # line indices of the clusters to pick the same merge among equal ones as
+    # a scan of all pairs in order would. Merges involving a cluster that has
+    # since been merged into another are stale, and skipped when popped.
+    def merge_entry(i, cluster, j, other):
+        cost_change = cluster.merge(other).cost - cluster.cost - other.cost
+        return (
+            cost_change,
+            i,
+            j,
+            cluster.indices_bitmask,
+            other.indices_bitmask,
+        )
+
+    merges = [
+        merge_entry(i, clusters[i], j, clusters[j])
+        for i in range(len(lines))
+        for j in range(i + 1, len(lines))
+    ]
+    heapify(merges)
+
     while len(clusters) > 1:
-        lowest_cost_change = None
-        best_cluster_index = None
-        best_other_index = None
-        best_merged = None
-        for i, cluster in enumerate(clusters):
-            for j, other in enumerate(clusters[i + 1 :]):
-                merged = merge(cluster, other)
-                cost_change = merged.cost - cluster.cost - other.cost
-                if lowest_cost_change is None or cost_change < lowest_cost_change:
-                    lowest_cost_change = cost_change
-                    best_cluster_index = i
-                    best_other_index = i + 1 + j
-                    best_merged = merged
-        assert lowest_cost_change is not None
-        assert best_cluster_index is not None
-        assert best_other_index is not None
-        assert best_merged is not None
+        while True:
+            lowest_cost_change, i, j, bitmask, other_bitmask = heappop(merges)
+            if (
+                clusters.get(i) is not None
+                and clusters[i].indices_bitmask == bitmask
+                and clusters.get(j) is not None
+                and clusters[j].indices_bitmask == other_bitmask
+            ):
+                break
 
         # If the best merge we found is still taking down the file size, then
         # there's no question: we must do it, because it's beneficial in both
@@ -410,7 +553,6 @@ def cluster_pairs_by_class2_coverage_custom_cost(
         if lowest_cost_change > 0:
             # Stop critera: check whether we should keep merging.
             # Compute size reduction brought by splitting
-            cost_after_splitting = sum(c.cost for c in clusters)
             # size_reduction so that after = before * (1 - size_reduction)
             # E.g. before = 1000, after = 800, 1 - 800/1000 = 0.2
             size_reduction = 1 - cost_after_splitting / cost_before_splitting
@@ -436,15 +578,21 @@ def cluster_pairs_by_class2_coverage_custom_cost(
                 break
 
         # No reason to stop yet, do the merge and move on to the next.
-        del clusters[best_other_index]
-        clusters[best_cluster_index] = best_merged
+        merged = clusters[i].merge(clusters.pop(j))
+        clusters[i] = merged
+        cost_after_splitting += lowest_cost_change
+        for k, other in clusters.items():
+            if k < i:
+                heappush(merges, merge_entry(k, other, i, merged))
+            elif k > i:
+                heappush(merges, merge_entry(i, merged, k, other))
 
     # All clusters are final; turn bitmasks back into the "Pairs" format
     pairs_by_class1: Dict[Tuple[str, ...], Pairs] = defaultdict(dict)
     for pair, values in pairs.items():
         pairs_by_class1[pair[0]][pair] = values
     pairs_groups: List[Pairs] = []
-    for cluster in clusters:
+    for _, cluster in sorted(clusters.items()):
         pairs_group: Pairs = dict()
         for i in cluster.indices:
             class1 = all_class1[i]
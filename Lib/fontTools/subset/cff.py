@@ -143,7 +143,8 @@ def prune_post_subset(self, ttfFont, options):
         if hasattr(font, "FDSelect"):
             sel = font.FDSelect
             indices = _uniq_sort(sel.gidArray)
-            sel.gidArray = [indices.index(ss) for ss in sel.gidArray]
+            newIndices = {ss: i for i, ss in enumerate(indices)}
+            sel.gidArray = [newIndices[ss] for ss in sel.gidArray]
             arr = font.FDArray
             arr.items = [arr[i] for i in indices]
             del arr.file, arr.offsets
@@ -37,10 +37,19 @@ log = logging.getLogger(__name__)
 
 
 class TupleVariation(object):
+    # See compileDeltas.
+    _compiledDeltas = None
+
     def __init__(self, axes, coordinates):
         self.axes = axes.copy()
         self.coordinates = list(coordinates)
 
+    def __getstate__(self):
+        # The compiled deltas cache is not copied or pickled.
+        state = self.__dict__.copy()
+        state.pop("_compiledDeltas", None)
+        return state
+
     def __repr__(self):
         axes = ",".join(
             sorted(["%s=%s" % (name, value) for (name, value) in self.axes.items()])
@@ -324,7 +333,49 @@ class TupleVariation(object):
             )
         return (result, pos)
 
+    def getCompiledSize(
+        self, axisTags, sharedCoordIndices={}, pointData=None, *, optimizeSize=True
+    ):
+        """Return len(tupleData) + len(auxData) for the result of compile()
+        with the same arguments, without assembling the compiled data.
+
+        The compiled deltas are cached, so that compiling the variation
+        afterwards does not encode the deltas a second time.
+        """
+        if pointData is None:
+            usedPoints = self.getUsedPoints()
+            if usedPoints is None:  # Nothing to encode
+                return 0
+            pointData = self.compilePoints(usedPoints)
+
+        flags = 0
+        if not sharedCoordIndices or (
+            self.compileCoord(axisTags) not in sharedCoordIndices
+        ):
+            flags |= EMBEDDED_PEAK_TUPLE
+        if self.compileIntermediateCoord(axisTags) is not None:
+            flags |= INTERMEDIATE_REGION
+        return (
+            self.getTupleSize_(flags, len(axisTags))
+            + len(pointData)
+            + len(self.compileDeltas(optimizeSize=optimizeSize))
+        )
+
     def compileDeltas(self, optimizeSize=True):
+        # Deltas are often compiled more than once, e.g. to pick the smaller
+        # of two candidate variations and again when the table is compiled.
+        # The cache holds a copy of the coordinates it was computed from, so
+        # it can never go stale if self.coordinates is modified in place; it
+        # is dropped once the variation is compiled into its table, see
+        # compileTupleVariationStore.
+        cache = self._compiledDeltas
+        if (
+            cache is not None
+            and cache[0] == optimizeSize
+            and cache[1] == self.coordinates
+        ):
+            return cache[2]
+
         deltaX = []
         deltaY = []
         if self.getCoordWidth() == 2:
@@ -341,7 +392,9 @@ class TupleVariation(object):
         bytearr = bytearray()
         self.compileDeltaValues_(deltaX, bytearr, optimizeSize=optimizeSize)
         self.compileDeltaValues_(deltaY, bytearr, optimizeSize=optimizeSize)
-        return bytearr
+        data = bytes(bytearr)
+        self._compiledDeltas = (optimizeSize, list(self.coordinates), data)
+        return data
 
     @staticmethod
     def compileDeltaValues_(deltas, bytearr=None, *, optimizeSize=True):
@@ -617,14 +670,27 @@ class TupleVariation(object):
                 )
             self.coordinates = iup_delta(self.coordinates, origCoords, endPts)
 
-    def optimize(self, origCoords, endPts, tolerance=0.5, isComposite=False):
+    def optimize(
+        self,
+        origCoords,
+        endPts,
+        tolerance=0.5,
+        isComposite=False,
+        fast=False,
+        geometry=None,
+    ):
         from fontTools.varLib.iup import iup_delta_optimize
 
         if None in self.coordinates:
             return  # already optimized
 
         deltaOpt = iup_delta_optimize(
-            self.coordinates, origCoords, endPts, tolerance=tolerance
+            self.coordinates,
+            origCoords,
+            endPts,
+            tolerance=tolerance,
+            fast=fast,
+            geometry=geometry,
         )
         if None in deltaOpt:
             if isComposite and all(d is None for d in deltaOpt):
@@ -636,13 +702,12 @@ class TupleVariation(object):
 
             # Shouldn't matter that this is different from fvar...?
             axisTags = sorted(self.axes.keys())
-            tupleData, auxData = self.compile(axisTags)
-            unoptimizedLength = len(tupleData) + len(auxData)
-            tupleData, auxData = varOpt.compile(axisTags)
-            optimizedLength = len(tupleData) + len(auxData)
+            unoptimizedLength = self.getCompiledSize(axisTags)
+            optimizedLength = varOpt.getCompiledSize(axisTags)
 
             if optimizedLength < unoptimizedLength:
                 self.coordinates = varOpt.coordinates
+                self._compiledDeltas = varOpt._compiledDeltas
 
     def __imul__(self, scalar):
         self.scaleDeltas(scalar)
@@ -775,6 +840,8 @@ def compileTupleVariationStore(
 
         tuples.append(thisTuple)
         data.append(thisData)
+        # Don't keep the compiled deltas of every variation of the font.
+        v._compiledDeltas = None
 
     tuples = b"".join(tuples)
     data = b"".join(data)
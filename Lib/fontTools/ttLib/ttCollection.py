@@ -1,12 +1,20 @@
 from fontTools.ttLib.ttFont import TTFont
 from fontTools.ttLib.sfnt import readTTCHeader, writeTTCHeader
 from io import BytesIO
+from copy import copy
 import struct
 import logging
 
 log = logging.getLogger(__name__)
 
 
+def _getCharStringBytecode(charString, isCFF2):
+    if charString.bytecode is None:
+        charString = copy(charString)
+        charString.compile(isCFF2=isCFF2)
+    return charString.bytecode
+
+
 class TTCollection(object):
     """Object representing a TrueType Collection / OpenType Collection.
     The main API is self.fonts being a list of TTFont instances.
@@ -85,6 +93,59 @@ class TTCollection(object):
             final.write(file.getvalue())
         file.close()
 
+    def getSharingReport(self):
+        """Return how many bytes sharing data between the member fonts saves,
+        or could save, as a dict mapping a key to a ``(totalSize, uniqueSize)``
+        tuple, ``totalSize - uniqueSize`` being the potential saving.
+
+        Table tags report whole-table sharing, which is what :meth:`save`
+        does with ``shareTables=True``. For CFF and CFF2 tables, the
+        ``"<tag>.CharStrings"`` and ``"<tag>.GlobalSubrs"`` keys additionally
+        report charstrings and global subroutines duplicated between members
+        whose tables differ. These cannot be shared by the OpenType format,
+        but hint at how much unifying those tables would save.
+
+        Data is deduplicated by hashing, so this scales to large collections.
+        """
+        report = {}
+
+        def account(key, items, seen):
+            # Only count data as duplicate if an earlier member has it.
+            total, unique = report.get(key, (0, 0))
+            added = set()
+            for data in items:
+                total += len(data)
+                if data not in seen:
+                    added.add(data)
+                    unique += len(data)
+            seen.update(added)
+            report[key] = (total, unique)
+
+        seenData = {}
+        for font in self.fonts:
+            for tag in font.keys():
+                if tag == "GlyphOrder":
+                    continue
+                data = font.getTableData(tag)
+                seen = seenData.setdefault(tag, set())
+                isNew = data not in seen
+                account(tag, [data], seen)
+                if tag not in ("CFF ", "CFF2") or not isNew:
+                    continue
+                cff = font[tag].cff
+                isCFF2 = tag == "CFF2"
+                charStrings = cff.topDictIndex[0].CharStrings
+                for key, charStringList in (
+                    (tag + ".CharStrings", charStrings.values()),
+                    (tag + ".GlobalSubrs", cff.GlobalSubrs),
+                ):
+                    account(
+                        key,
+                        [_getCharStringBytecode(cs, isCFF2) for cs in charStringList],
+                        seenData.setdefault(key, set()),
+                    )
+        return report
+
     def saveXML(self, fileOrPath, newlinestr="\n", writeVersion=True, **kwargs):
         from fontTools.misc import xmlWriter
 
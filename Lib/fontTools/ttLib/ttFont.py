@@ -772,6 +772,11 @@ class TTFont(object):
         If the ``normalized`` variable is set to True, that location is
         interpreted as in the normalized (-1..+1) space, otherwise it is in the
         font's defined axes space.
+
+        The ``glyf`` glyph-sets of a variable font share a
+        :class:`fontTools.ttLib.ttGlyphSet.GvarInterpolator`, which keeps the
+        inferred deltas of the glyphs, so that drawing them at many locations
+        is fast.
         """
         if location and "fvar" not in self:
             location = None
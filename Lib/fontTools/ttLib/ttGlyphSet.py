@@ -1,9 +1,13 @@
 """GlyphSets returned by a TTFont."""
 
 from abc import ABC, abstractmethod
+from array import array
+from collections import OrderedDict
 from collections.abc import Mapping
 from contextlib import contextmanager
 from copy import copy, deepcopy
+from itertools import repeat
+from operator import add, mul
 from types import SimpleNamespace
 from fontTools.misc.vector import Vector
 from fontTools.misc.fixedTools import otRound, fixedToFloat as fi2fl
@@ -99,15 +103,36 @@ class _TTGlyphSetGlyf(_TTGlyphSet):
         self.glyfTable = font["glyf"]
         super().__init__(font, location, self.glyfTable, recalcBounds=recalcBounds)
         self.gvarTable = font.get("gvar")
+        self.gvarInterpolator = None
+        if self.gvarTable is not None:
+            self.gvarInterpolator = _getGvarInterpolator(font)
+        self._supportScalars = OrderedDict()
 
     def __getitem__(self, glyphName):
         return _TTGlyphGlyf(self, glyphName, recalcBounds=self.recalcBounds)
 
+    def _getSupportScalars(self):
+        # Return a dict caching the scalars of 'gvar' tuple supports at the
+        # current location; glyphs share most of their supports. The dicts of
+        # recently used locations are kept, since the location changes back
+        # and forth when drawing variable components.
+        key = tuple(sorted((k, v) for k, v in self.location.items() if v != 0))
+        cache = self._supportScalars
+        scalars = cache.get(key)
+        if scalars is None:
+            scalars = cache[key] = {}
+            if len(cache) > 64:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        return scalars
+
 
 class _TTGlyphSetCFF(_TTGlyphSet):
     def __init__(self, font, location):
         tableTag = "CFF2" if "CFF2" in font else "CFF "
         self.charStrings = list(font[tableTag].cff.values())[0].CharStrings
+        self.blendInstancer = None
         super().__init__(font, location, self.charStrings)
         self.setLocation(location)
 
@@ -117,18 +142,18 @@ class _TTGlyphSetCFF(_TTGlyphSet):
     def setLocation(self, location):
         self.blender = None
         if location:
-            # TODO Optimize by using instancer.setLocation()
-
-            from fontTools.varLib.varStore import VarStoreInstancer
-
             varStore = getattr(self.charStrings, "varStore", None)
             if varStore is not None:
-                instancer = VarStoreInstancer(
-                    varStore.otVarStore, self.font["fvar"].axes, location
-                )
+                instancer = self.blendInstancer
+                if instancer is None:
+                    from fontTools.varLib.varStore import VarStoreInstancer
+
+                    instancer = self.blendInstancer = VarStoreInstancer(
+                        varStore.otVarStore, self.font["fvar"].axes, location
+                    )
+                elif instancer.location != location:
+                    instancer.setLocation(location)
                 self.blender = instancer.interpolateFromDeltas
-        else:
-            self.blender = None
 
     @contextmanager
     def pushLocation(self, location, reset: bool):
@@ -232,35 +257,15 @@ class _TTGlyphGlyf(_TTGlyph):
         return glyph, offset
 
     def _getGlyphInstance(self):
-        from fontTools.varLib.iup import iup_delta
-        from fontTools.ttLib.tables._g_l_y_f import GlyphCoordinates
-        from fontTools.varLib.models import supportScalar
-
         glyphSet = self.glyphSet
         glyfTable = glyphSet.glyfTable
-        variations = glyphSet.gvarTable.variations[self.name]
-        hMetrics = glyphSet.hMetrics
-        vMetrics = glyphSet.vMetrics
-        coordinates, _ = glyfTable._getCoordinatesAndControls(
-            self.name, hMetrics, vMetrics
+        coordinates = glyphSet.gvarInterpolator.getCoordinates(
+            self.name,
+            glyphSet.location,
+            hMetrics=glyphSet.hMetrics,
+            vMetrics=glyphSet.vMetrics,
+            supportScalars=glyphSet._getSupportScalars(),
         )
-        origCoords, endPts = None, None
-        for var in variations:
-            scalar = supportScalar(glyphSet.location, var.axes)
-            if not scalar:
-                continue
-            delta = var.coordinates
-            if None in delta:
-                if origCoords is None:
-                    origCoords, control = glyfTable._getCoordinatesAndControls(
-                        self.name, hMetrics, vMetrics
-                    )
-                    endPts = (
-                        control[1] if control[0] >= 1 else list(range(len(control[1])))
-                    )
-                delta = iup_delta(delta, origCoords, endPts)
-            coordinates += GlyphCoordinates(delta) * scalar
-
         glyph = copy(glyfTable[self.name])  # Shallow copy
         width, lsb, height, tsb = _setCoordinates(
             glyph, coordinates, glyfTable, recalcBounds=self.recalcBounds
@@ -441,6 +446,140 @@ def _setCoordinates(glyph, coord, glyfTable, *, recalcBounds=True):
     )
 
 
+class GvarInterpolator:
+    """Compute the coordinates of the glyphs of a TrueType variable font at
+    normalized locations.
+
+    The first time a glyph is interpolated, its default coordinates are
+    rounded and kept, together with the deltas of each of its 'gvar' tuple
+    variations, inferred (IUP) for all the points of the glyph; every
+    location then only costs a sum of those deltas, weighted by the scalars
+    of the tuple supports. This makes drawing the same glyphs at many
+    locations, e.g. for proofing, much faster.
+
+    The glyph sets returned by ``TTFont.getGlyphSet(location=...)`` share
+    one interpolator per font, as their ``gvarInterpolator`` attribute.
+
+    What is kept for a glyph is computed anew when its coordinates, component
+    offsets or phantom points change, or when its tuple variations, or their
+    ``coordinates`` lists, are replaced by other objects; modifying the
+    deltas of a ``TupleVariation`` in place is not noticed.
+    """
+
+    def __init__(self, font):
+        self.font = font
+        self.glyfTable = font["glyf"]
+        self.gvarTable = font["gvar"]
+        self._glyphs = {}
+
+    def getCoordinates(
+        self, glyphName, location, *, hMetrics=None, vMetrics=None, supportScalars=None
+    ):
+        """Return the GlyphCoordinates of ``glyphName`` at the normalized
+        ``location``, followed by its four phantom points, like
+        ``glyf._getCoordinatesAndControls()``.
+
+        The metrics default to those of the ``hmtx`` and ``vmtx`` tables of
+        the font. ``supportScalars`` is an optional dict caching the scalars
+        of tuple supports at ``location``; glyphs share most of them.
+        """
+        from fontTools.varLib.models import supportScalar
+
+        font = self.font
+        if hMetrics is None:
+            hMetrics = font["hmtx"].metrics
+        if vMetrics is None:
+            vMetrics = getattr(font.get("vmtx"), "metrics", None)
+        if supportScalars is None:
+            supportScalars = {}
+        glyph = self._getGlyph(glyphName, hMetrics, vMetrics)
+        coordinates = glyph.coordinates.copy()
+        a = coordinates.array
+        for var, delta in glyph.deltas:
+            supportKey = tuple(var.axes.items())
+            scalar = supportScalars.get(supportKey)
+            if scalar is None:
+                scalar = supportScalars[supportKey] = supportScalar(location, var.axes)
+            if not scalar:
+                continue
+            if scalar != 1:
+                delta = map(mul, delta, repeat(scalar))
+            a[:] = array("d", map(add, a, delta))
+        return coordinates
+
+    def _getGlyph(self, glyphName, hMetrics, vMetrics):
+        # Return a namespace with the default coordinates of the glyph, and a
+        # list of (TupleVariation, deltas) tuples, with the deltas of all
+        # points flattened, checking first that they are still up to date.
+        from fontTools.varLib.iup import iup_delta
+        from fontTools.ttLib.tables._g_l_y_f import GlyphCoordinates
+
+        glyfTable = self.glyfTable
+        glyph = glyfTable[glyphName]
+        if glyph.isComposite():
+            source = [
+                (getattr(c, "x", 0), getattr(c, "y", 0)) for c in glyph.components
+            ]
+        elif glyph.numberOfContours > 0:
+            source = glyph.coordinates.array
+        else:
+            source = None
+        phantomPoints = glyfTable._getPhantomPoints(glyphName, hMetrics, vMetrics)
+        cached = self._glyphs.get(glyphName)
+        if (
+            cached is None
+            or cached.glyph is not glyph
+            or cached.source != source
+            or cached.phantomPoints != phantomPoints
+        ):
+            coordinates, control = glyfTable._getCoordinatesAndControls(
+                glyphName, hMetrics, vMetrics
+            )
+            endPts = control[1] if control[0] >= 1 else list(range(len(control[1])))
+            cached = self._glyphs[glyphName] = SimpleNamespace(
+                glyph=glyph,
+                source=copy(source),
+                phantomPoints=phantomPoints,
+                coordinates=coordinates,
+                endPts=endPts,
+                variations=None,
+                deltas=None,
+            )
+
+        variations = [
+            (var, var.coordinates)
+            for var in self.gvarTable.variations.get(glyphName, [])
+        ]
+        if (
+            cached.variations is None
+            or len(cached.variations) != len(variations)
+            or any(
+                var is not v or delta is not d
+                for (var, delta), (v, d) in zip(variations, cached.variations)
+            )
+        ):
+            cached.deltas = []
+            for var, delta in variations:
+                if None in delta:
+                    delta = iup_delta(delta, cached.coordinates, cached.endPts)
+                cached.deltas.append((var, GlyphCoordinates(delta).array))
+            cached.variations = variations
+        return cached
+
+
+def _getGvarInterpolator(font):
+    # Return the GvarInterpolator shared by the glyph sets of the font, making
+    # a new one if the 'glyf' or 'gvar' tables were replaced.
+    interpolator = getattr(font, "_gvarInterpolator", None)
+    if (
+        interpolator is None
+        or interpolator.glyfTable is not font["glyf"]
+        or interpolator.gvarTable is not font["gvar"]
+    ):
+        interpolator = font._gvarInterpolator = GvarInterpolator(font)
+    return interpolator
+
+
 class LerpGlyphSet(Mapping):
     """A glyphset that interpolates between two other glyphsets.
 
@@ -26,8 +26,9 @@ API *will* change in near future.
 from typing import List
 from fontTools.misc.vector import Vector
 from fontTools.misc.roundTools import noRound, otRound
-from fontTools.misc.fixedTools import floatToFixed as fl2fi
+from fontTools.misc.fixedTools import floatToFixed as fl2fi, floatToFixedToFloat
 from fontTools.misc.textTools import Tag, tostr
+from fontTools.misc.cliTools import cpuCount
 from fontTools.ttLib import TTFont, newTable
 from fontTools.ttLib.tables._f_v_a_r import Axis, NamedInstance
 from fontTools.ttLib.tables._g_l_y_f import GlyphCoordinates, dropImpliedOnCurvePoints
@@ -38,7 +39,7 @@ from fontTools.ttLib.tables.otBase import OTTableWriter
 from fontTools.varLib import builder, models, varStore
 from fontTools.varLib.merger import VariationMerger, COLRVariationMerger
 from fontTools.varLib.mvar import MVAR_ENTRIES
-from fontTools.varLib.iup import iup_delta_optimize
+from fontTools.varLib.iup import IUPGeometry, iup_delta, iup_delta_optimize
 from fontTools.varLib.featureVars import addFeatureVariations
 from fontTools.designspaceLib import DesignSpaceDocument, InstanceDescriptor
 from fontTools.designspaceLib.split import splitInterpolable, splitVariableFonts
@@ -47,6 +48,10 @@ from fontTools.colorLib.builder import buildColrV1
 from fontTools.colorLib.unbuilder import unbuildColrV1
 from functools import partial
 from collections import OrderedDict, defaultdict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from io import BytesIO
+import multiprocessing as mp
 import os.path
 import logging
 from copy import deepcopy
@@ -306,7 +311,17 @@ def _add_stat(font):
 _MasterData = namedtuple("_MasterData", ["glyf", "hMetrics", "vMetrics"])
 
 
-def _add_gvar(font, masterModel, master_ttfs, tolerance=0.5, optimize=True):
+def _add_gvar(
+    font,
+    masterModel,
+    master_ttfs,
+    tolerance=0.5,
+    optimize=True,
+    jobs=1,
+    previous_vf=None,
+    changed_glyphs=None,
+    fast_iup=False,
+):
     if tolerance < 0:
         raise ValueError("`tolerance` must be a positive number.")
 
@@ -323,69 +338,249 @@ def _add_gvar(font, masterModel, master_ttfs, tolerance=0.5, optimize=True):
         for m in master_ttfs
     ]
 
-    for glyph in font.getGlyphOrder():
-        log.debug("building gvar for glyph '%s'", glyph)
+    glyphOrder = font.getGlyphOrder()
+    reused = {}
+    if previous_vf is not None and "gvar" in previous_vf:
+        reused = _get_reusable_gvar_variations(
+            previous_vf["gvar"],
+            glyphOrder,
+            master_datas,
+            masterModel,
+            defaultMasterIndex,
+            tolerance,
+            optimize,
+            changed_glyphs,
+        )
+        log.info("Reusing 'gvar' variations of %d glyphs", len(reused))
+        allGlyphOrder = glyphOrder
+        glyphOrder = [glyph for glyph in glyphOrder if glyph not in reused]
+
+    allGlyphData = (
+        (glyph, _get_gvar_glyph_data(glyph, master_datas, defaultMasterIndex))
+        for glyph in glyphOrder
+    )
+
+    if jobs > 1:
+        # The master model is shipped once to each worker process; only the
+        # per-glyph master coordinates and the resulting variations are sent
+        # back and forth.
+        log.info("Running %d parallel processes", jobs)
+        pool = mp.Pool(
+            jobs,
+            initializer=_init_gvar_worker,
+            initargs=(masterModel, tolerance, optimize, fast_iup),
+        )
+        chunksize = max(1, min(64, len(glyphOrder) // (jobs * 4)))
+        with closing(pool):
+            allVariations = pool.imap(
+                _gvar_worker_compute_variations, allGlyphData, chunksize
+            )
+            _set_gvar_variations(gvar, glyphOrder, allVariations)
+    else:
+        allVariations = (
+            _compute_gvar_variations(
+                glyph, allData, masterModel, tolerance, optimize, fast_iup
+            )
+            for glyph, allData in allGlyphData
+        )
+        _set_gvar_variations(gvar, glyphOrder, allVariations)
+
+    if reused:
+        variations = gvar.variations
+        variations.update(reused)
+        gvar.variations = {
+            glyph: variations[glyph] for glyph in allGlyphOrder if glyph in variations
+        }
+
+
+def _tuple_variation_key(axes):
+    # Regions read from a binary font are rounded to F2Dot14.
+    return tuple(
+        sorted(
+            (tag, tuple(floatToFixedToFloat(v, 14) for v in region))
+            for tag, region in axes.items()
+        )
+    )
+
+
+def _get_reusable_gvar_variations(
+    previous_gvar,
+    glyphOrder,
+    master_datas,
+    masterModel,
+    defaultMasterIndex,
+    tolerance,
+    optimize,
+    changed_glyphs,
+):
+    """Return a dict of copies of the variations in previous_gvar that can be
+    kept as they are for the glyphs in glyphOrder.
+
+    If changed_glyphs is given, the variations of all other glyphs are reused
+    as long as they are for regions of the current masters. Otherwise they
+    are only reused if they still reproduce the masters' deltas within
+    tolerance, just like a rebuild with IUP optimization would."""
+    previous = previous_gvar.variations
+    reused = {}
+    for glyph in glyphOrder:
+        if glyph not in previous:
+            continue
+        if changed_glyphs is not None and glyph in changed_glyphs:
+            continue
+        variations = previous[glyph]
+        allData = _get_gvar_glyph_data(glyph, master_datas, defaultMasterIndex)
+        if changed_glyphs is not None:
+            supports = masterModel.getSubModel(allData)[0].supports
+            supportKeys = {_tuple_variation_key(support) for support in supports}
+            if not all(_tuple_variation_key(v.axes) in supportKeys for v in variations):
+                continue
+        elif not _gvar_variations_match(
+            variations, allData, masterModel, tolerance, optimize
+        ):
+            continue
+        reused[glyph] = [
+            TupleVariation(dict(v.axes), list(v.coordinates)) for v in variations
+        ]
+    return reused
+
+
+def _gvar_variations_match(variations, allData, masterModel, tolerance, optimize):
+    """Return whether the TupleVariations of a glyph encode the deltas between
+    the masters given by allData within tolerance."""
+    model, allData = masterModel.getSubModel(allData)
+
+    allCoords = [d[0] for d in allData]
+    allControls = [d[1] for d in allData]
+    control = allControls[0]
+    if not models.allEqual(allControls):
+        return False
+
+    deltas = model.getDeltasMany([coords.array for coords in allCoords], round=round)
+    origCoords = GlyphCoordinates()
+    origCoords.array.extend(deltas[0])
+    endPts = list(control.endPts)
+
+    previous = {_tuple_variation_key(v.axes): v for v in variations}
+    matched = 0
+    for delta, support in zip(deltas[1:], model.supports[1:]):
+        var = previous.get(_tuple_variation_key(support))
+        if var is None:
+            if any(delta):
+                return False
+            continue
+        matched += 1
+        coordinates = var.coordinates
+        if len(coordinates) * 2 != len(delta):
+            return False
+        if None in coordinates:
+            if not optimize:
+                return False
+            coordinates = iup_delta(coordinates, origCoords, endPts)
+        for (x, y), dx, dy in zip(coordinates, delta[0::2], delta[1::2]):
+            if abs(complex(x - dx, y - dy)) > tolerance:
+                return False
+    return matched == len(variations) == len(previous)
+
+
+def _set_gvar_variations(gvar, glyphOrder, allVariations):
+    for glyph, variations in zip(glyphOrder, allVariations):
+        if variations is None:
+            log.warning("glyph %s has incompatible masters; skipping" % glyph)
+            continue
+        gvar.variations[glyph] = variations
+
 
+def _get_gvar_glyph_data(glyph, master_datas, defaultMasterIndex):
+    allData = [
+        m.glyf._getCoordinatesAndControls(glyph, m.hMetrics, m.vMetrics)
+        for m in master_datas
+    ]
+
+    if allData[defaultMasterIndex][1].numberOfContours != 0:
+        # If the default master is not empty, interpret empty non-default masters
+        # as missing glyphs from a sparse master
         allData = [
-            m.glyf._getCoordinatesAndControls(glyph, m.hMetrics, m.vMetrics)
-            for m in master_datas
+            d if d is not None and d[1].numberOfContours != 0 else None for d in allData
         ]
 
-        if allData[defaultMasterIndex][1].numberOfContours != 0:
-            # If the default master is not empty, interpret empty non-default masters
-            # as missing glyphs from a sparse master
-            allData = [
-                d if d is not None and d[1].numberOfContours != 0 else None
-                for d in allData
-            ]
+    return allData
 
-        model, allData = masterModel.getSubModel(allData)
 
-        allCoords = [d[0] for d in allData]
-        allControls = [d[1] for d in allData]
-        control = allControls[0]
-        if not models.allEqual(allControls):
-            log.warning("glyph %s has incompatible masters; skipping" % glyph)
+def _compute_gvar_variations(
+    glyph, allData, masterModel, tolerance, optimize, fast_iup=False
+):
+    """Return the list of TupleVariations for a glyph, given the coordinates
+    and controls of each master, or None if the masters are incompatible."""
+    log.debug("building gvar for glyph '%s'", glyph)
+
+    model, allData = masterModel.getSubModel(allData)
+
+    allCoords = [d[0] for d in allData]
+    allControls = [d[1] for d in allData]
+    control = allControls[0]
+    if not models.allEqual(allControls):
+        return None
+    del allControls
+
+    variations = []
+    deltas = []
+    for deltaArray in model.getDeltasMany(
+        [coords.array for coords in allCoords], round=round
+    ):
+        delta = GlyphCoordinates()
+        delta.array.extend(deltaArray)
+        deltas.append(delta)
+    supports = model.supports
+    assert len(deltas) == len(supports)
+
+    # Prepare for IUP optimization
+    origCoords = deltas[0]
+    endPts = control.endPts
+    geometry = IUPGeometry(origCoords, endPts) if optimize else None
+
+    for i, (delta, support) in enumerate(zip(deltas[1:], supports[1:])):
+        if all(v == 0 for v in delta.array):
             continue
-        del allControls
+        var = TupleVariation(support, delta)
+        if optimize:
+            delta_opt = iup_delta_optimize(
+                delta,
+                origCoords,
+                endPts,
+                tolerance=tolerance,
+                fast=fast_iup,
+                geometry=geometry,
+            )
 
-        # Update gvar
-        gvar.variations[glyph] = []
-        deltas = model.getDeltas(
-            allCoords, round=partial(GlyphCoordinates.__round__, round=round)
-        )
-        supports = model.supports
-        assert len(deltas) == len(supports)
+            if None in delta_opt:
+                # Use "optimized" version only if smaller...
+                var_opt = TupleVariation(support, delta_opt)
 
-        # Prepare for IUP optimization
-        origCoords = deltas[0]
-        endPts = control.endPts
+                axis_tags = sorted(
+                    support.keys()
+                )  # Shouldn't matter that this is different from fvar...?
+                unoptimized_len = var.getCompiledSize(axis_tags)
+                optimized_len = var_opt.getCompiledSize(axis_tags)
 
-        for i, (delta, support) in enumerate(zip(deltas[1:], supports[1:])):
-            if all(v == 0 for v in delta.array):
-                continue
-            var = TupleVariation(support, delta)
-            if optimize:
-                delta_opt = iup_delta_optimize(
-                    delta, origCoords, endPts, tolerance=tolerance
-                )
+                if optimized_len < unoptimized_len:
+                    var = var_opt
 
-                if None in delta_opt:
-                    # Use "optimized" version only if smaller...
-                    var_opt = TupleVariation(support, delta_opt)
+        variations.append(var)
+
+    return variations
+
+
+_gvar_worker_args = None
 
-                    axis_tags = sorted(
-                        support.keys()
-                    )  # Shouldn't matter that this is different from fvar...?
-                    tupleData, auxData = var.compile(axis_tags)
-                    unoptimized_len = len(tupleData) + len(auxData)
-                    tupleData, auxData = var_opt.compile(axis_tags)
-                    optimized_len = len(tupleData) + len(auxData)
 
-                    if optimized_len < unoptimized_len:
-                        var = var_opt
+def _init_gvar_worker(masterModel, tolerance, optimize, fast_iup):
+    global _gvar_worker_args
+    _gvar_worker_args = (masterModel, tolerance, optimize, fast_iup)
 
-            gvar.variations[glyph].append(var)
+
+def _gvar_worker_compute_variations(glyphData):
+    glyph, allData = glyphData
+    return _compute_gvar_variations(glyph, allData, *_gvar_worker_args)
 
 
 def _remove_TTHinting(font):
@@ -550,26 +745,20 @@ def _add_VHVAR(font, axisTags, tableFields, getAdvanceMetrics):
         supports = next(iter(vhAdvanceDeltasAndSupports.values()))[1][1:]
         varTupleList = builder.buildVarRegionList(supports, axisTags)
         varTupleIndexes = list(range(len(supports)))
-        varData = builder.buildVarData(varTupleIndexes, [], optimize=False)
-        for glyphName in glyphOrder:
-            varData.addItem(vhAdvanceDeltasAndSupports[glyphName][0], round=noRound)
-        varData.optimize()
+        # The deltas include the one of the default master, which is dropped.
+        varData = builder.buildVarData(
+            varTupleIndexes,
+            [vhAdvanceDeltasAndSupports[g][0][1:] for g in glyphOrder],
+            optimize=True,
+        )
         directStore = builder.buildVarStore(varTupleList, [varData])
 
     # Build optimized indirect mapping
     storeBuilder = varStore.OnlineVarStoreBuilder(axisTags)
-    advMapping = {}
-    for glyphName in glyphOrder:
-        deltas, supports = vhAdvanceDeltasAndSupports[glyphName]
-        storeBuilder.setSupports(supports)
-        advMapping[glyphName] = storeBuilder.storeDeltas(deltas, round=noRound)
+    advMapping = _storeGlyphDeltas(storeBuilder, vhAdvanceDeltasAndSupports, glyphOrder)
 
     if vOrigDeltasAndSupports:
-        vOrigMap = {}
-        for glyphName in glyphOrder:
-            deltas, supports = vOrigDeltasAndSupports[glyphName]
-            storeBuilder.setSupports(supports)
-            vOrigMap[glyphName] = storeBuilder.storeDeltas(deltas, round=noRound)
+        vOrigMap = _storeGlyphDeltas(storeBuilder, vOrigDeltasAndSupports, glyphOrder)
 
     indirectStore = storeBuilder.finish()
     mapping2 = indirectStore.optimize(use_NO_VARIATION_INDEX=False)
@@ -614,6 +803,26 @@ def _add_VHVAR(font, axisTags, tableFields, getAdvanceMetrics):
     return
 
 
+def _storeGlyphDeltas(storeBuilder, deltasAndSupports, glyphOrder):
+    # Store the deltas of each glyph, and return the mapping of glyph names to
+    # VarIdxes. Glyphs mostly share few advances and models, so each distinct
+    # row is stored once, and the supports are only set when they change.
+    varIdxes = {}
+    mapping = {}
+    lastSupports = None
+    for glyphName in glyphOrder:
+        deltas, supports = deltasAndSupports[glyphName]
+        key = (id(supports), tuple(deltas))
+        varIdx = varIdxes.get(key)
+        if varIdx is None:
+            if supports is not lastSupports:
+                storeBuilder.setSupports(supports)
+                lastSupports = supports
+            varIdx = varIdxes[key] = storeBuilder.storeDeltas(deltas, round=noRound)
+        mapping[glyphName] = varIdx
+    return mapping
+
+
 def _get_advance_metrics(font, masterModel, master_ttfs, axisTags, tableFields):
     tableTag = tableFields.tableTag
     glyphOrder = font.getGlyphOrder()
@@ -630,38 +839,54 @@ def _get_advance_metrics(font, masterModel, master_ttfs, axisTags, tableFields):
     else:
         vOrigMetricses = None
 
-    vhAdvanceDeltasAndSupports = {}
     vOrigDeltasAndSupports = {}
     # HACK: we treat width 65535 as a sentinel value to signal that a glyph
     # from a non-default master should not participate in computing {H,V}VAR,
     # as if it were missing. Allows to variate other glyph-related data independently
     # from glyph metrics
     sparse_advance = 0xFFFF
-    for glyph in glyphOrder:
-        vhAdvances = [
+    allVhAdvances = [
+        tuple(
             (
                 metrics[glyph][0]
                 if glyph in metrics and metrics[glyph][0] != sparse_advance
                 else None
             )
             for metrics in advMetricses
-        ]
-        vhAdvanceDeltasAndSupports[glyph] = masterModel.getDeltasAndSupports(
-            vhAdvances, round=round
         )
+        for glyph in glyphOrder
+    ]
+    # Many glyphs share their advances in all masters; compute the deltas of
+    # each distinct set of advances once.
+    uniqueVhAdvances = list(dict.fromkeys(allVhAdvances))
+    deltasAndSupportsByAdvances = dict(
+        zip(
+            uniqueVhAdvances,
+            masterModel.getDeltasAndSupportsMany(uniqueVhAdvances, round=round),
+        )
+    )
+    vhAdvanceDeltasAndSupports = {
+        glyph: deltasAndSupportsByAdvances[advances]
+        for glyph, advances in zip(glyphOrder, allVhAdvances)
+    }
 
     if vOrigMetricses:
-        for glyph in glyphOrder:
-            # We need to supply a vOrigs tuple with non-None default values
-            # for each glyph. vOrigMetricses contains values only for those
-            # glyphs which have a non-default vOrig.
-            vOrigs = [
+        # We need to supply a vOrigs tuple with non-None default values
+        # for each glyph. vOrigMetricses contains values only for those
+        # glyphs which have a non-default vOrig.
+        allVOrigs = [
+            [
                 metrics[glyph] if glyph in metrics else defaultVOrig
                 for metrics, defaultVOrig in vOrigMetricses
             ]
-            vOrigDeltasAndSupports[glyph] = masterModel.getDeltasAndSupports(
-                vOrigs, round=round
+            for glyph in glyphOrder
+        ]
+        vOrigDeltasAndSupports = dict(
+            zip(
+                glyphOrder,
+                masterModel.getDeltasAndSupportsMany(allVOrigs, round=round),
             )
+        )
 
     return vhAdvanceDeltasAndSupports, vOrigDeltasAndSupports
 
@@ -794,6 +1019,27 @@ def _merge_OTL(font, model, master_fonts, axisTags):
         font["GPOS"].table.remap_device_varidxes(varidx_map)
 
 
+def _reuse_OTL(font, previous_vf, exclude):
+    if font.getGlyphOrder() != previous_vf.getGlyphOrder():
+        raise VarLibValidationError(
+            "Can't reuse the layout tables of a variable font with a different "
+            "glyph order."
+        )
+    # Whether the master GDEF and GPOS tables changed is not checked; the
+    # caller vouches for it by passing reuse_layout.
+    log.warning(
+        "Reusing the merged 'GDEF' and 'GPOS' tables of the previous variable "
+        "font without checking that their master tables are unchanged"
+    )
+    for tag in ("GDEF", "GPOS"):
+        if tag in exclude:
+            continue
+        if tag in previous_vf:
+            font[tag] = deepcopy(previous_vf[tag])
+        elif tag in font:
+            del font[tag]
+
+
 def _add_GSUB_feature_variations(
     font, axes, internal_axis_supports, rules, featureTags
 ):
@@ -1093,6 +1339,8 @@ def build_many(
     skip_vf=lambda vf_name: False,
     colr_layer_reuse=True,
     drop_implied_oncurves=False,
+    jobs=1,
+    fast_iup=False,
 ):
     """
     Build variable fonts from a designspace file, version 5 which can define
@@ -1106,6 +1354,11 @@ def build_many(
     the input designspace. It's a predicate that takes as argument the name
     of the variable font and returns `bool`.
 
+    If jobs is greater than 1 and there are several variable fonts to build,
+    they are built in up to that many worker processes. Their masters are then
+    loaded only once, up front, and shared with the workers. With a single
+    variable font to build, jobs is passed on to build() instead.
+
     Always returns a Dict[str, TTFont] keyed by VariableFontDescriptor.name
     """
     res = {}
@@ -1125,25 +1378,90 @@ def build_many(
             or designspace.locationLabels
         )
     )
+    vfDocs = []
     for _location, subDoc in splitInterpolable(designspace):
         for name, vfDoc in splitVariableFonts(subDoc):
             if skip_vf(name):
                 log.debug(f"Skipping variable TTF font: {name}")
                 continue
-            vf = build(
-                vfDoc,
-                master_finder,
-                exclude=exclude,
-                optimize=optimize,
-                colr_layer_reuse=colr_layer_reuse,
-                drop_implied_oncurves=drop_implied_oncurves,
-            )[0]
-            if doBuildStatFromDSv5:
-                buildVFStatTable(vf, designspace, name)
-            res[name] = vf
+            vfDocs.append((name, vfDoc))
+
+    buildArgs = dict(
+        exclude=exclude,
+        optimize=optimize,
+        colr_layer_reuse=colr_layer_reuse,
+        drop_implied_oncurves=drop_implied_oncurves,
+        fast_iup=fast_iup,
+    )
+    statDesignspace = designspace if doBuildStatFromDSv5 else None
+
+    if jobs > 1 and len(vfDocs) > 1:
+        # Load the masters of all the variable fonts at once, each only once.
+        allSources = DesignSpaceDocument()
+        allSources.sources = [s for _, vfDoc in vfDocs for s in vfDoc.sources]
+        load_masters(
+            allSources,
+            master_finder,
+            jobs=jobs,
+            prefetch=[tag for tag in MERGED_MASTER_TABLES if tag not in exclude],
+        )
+
+        # Each worker process builds a single font, on its own copy of the
+        # masters, as building may modify them. The fonts are sent back
+        # compiled.
+        processes = min(jobs, len(vfDocs))
+        log.info(
+            "Building %d variable fonts in %d parallel processes",
+            len(vfDocs),
+            processes,
+        )
+        pool = mp.Pool(
+            processes,
+            initializer=_init_build_many_worker,
+            initargs=(vfDocs, statDesignspace, buildArgs),
+            maxtasksperchild=1,
+        )
+        with closing(pool):
+            for name, data in pool.imap(_build_many_worker, range(len(vfDocs))):
+                res[name] = TTFont(BytesIO(data))
+        return res
+
+    for name, vfDoc in vfDocs:
+        res[name] = _build_one(
+            name,
+            vfDoc,
+            statDesignspace,
+            master_finder=master_finder,
+            jobs=jobs,
+            **buildArgs,
+        )
     return res
 
 
+def _build_one(name, vfDoc, statDesignspace, **kwargs):
+    vf = build(vfDoc, **kwargs)[0]
+    if statDesignspace is not None:
+        buildVFStatTable(vf, statDesignspace, name)
+    return vf
+
+
+_build_many_worker_args = None
+
+
+def _init_build_many_worker(vfDocs, statDesignspace, buildArgs):
+    global _build_many_worker_args
+    _build_many_worker_args = (vfDocs, statDesignspace, buildArgs)
+
+
+def _build_many_worker(index):
+    vfDocs, statDesignspace, buildArgs = _build_many_worker_args
+    name, vfDoc = vfDocs[index]
+    vf = _build_one(name, vfDoc, statDesignspace, **buildArgs)
+    buf = BytesIO()
+    vf.save(buf)
+    return name, buf.getvalue()
+
+
 def build(
     designspace,
     master_finder=lambda s: s,
@@ -1151,6 +1469,12 @@ def build(
     optimize=True,
     colr_layer_reuse=True,
     drop_implied_oncurves=False,
+    jobs=1,
+    *,
+    previous_vf=None,
+    changed_glyphs=None,
+    reuse_layout=False,
+    fast_iup=False,
 ):
     """
     Build variation font from a designspace file.
@@ -1158,6 +1482,24 @@ def build(
     If master_finder is set, it should be a callable that takes master
     filename as found in designspace file and map it to master font
     binary as to be opened (eg. .ttf or .otf).
+
+    If jobs is greater than 1, the masters are loaded in that many threads, and
+    the per-glyph deltas and IUP optimization for the 'gvar' table are computed
+    in that many worker processes. The result is identical to the serial build.
+
+    previous_vf can be set to a variable font (a TTFont or a path) previously
+    built from an earlier version of the same masters, to rebuild incrementally:
+    the 'gvar' variations of the glyphs not in changed_glyphs are then taken
+    over from it. If changed_glyphs is None, the previous variations of a glyph
+    are taken over if they still match its masters within the IUP tolerance.
+    If reuse_layout is true, the merged 'GDEF' and 'GPOS' tables are taken
+    over too. Whether their master inputs are unchanged is not checked, only
+    that the glyph order is; the caller must know it. The other tables are
+    rebuilt as usual.
+
+    If fast_iup is true, the IUP optimization of the 'gvar' deltas uses a
+    greedy heuristic, which is several times faster but produces a slightly
+    bigger 'gvar' table.
     """
     if hasattr(designspace, "sources"):  # Assume a DesignspaceDocument
         pass
@@ -1168,7 +1510,12 @@ def build(
     log.info("Building variable font")
 
     log.info("Loading master fonts")
-    master_fonts = load_masters(designspace, master_finder)
+    master_fonts = load_masters(
+        designspace,
+        master_finder,
+        jobs=jobs,
+        prefetch=[tag for tag in MERGED_MASTER_TABLES if tag not in exclude],
+    )
 
     # TODO: 'master_ttfs' is unused except for return value, remove later
     master_ttfs = []
@@ -1218,10 +1565,23 @@ def build(
         _add_HVAR(vf, model, master_fonts, axisTags)
     if "VVAR" not in exclude and "vmtx" in vf:
         _add_VVAR(vf, model, master_fonts, axisTags)
-    if "GDEF" not in exclude or "GPOS" not in exclude:
+    if previous_vf is not None and not isinstance(previous_vf, TTFont):
+        previous_vf = TTFont(previous_vf)
+    if reuse_layout and previous_vf is not None:
+        _reuse_OTL(vf, previous_vf, exclude)
+    elif "GDEF" not in exclude or "GPOS" not in exclude:
         _merge_OTL(vf, model, master_fonts, axisTags)
     if "gvar" not in exclude and "glyf" in vf:
-        _add_gvar(vf, model, master_fonts, optimize=optimize)
+        _add_gvar(
+            vf,
+            model,
+            master_fonts,
+            optimize=optimize,
+            jobs=jobs,
+            previous_vf=previous_vf,
+            changed_glyphs=changed_glyphs,
+            fast_iup=fast_iup,
+        )
     if "cvar" not in exclude and "glyf" in vf:
         _merge_TTHinting(vf, model, master_fonts)
     if "GSUB" not in exclude and ds.rules:
@@ -1275,7 +1635,31 @@ def _open_font(path, master_finder=lambda s: s):
     return font
 
 
-def load_masters(designspace, master_finder=lambda s: s):
+# Master tables that building a variable font decompiles; see load_masters().
+MERGED_MASTER_TABLES = (
+    "glyf",
+    "hmtx",
+    "vmtx",
+    "CFF ",
+    "CFF2",
+    "GDEF",
+    "GPOS",
+    "GSUB",
+)
+
+
+def _prefetch_tables(font, tags):
+    for tag in tags:
+        if tag in font:
+            table = font[tag]
+            # Don't leave the tables of 'lazy' fonts half decompiled, which
+            # would get in the way of deep-copying the font later.
+            if font.lazy and hasattr(table, "ensureDecompiled"):
+                table.ensureDecompiled(recurse=True)
+    return font
+
+
+def load_masters(designspace, master_finder=lambda s: s, *, jobs=1, prefetch=()):
     """Ensure that all SourceDescriptor.font attributes have an appropriate TTFont
     object loaded, or else open TTFont objects from the SourceDescriptor.path
     attributes.
@@ -1284,6 +1668,13 @@ def load_masters(designspace, master_finder=lambda s: s):
     latter case, use the provided master_finder callable to map from UFO paths to
     the respective master font binaries (e.g. .ttf, .otf or .ttx).
 
+    prefetch is a sequence of table tags to decompile right away in every master
+    that has them, instead of on first access; see MERGED_MASTER_TABLES.
+
+    If jobs is greater than 1, the masters are opened and their tables prefetched
+    in that many threads, so that reading, decompressing and parsing the files
+    overlap.
+
     Return list of master TTFont objects in the same order they are listed in the
     DesignSpaceDocument.
     """
@@ -1297,7 +1688,41 @@ def load_masters(designspace, master_finder=lambda s: s):
                 "attribute."
             )
 
-    return designspace.loadSourceFonts(_open_font, master_finder=master_finder)
+    if jobs <= 1:
+        fonts = designspace.loadSourceFonts(_open_font, master_finder=master_finder)
+        if prefetch:
+            for font in {id(font): font for font in fonts}.values():
+                _prefetch_tables(font, prefetch)
+        return fonts
+
+    # Open each master path once, and prefetch every distinct font once.
+    paths = list(
+        dict.fromkeys(
+            source.path
+            for source in designspace.sources
+            if source.font is None and source.path is not None
+        )
+    )
+    given = {
+        id(source.font): source.font
+        for source in designspace.sources
+        if source.font is not None
+    }
+
+    def load(path):
+        return _prefetch_tables(_open_font(path, master_finder), prefetch)
+
+    log.info("Loading %d master fonts in %d threads", len(paths), jobs)
+    with ThreadPoolExecutor(jobs) as executor:
+        opened = executor.map(load, paths)
+        prefetched = executor.map(
+            partial(_prefetch_tables, tags=prefetch), given.values()
+        )
+        opened = dict(zip(paths, opened))
+        for _ in prefetched:
+            pass
+
+    return designspace.loadSourceFonts(lambda path: opened[path])
 
 
 class MasterFinder(object):
@@ -1382,6 +1807,12 @@ def main(args=None):
         action="store_false",
         help="do not perform IUP optimization",
     )
+    parser.add_argument(
+        "--fast-iup",
+        action="store_true",
+        help="use a faster IUP optimization, at the cost of a slightly bigger "
+        "'gvar' table",
+    )
     parser.add_argument(
         "--no-colr-layer-reuse",
         dest="colr_layer_reuse",
@@ -1396,6 +1827,18 @@ def main(args=None):
             "two off-curve points (only applies to TrueType fonts)"
         ),
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        nargs="?",
+        default=1,
+        const=cpuCount(),
+        metavar="N",
+        help="Build several variable fonts in N parallel processes, or else "
+        "load masters in N threads and run N parallel processes to build 'gvar' "
+        "(default: %(default)s); if N is omitted, the number of CPUs is used.",
+    )
     parser.add_argument(
         "--master-finder",
         default="master_ttf_interpolatable/{stem}.ttf",
@@ -1481,6 +1924,8 @@ def main(args=None):
         optimize=options.optimize,
         colr_layer_reuse=options.colr_layer_reuse,
         drop_implied_oncurves=options.drop_implied_oncurves,
+        jobs=options.jobs,
+        fast_iup=options.fast_iup,
     )
 
     for vf_name, vf in vfs.items():
@@ -1,12 +1,17 @@
-from fontTools.ttLib import newTable
+from fontTools.ttLib import TTFont, newTable
 from fontTools.ttLib.tables._f_v_a_r import Axis as fvarAxis
 from fontTools.pens.areaPen import AreaPen
 from fontTools.pens.basePen import NullPen
 from fontTools.pens.statisticsPen import StatisticsPen
+from fontTools.pens.recordingPen import RecordingPen, replayRecording
 from fontTools.varLib.models import piecewiseLinearMap, normalizeValue
-from fontTools.misc.cliTools import makeOutputFileName
+from fontTools.misc.cliTools import cpuCount, makeOutputFileName
+from collections.abc import Mapping
+from contextlib import closing
+from io import BytesIO
 import math
 import logging
+import multiprocessing as mp
 from pprint import pformat
 
 __all__ = [
@@ -366,6 +371,166 @@ def sanitizeSlant(userTriple, designTriple, pins, measurements):
     return True
 
 
+class _CachedGlyph:
+    """A glyph of a _CachedGlyphSet. It is only drawn from the wrapped glyphset
+    once, and replayed from a recording after that."""
+
+    def __init__(self, glyphSet, glyphName):
+        self.glyphSet = glyphSet
+        self.name = glyphName
+        self.glyph = glyphSet.glyphSet[glyphName]
+        self.recordings = {}
+
+    @property
+    def width(self):
+        # The width may only be known once the glyph is drawn.
+        return self.glyph.width
+
+    def draw(self, pen):
+        glyphSet = self.glyphSet
+        # Glyphs drawn as components may be drawn differently; record both.
+        isComponent = glyphSet.depth > 0
+        recording = self.recordings.get(isComponent)
+        if recording is None:
+            recordingPen = RecordingPen()
+            pushDepth = getattr(glyphSet.glyphSet, "pushDepth", None)
+            if isComponent and pushDepth is not None:
+                with pushDepth():
+                    self.glyph.draw(recordingPen)
+            else:
+                self.glyph.draw(recordingPen)
+            recording = self.recordings[isComponent] = recordingPen.value
+        glyphSet.depth += 1
+        try:
+            replayRecording(recording, pen)
+        finally:
+            glyphSet.depth -= 1
+
+
+class _CachedGlyphSet(Mapping):
+    """Wrap a glyphset, so that the outline of each glyph is only computed
+    once at its location, however many times it is measured or drawn as a
+    component of other glyphs."""
+
+    def __init__(self, glyphSet):
+        self.glyphSet = glyphSet
+        self.glyphs = {}
+        self.depth = 0
+
+    def __getitem__(self, glyphName):
+        glyph = self.glyphs.get(glyphName)
+        if glyph is None:
+            glyph = self.glyphs[glyphName] = _CachedGlyph(self, glyphName)
+        return glyph
+
+    def __contains__(self, glyphName):
+        return glyphName in self.glyphSet
+
+    def __iter__(self):
+        return iter(self.glyphSet)
+
+    def __len__(self):
+        return len(self.glyphSet)
+
+
+def _measureLocation(measureFunc, glyphSetFunc, location, glyphs):
+    log.debug("Sampling location %s.", location)
+    glyphset = _CachedGlyphSet(glyphSetFunc(location=location))
+    return measureFunc(glyphset, glyphs)
+
+
+def _getFontData(glyphSetFunc):
+    # Return the binary data of the font whose getGlyphSet method is
+    # glyphSetFunc, for worker processes to load their own copy of the font,
+    # as it is in memory; or None for other callables.
+    font = getattr(glyphSetFunc, "__self__", None)
+    if (
+        not isinstance(font, TTFont)
+        or getattr(glyphSetFunc, "__func__", None) is not TTFont.getGlyphSet
+    ):
+        return None
+    buf = BytesIO()
+    font.save(buf)
+    return buf.getvalue()
+
+
+_measureWorkerArgs = None
+
+
+def _initMeasureWorker(measureFunc, fontData, glyphs):
+    global _measureWorkerArgs
+    font = TTFont(BytesIO(fontData))
+    _measureWorkerArgs = (measureFunc, font.getGlyphSet, glyphs)
+
+
+def _measureWorker(location):
+    measureFunc, glyphSetFunc, glyphs = _measureWorkerArgs
+    return _measureLocation(measureFunc, glyphSetFunc, location, glyphs)
+
+
+def _measureAxis(
+    measureFunc,
+    glyphSetFunc,
+    axisTag,
+    defaultValue,
+    axisValues,
+    glyphs,
+    jobs=1,
+    cache=None,
+):
+    """Measure the glyphs at each of the axisValues along the axis, in jobs
+    parallel processes, and return the measurements by value.
+
+    The worker processes load the font from its data, so measuring in
+    parallel needs glyphSetFunc to be the getGlyphSet method of a TTFont;
+    other callables are measured serially.
+
+    If cache is a dict, measurements are looked up in it and added to it,
+    keyed by the measure function, the location and the glyphs. The default
+    value of each axis is keyed as the same location."""
+
+    glyphsKey = tuple(glyphs.items()) if isinstance(glyphs, dict) else tuple(glyphs)
+    keys = {
+        value: (
+            measureFunc,
+            () if value == defaultValue else ((axisTag, value),),
+            glyphsKey,
+        )
+        for value in axisValues
+    }
+
+    measurements = {}
+    if cache is not None:
+        for value, key in keys.items():
+            if key in cache:
+                measurements[value] = cache[key]
+    todo = [value for value in axisValues if value not in measurements]
+    locations = [{axisTag: value} for value in todo]
+
+    jobs = min(jobs, len(locations))
+    fontData = _getFontData(glyphSetFunc) if jobs > 1 else None
+    if fontData is not None:
+        log.info("Running %d parallel processes", jobs)
+        pool = mp.Pool(
+            jobs,
+            initializer=_initMeasureWorker,
+            initargs=(measureFunc, fontData, glyphs),
+        )
+        with closing(pool):
+            results = pool.map(_measureWorker, locations)
+    else:
+        results = [
+            _measureLocation(measureFunc, glyphSetFunc, location, glyphs)
+            for location in locations
+        ]
+
+    for value, result in zip(todo, results):
+        measurements[value] = result
+        if cache is not None:
+            cache[keys[value]] = result
+    return measurements
+
+
 def planAxis(
     measureFunc,
     normalizeFunc,
@@ -379,6 +544,8 @@ def planAxis(
     designLimits=None,
     pins=None,
     sanitizeFunc=None,
+    jobs=1,
+    cache=None,
 ):
     """Plan an axis.
 
@@ -417,6 +584,14 @@ def planAxis(
     the output.
 
     sanitizeFunc: an optional callable to call to sanitize the axis limits.
+
+    jobs: the number of processes to measure the glyphs at several locations
+    in parallel. Default 1.
+
+    cache: an optional dict to look up measurements in and store them to, to
+    share them between axes or with later runs. Measurements are keyed by
+    measureFunc, location and glyphs; the glyphs of the font must not change
+    in the meantime.
     """
 
     if isinstance(axisLimits, fvarAxis):
@@ -455,11 +630,30 @@ def planAxis(
     out = {}
     outNormalized = {}
 
+    # Measure at the pins, and at the samples of each range between them that
+    # has values to plan, in one go.
+    sortedPins = sorted(pins.items())
+    sampleValues = []
+    for (rangeMin, _), (rangeMax, _) in zip(sortedPins[:-1], sortedPins[1:]):
+        if any(rangeMin < w < rangeMax for w in values):
+            sampleValues.extend(
+                rangeMin + (rangeMax - rangeMin) * sample / (samples + 1)
+                for sample in range(1, samples + 1)
+            )
+    measurements = _measureAxis(
+        measureFunc,
+        glyphSetFunc,
+        axisTag,
+        defaultValue,
+        [value for value, _ in sortedPins] + sampleValues,
+        glyphs,
+        jobs,
+        cache,
+    )
+
     axisMeasurements = {}
-    for value in sorted({minValue, defaultValue, maxValue} | set(pins.keys())):
-        glyphset = glyphSetFunc(location={axisTag: value})
-        designValue = pins[value]
-        axisMeasurements[designValue] = measureFunc(glyphset, glyphs)
+    for value, designValue in sortedPins:
+        axisMeasurements[designValue] = measurements[value]
 
     if sanitizeFunc is not None:
         log.info("Sanitizing axis limit values for the `%s` axis.", axisTag)
@@ -468,8 +662,7 @@ def planAxis(
     log.debug("Calculated average value:\n%s", pformat(axisMeasurements))
 
     for (rangeMin, targetMin), (rangeMax, targetMax) in zip(
-        list(sorted(pins.items()))[:-1],
-        list(sorted(pins.items()))[1:],
+        sortedPins[:-1], sortedPins[1:]
     ):
         targetValues = {w for w in values if rangeMin < w < rangeMax}
         if not targetValues:
@@ -485,10 +678,8 @@ def planAxis(
         valueMeasurements = axisMeasurements.copy()
         for sample in range(1, samples + 1):
             value = rangeMin + (rangeMax - rangeMin) * sample / (samples + 1)
-            log.debug("Sampling value %g.", value)
-            glyphset = glyphSetFunc(location={axisTag: value})
             designValue = piecewiseLinearMap(value, pins)
-            valueMeasurements[designValue] = measureFunc(glyphset, glyphs)
+            valueMeasurements[designValue] = measurements[value]
         log.debug("Sampled average value:\n%s", pformat(valueMeasurements))
 
         measurementValue = {}
@@ -538,6 +729,8 @@ def planWeightAxis(
     designLimits=None,
     pins=None,
     sanitize=False,
+    jobs=1,
+    cache=None,
 ):
     """Plan a weight (`wght`) axis.
 
@@ -564,6 +757,8 @@ def planWeightAxis(
         designLimits=designLimits,
         pins=pins,
         sanitizeFunc=sanitizeWeight if sanitize else None,
+        jobs=jobs,
+        cache=cache,
     )
 
 
@@ -576,6 +771,8 @@ def planWidthAxis(
     designLimits=None,
     pins=None,
     sanitize=False,
+    jobs=1,
+    cache=None,
 ):
     """Plan a width (`wdth`) axis.
 
@@ -602,6 +799,8 @@ def planWidthAxis(
         designLimits=designLimits,
         pins=pins,
         sanitizeFunc=sanitizeWidth if sanitize else None,
+        jobs=jobs,
+        cache=cache,
     )
 
 
@@ -614,6 +813,8 @@ def planSlantAxis(
     designLimits=None,
     pins=None,
     sanitize=False,
+    jobs=1,
+    cache=None,
 ):
     """Plan a slant (`slnt`) axis.
 
@@ -640,6 +841,8 @@ def planSlantAxis(
         designLimits=designLimits,
         pins=pins,
         sanitizeFunc=sanitizeSlant if sanitize else None,
+        jobs=jobs,
+        cache=cache,
     )
 
 
@@ -652,6 +855,8 @@ def planOpticalSizeAxis(
     designLimits=None,
     pins=None,
     sanitize=False,
+    jobs=1,
+    cache=None,
 ):
     """Plan a optical-size (`opsz`) axis.
 
@@ -677,6 +882,8 @@ def planOpticalSizeAxis(
         glyphs=glyphs,
         designLimits=designLimits,
         pins=pins,
+        jobs=jobs,
+        cache=cache,
     )
 
 
@@ -704,7 +911,7 @@ def makeDesignspaceSnippet(axisTag, axisName, axisLimit, mapping):
 def addEmptyAvar(font):
     """Add an empty `avar` table to the font."""
     font["avar"] = avar = newTable("avar")
-    for axis in fvar.axes:
+    for axis in font["fvar"].axes:
         avar.segments[axis.axisTag] = {}
 
 
@@ -720,6 +927,8 @@ def processAxis(
     pins=None,
     sanitize=False,
     plot=False,
+    jobs=1,
+    cache=None,
 ):
     """Process a single axis."""
 
@@ -744,7 +953,7 @@ def processAxis(
         values = [float(w) for w in values.split()]
 
     if designLimits is not None and isinstance(designLimits, str):
-        designLimits = [float(d) for d in options.designLimits.split(":")]
+        designLimits = [float(d) for d in designLimits.split(":")]
         assert (
             len(designLimits) == 3
             and designLimits[0] <= designLimits[1] <= designLimits[2]
@@ -769,6 +978,8 @@ def processAxis(
         designLimits=designLimits,
         pins=pins,
         sanitize=sanitize,
+        jobs=jobs,
+        cache=cache,
     )
 
     if plot:
@@ -809,7 +1020,6 @@ def main(args=None):
         args = sys.argv[1:]
 
     from fontTools import configLogger
-    from fontTools.ttLib import TTFont
     import argparse
 
     parser = argparse.ArgumentParser(
@@ -888,6 +1098,17 @@ def main(args=None):
     parser.add_argument(
         "-p", "--plot", action="store_true", help="Plot the resulting mapping."
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        nargs="?",
+        default=1,
+        const=cpuCount(),
+        metavar="N",
+        help="Measure glyphs at N locations in parallel (default: %(default)s; "
+        "N defaults to the number of CPUs)",
+    )
 
     logging_group = parser.add_mutually_exclusive_group(required=False)
     logging_group.add_argument(
@@ -922,6 +1143,8 @@ def main(args=None):
         glyphs = None
 
     designspaceSnippets = []
+    # Measurements are shared between axes, eg. at the default location.
+    cache = {}
 
     designspaceSnippets.append(
         processAxis(
@@ -936,6 +1159,8 @@ def main(args=None):
             pins=options.weight_pins,
             sanitize=options.sanitize,
             plot=options.plot,
+            jobs=options.jobs,
+            cache=cache,
         )
     )
     designspaceSnippets.append(
@@ -951,6 +1176,8 @@ def main(args=None):
             pins=options.width_pins,
             sanitize=options.sanitize,
             plot=options.plot,
+            jobs=options.jobs,
+            cache=cache,
         )
     )
     designspaceSnippets.append(
@@ -966,6 +1193,8 @@ def main(args=None):
             pins=options.slant_pins,
             sanitize=options.sanitize,
             plot=options.plot,
+            jobs=options.jobs,
+            cache=cache,
         )
     )
     designspaceSnippets.append(
@@ -981,6 +1210,8 @@ def main(args=None):
             pins=options.optical_size_pins,
             sanitize=options.sanitize,
             plot=options.plot,
+            jobs=options.jobs,
+            cache=cache,
         )
     )
 
@@ -0,0 +1,293 @@
+"""Benchmark VarStore optimization on large synthetic item variation stores,
+shaped like the GPOS kerning variations of a big variable font, the merging
+of class kerning from many masters, the contour matching of
+varLib.interpolatable, the IUP optimization of glyph deltas, and the building
+of HVAR for a font with many glyphs."""
+
+from fontTools.misc.hungarian import linearSumAssignment
+from fontTools.ttLib import TTFont, newTable
+from fontTools.ttLib.tables import otBase, otTables as ot
+from fontTools.otlLib.builder import buildCoverage
+from fontTools.varLib import _add_HVAR
+from fontTools.varLib.builder import buildVarData, buildVarRegionList, buildVarStore
+from fontTools.varLib.interpolatableHelpers import (
+    min_cost_perfect_bipartite_matching_bruteforce,
+)
+from fontTools.varLib.iup import iup_delta_optimize
+from fontTools.varLib.merger import VariationMerger
+from fontTools.varLib.models import VariationModel
+import fontTools.varLib.varStore  # For monkey-patching
+import copy
+import math
+import random
+import timeit
+
+AXIS_TAGS = ["wght", "wdth", "opsz"]
+NUM_REGIONS = 20
+NUM_VARDATA = 16
+
+
+def generate_varstore(numRows):
+    supports = [
+        {random.choice(AXIS_TAGS): (0, random.choice([0.25, 0.5, 0.75, 1]), 1)}
+        for _ in range(NUM_REGIONS)
+    ]
+    regionList = buildVarRegionList(supports, AXIS_TAGS)
+    varDatas = []
+    for _ in range(NUM_VARDATA):
+        regionIndices = sorted(random.sample(range(NUM_REGIONS), random.randint(4, 10)))
+        # Deltas of a kerning pair at each region are roughly proportional.
+        factors = [
+            random.uniform(-1.5, 1.5) if random.random() < 0.8 else 0
+            for _ in regionIndices
+        ]
+        items = []
+        for _ in range(numRows // NUM_VARDATA):
+            v = random.gauss(0, 40)
+            items.append(
+                [round(v * f + random.gauss(0, 2)) if f else 0 for f in factors]
+            )
+        varDatas.append(buildVarData(regionIndices, items, optimize=False))
+    return buildVarStore(regionList, varDatas)
+
+
+def VarStore_optimize(store):
+    return store.optimize()
+
+
+def setup_VarStore_optimize_10k():
+    return (generate_varstore(10000),)
+
+
+def setup_VarStore_optimize_100k():
+    return (generate_varstore(100000),)
+
+
+def setup_VarStore_optimize_1M():
+    return (generate_varstore(1000000),)
+
+
+def generate_PairPos(numClasses, numMasters, glyphsPerClass=3):
+    """Return a font, and the class kerning subtable of each of its masters."""
+    numGlyphs = numClasses * glyphsPerClass
+    glyphs = ["glyph%05d" % i for i in range(numGlyphs)]
+    font = TTFont()
+    font.setGlyphOrder([".notdef"] + glyphs)
+    glyphMap = font.getReverseGlyphMap()
+    classDef1 = ot.ClassDef()
+    classDef1.classDefs = {g: i // glyphsPerClass for i, g in enumerate(glyphs)}
+    shuffled = random.sample(glyphs, numGlyphs)
+    classDef2 = ot.ClassDef()
+    classDef2.classDefs = {g: i // glyphsPerClass for i, g in enumerate(shuffled)}
+    # About a third of the class pairs are kerned, scaling with the weight.
+    kerns = [
+        [
+            random.randint(-150, 50) if c1 and c2 and random.random() < 0.3 else 0
+            for c2 in range(numClasses)
+        ]
+        for c1 in range(numClasses)
+    ]
+    scales = [1] + [random.uniform(0.5, 2) for _ in range(numMasters - 1)]
+    masters = []
+    for scale in scales:
+        self = ot.PairPos()
+        self.Format = 2
+        self.ValueFormat1 = 4  # XAdvance
+        self.ValueFormat2 = 0
+        self.Coverage = buildCoverage(glyphs, glyphMap)
+        self.ClassDef1 = copy.deepcopy(classDef1)
+        self.ClassDef2 = copy.deepcopy(classDef2)
+        self.Class1Count = self.Class2Count = numClasses
+        self.Class1Record = []
+        for row in kerns:
+            rec1 = ot.Class1Record()
+            rec1.Class2Record = []
+            for kern in row:
+                rec2 = ot.Class2Record()
+                rec2.Value1 = otBase.ValueRecord(4)
+                rec2.Value1.XAdvance = round(kern * scale)
+                rec2.Value2 = None
+                rec1.Class2Record.append(rec2)
+            self.Class1Record.append(rec1)
+        masters.append(self)
+    locations = [{}] + [{"wght": i / (numMasters - 1)} for i in range(1, numMasters)]
+    return font, VariationModel(locations), masters
+
+
+def merge_PairPos(merger, out, lst):
+    merger.lookup_subtables = [[l] for l in lst]
+    merger.mergeThings(out, lst)
+
+
+def setup_merge_PairPos():
+    font, model, masters = generate_PairPos(200, 20)
+    merger = VariationMerger(model, ["wght"], font)
+    return merger, copy.deepcopy(masters[0]), masters
+
+
+def generate_cost_matrix(n):
+    # Distances between the contour vectors of two masters, where each contour
+    # moved a little from one master to the other.
+    vectors = [[random.uniform(-500, 500) for _ in range(6)] for _ in range(n)]
+    moved = [[x + random.gauss(0, 50) for x in v] for v in vectors]
+    random.shuffle(moved)
+    return [
+        [sum((x - y) ** 2 for x, y in zip(v0, v1)) for v1 in moved] for v0 in vectors
+    ]
+
+
+def linear_sum_assignment_scipy(G):
+    from scipy.optimize import linear_sum_assignment
+
+    return linear_sum_assignment(G)
+
+
+def setup_min_cost_perfect_bipartite_matching_bruteforce():
+    return (generate_cost_matrix(6),)
+
+
+def setup_linearSumAssignment_6():
+    return (generate_cost_matrix(6),)
+
+
+def setup_linearSumAssignment_30():
+    return (generate_cost_matrix(30),)
+
+
+def setup_linearSumAssignment_200():
+    return (generate_cost_matrix(200),)
+
+
+def setup_linear_sum_assignment_scipy_6():
+    return (generate_cost_matrix(6),)
+
+
+def setup_linear_sum_assignment_scipy_30():
+    return (generate_cost_matrix(30),)
+
+
+def setup_linear_sum_assignment_scipy_200():
+    return (generate_cost_matrix(200),)
+
+
+def generate_glyph_deltas(numContours, numPoints):
+    """Return the deltas, coordinates and contour end points of a glyph whose
+    contours are roughly scaled and shifted, like between two masters."""
+    coords, deltas, ends = [], [], []
+    for _ in range(numContours):
+        cx, cy = random.uniform(0, 1000), random.uniform(0, 1000)
+        rx, ry = random.uniform(20, 300), random.uniform(20, 300)
+        sx, sy = random.uniform(-0.2, 0.2), random.uniform(-0.2, 0.2)
+        dx, dy = random.uniform(-20, 20), random.uniform(-20, 20)
+        for k in range(numPoints):
+            angle = 2 * math.pi * k / numPoints + random.gauss(0, 0.1)
+            x, y = cx + rx * math.cos(angle), cy + ry * math.sin(angle)
+            coords.append((round(x), round(y)))
+            deltas.append(
+                (
+                    round(dx + x * sx + random.gauss(0, 0.5)),
+                    round(dy + y * sy + random.gauss(0, 0.5)),
+                )
+            )
+        ends.append(len(coords) - 1)
+    coords.extend([(0, 0), (1000, 0), (0, 0), (0, 0)])
+    deltas.extend([(0, 0), (round(random.uniform(-50, 50)), 0), (0, 0), (0, 0)])
+    return deltas, coords, ends
+
+
+def iup_delta_optimize_glyphs(glyphs):
+    for deltas, coords, ends in glyphs:
+        iup_delta_optimize(deltas, coords, ends, tolerance=0.5)
+
+
+def iup_delta_optimize_glyphs_fast(glyphs):
+    for deltas, coords, ends in glyphs:
+        iup_delta_optimize(deltas, coords, ends, tolerance=0.5, fast=True)
+
+
+def setup_iup_delta_optimize_glyphs():
+    return ([generate_glyph_deltas(3, 30) for _ in range(500)],)
+
+
+setup_iup_delta_optimize_glyphs_fast = setup_iup_delta_optimize_glyphs
+
+
+def generate_hmtx_masters(numGlyphs, numMasters):
+    """Return a font, a model and the masters of a weight axis, whose glyphs
+    have either the same advance in all masters, like a CJK font, or one
+    scaling with the weight."""
+    glyphs = [".notdef"] + ["glyph%05d" % i for i in range(numGlyphs - 1)]
+    advances = [
+        1000 if random.random() < 0.6 else random.randint(200, 1200) for _ in glyphs
+    ]
+    scales = [1] + [random.uniform(0.8, 1.5) for _ in range(numMasters - 1)]
+    masters = []
+    for scale in scales:
+        master = TTFont()
+        master.setGlyphOrder(glyphs)
+        hmtx = master["hmtx"] = newTable("hmtx")
+        hmtx.metrics = {
+            glyph: (advance if advance == 1000 else round(advance * scale), 0)
+            for glyph, advance in zip(glyphs, advances)
+        }
+        masters.append(master)
+    locations = [{}] + [{"wght": i / (numMasters - 1)} for i in range(1, numMasters)]
+    font = TTFont()
+    font.setGlyphOrder(glyphs)
+    return font, VariationModel(locations), masters
+
+
+def add_HVAR(font, model, masters):
+    _add_HVAR(font, model, masters, ["wght"])
+
+
+def setup_add_HVAR():
+    return generate_hmtx_masters(65000, 5)
+
+
+def run_benchmark(function, setup_suffix="", repeat=3, number=1):
+    setup_func = "setup_" + function
+    if setup_suffix:
+        print("%s with %s:" % (function, setup_suffix), end="")
+        setup_func += "_" + setup_suffix
+    else:
+        print("%s:" % function, end="")
+
+    setup_func = globals()[setup_func]
+    function = globals()[function]
+    args = []
+
+    # The benchmarked functions modify their input, so set it up anew
+    # before each run.
+    def setup():
+        args[:] = setup_func()
+
+    def wrapped():
+        return function(*args)
+
+    results = timeit.repeat(wrapped, setup=setup, repeat=repeat, number=number)
+    print("\t%8.2fms" % (min(results) * 1000.0 / number))
+
+
+def main():
+    run_benchmark("VarStore_optimize", "10k")
+    run_benchmark("VarStore_optimize", "100k")
+    run_benchmark("VarStore_optimize", "1M", repeat=1)
+    run_benchmark("merge_PairPos", repeat=1)
+    try:
+        import scipy
+    except ImportError:
+        scipy = None
+    run_benchmark("min_cost_perfect_bipartite_matching_bruteforce", number=10)
+    for size in ("6", "30", "200"):
+        run_benchmark("linearSumAssignment", size, number=10)
+        if scipy is not None:
+            run_benchmark("linear_sum_assignment_scipy", size, number=10)
+    run_benchmark("iup_delta_optimize_glyphs")
+    run_benchmark("iup_delta_optimize_glyphs_fast")
+    run_benchmark("add_HVAR")
+
+
+if __name__ == "__main__":
+    random.seed(1)
+    main()
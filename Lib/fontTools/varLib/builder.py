@@ -76,14 +76,18 @@ def VarData_calculateNumShorts(self, optimize=False):
     count = self.VarRegionCount
     items = self.Item
     bit_lengths = [0] * count
-    for item in items:
-        # The "+ (i < -1)" magic is to handle two's-compliment.
-        # That is, we want to get back 7 for -128, whereas
-        # bit_length() returns 8. Similarly for -65536.
-        # The reason "i < -1" is used instead of "i < 0" is that
-        # the latter would make it return 0 for "-1" instead of 1.
-        bl = [(i + (i < -1)).bit_length() for i in item]
-        bit_lengths = [max(*pair) for pair in zip(bl, bit_lengths)]
+    # The "+ (i < -1)" magic is to handle two's-compliment.
+    # That is, we want to get back 7 for -128, whereas
+    # bit_length() returns 8. Similarly for -65536.
+    # The reason "i < -1" is used instead of "i < 0" is that
+    # the latter would make it return 0 for "-1" instead of 1.
+    # As this grows with the magnitude of i, only the smallest and
+    # largest value of each column need to be looked at.
+    for column, values in zip(range(count), zip(*items)):
+        lo, hi = min(values), max(values)
+        bit_lengths[column] = max(
+            (lo + (lo < -1)).bit_length(), (hi + (hi < -1)).bit_length()
+        )
     # The addition of 8, instead of seven, is to account for the sign bit.
     # This "((b + 8) >> 3) if b else 0" when combined with the above
     # "(i + (i < -1)).bit_length()" is a faster way to compute byte-lengths
@@ -122,6 +122,7 @@ from fontTools.cffLib.specializer import (
 )
 from fontTools.varLib import builder
 from fontTools.varLib.mvar import MVAR_ENTRIES
+from fontTools.varLib.iup import IUPGeometry
 from fontTools.varLib.merger import MutatorMerger
 from fontTools.varLib.instancer import names
 from .featureVars import instantiateFeatureVariations
@@ -880,7 +881,14 @@ def instantiateCFF2(
 
 
 def _instantiateGvarGlyph(
-    glyphname, glyf, gvar, hMetrics, vMetrics, axisLimits, optimize=True
+    glyphname,
+    glyf,
+    gvar,
+    hMetrics,
+    vMetrics,
+    axisLimits,
+    optimize=True,
+    fastIUP=False,
 ):
     coordinates, ctrl = glyf._getCoordinatesAndControls(glyphname, hMetrics, vMetrics)
     endPts = ctrl.endPts
@@ -924,12 +932,19 @@ def _instantiateGvarGlyph(
         coordinates.toInt()
 
         isComposite = glyf[glyphname].isComposite()
+        geometry = IUPGeometry(coordinates, endPts)
 
         for var in tupleVarStore:
-            var.optimize(coordinates, endPts, isComposite=isComposite)
+            var.optimize(
+                coordinates,
+                endPts,
+                isComposite=isComposite,
+                fast=fastIUP,
+                geometry=geometry,
+            )
 
 
-def instantiateGvarGlyph(varfont, glyphname, axisLimits, optimize=True):
+def instantiateGvarGlyph(varfont, glyphname, axisLimits, optimize=True, fastIUP=False):
     """Remove?
     https://github.com/fonttools/fonttools/pull/2266"""
     gvar = varfont["gvar"]
@@ -937,11 +952,18 @@ def instantiateGvarGlyph(varfont, glyphname, axisLimits, optimize=True):
     hMetrics = varfont["hmtx"].metrics
     vMetrics = getattr(varfont.get("vmtx"), "metrics", None)
     _instantiateGvarGlyph(
-        glyphname, glyf, gvar, hMetrics, vMetrics, axisLimits, optimize=optimize
+        glyphname,
+        glyf,
+        gvar,
+        hMetrics,
+        vMetrics,
+        axisLimits,
+        optimize=optimize,
+        fastIUP=fastIUP,
     )
 
 
-def instantiateGvar(varfont, axisLimits, optimize=True):
+def instantiateGvar(varfont, axisLimits, optimize=True, fastIUP=False):
     log.info("Instantiating glyf/gvar tables")
 
     gvar = varfont["gvar"]
@@ -965,7 +987,14 @@ def instantiateGvar(varfont, axisLimits, optimize=True):
     )
     for glyphname in glyphnames:
         _instantiateGvarGlyph(
-            glyphname, glyf, gvar, hMetrics, vMetrics, axisLimits, optimize=optimize
+            glyphname,
+            glyf,
+            gvar,
+            hMetrics,
+            vMetrics,
+            axisLimits,
+            optimize=optimize,
+            fastIUP=fastIUP,
         )
 
     if not gvar.variations:
@@ -1577,6 +1606,7 @@ def instantiateVariableFont(
     updateFontNames=False,
     *,
     downgradeCFF2=False,
+    fastIUP=False,
 ):
     """Instantiate variable font, either fully or partially.
 
@@ -1620,6 +1650,9 @@ def instantiateVariableFont(
             software that does not support CFF2. Defaults to False. Note that this
             operation also removes overlaps within glyph shapes, as CFF does not support
             overlaps but CFF2 does.
+        fastIUP (bool): if True, use a greedy heuristic for the IUP-delta optimization
+            of the remaining 'gvar' table's deltas. Several times faster, at the cost
+            of a slightly larger file size.
     """
     # 'overlap' used to be bool and is now enum; for backward compat keep accepting bool
     overlap = OverlapMode(int(overlap))
@@ -1651,7 +1684,7 @@ def instantiateVariableFont(
         instantiateCFF2(varfont, normalizedLimits, downgrade=downgradeCFF2)
 
     if "gvar" in varfont:
-        instantiateGvar(varfont, normalizedLimits, optimize=optimize)
+        instantiateGvar(varfont, normalizedLimits, optimize=optimize, fastIUP=fastIUP)
 
     if "cvar" in varfont:
         instantiateCvar(varfont, normalizedLimits)
@@ -1815,6 +1848,13 @@ def parseArgs(args):
         action="store_false",
         help="Don't perform IUP optimization on the remaining gvar TupleVariations",
     )
+    parser.add_argument(
+        "--fast-iup",
+        dest="fast_iup",
+        action="store_true",
+        help="Use a faster IUP optimization, at the cost of slightly bigger gvar "
+        "TupleVariations",
+    )
     parser.add_argument(
         "--no-overlap-flag",
         dest="overlap",
@@ -1920,6 +1960,7 @@ def main(args=None):
         overlap=options.overlap,
         updateFontNames=options.update_name_table,
         downgradeCFF2=options.downgrade_cff2,
+        fastIUP=options.fast_iup,
     )
 
     suffix = "-instance" if isFullInstance else "-partial"
@@ -20,12 +20,18 @@ from fontTools.pens.momentsPen import OpenContourError
 from fontTools.varLib.models import piecewiseLinearMap, normalizeLocation
 from fontTools.misc.fixedTools import floatToFixedToStr
 from fontTools.misc.transform import Transform
-from collections import defaultdict
+from fontTools.misc.cliTools import cpuCount
+from collections import ChainMap, defaultdict
+from contextlib import closing
 from types import SimpleNamespace
 from functools import wraps
 from pprint import pformat
 from math import sqrt, atan2, pi
+import fontTools
+import hashlib
+import json
 import logging
+import multiprocessing as mp
 import os
 
 log = logging.getLogger("fontTools.varLib.interpolatable")
@@ -49,18 +55,28 @@ class Glyph:
         "openContours",
     )
 
-    def __init__(self, glyphname, glyphset):
+    # Items that only depend on the glyph outline, and can be cached across runs.
+    CACHED_ITEMS = (
+        "greenVectors",
+        "controlVectors",
+        "nodeTypes",
+        "isomorphisms",
+        "points",
+        "openContours",
+    )
+
+    def __init__(self, glyphname, glyphset, cache=None):
         self.name = glyphname
         for item in self.ITEMS:
             setattr(self, item, [])
-        self._populate(glyphset)
+        self._populate(glyphset, cache)
 
     def _fill_in(self, ix):
         for item in self.ITEMS:
             if len(getattr(self, item)) == ix:
                 getattr(self, item).append(None)
 
-    def _populate(self, glyphset):
+    def _populate(self, glyphset, cache=None):
         glyph = glyphset[self.name]
         self.doesnt_exist = glyph is None
         if self.doesnt_exist:
@@ -74,6 +90,19 @@ class Glyph:
         self.recordings = perContourPen.value
         del perContourPen
 
+        if cache is not None:
+            key = self._cache_key(glyph, glyphset)
+            cached = cache.get(key)
+            if cached is not None:
+                # Mark the entry as used in this run; see test_gen.
+                cache[key] = cached
+                for item, value in zip(self.CACHED_ITEMS, cached):
+                    setattr(self, item, value)
+                # The statistics pens are not cached; only their vectors are.
+                self.greenStats = [None] * len(self.recordings)
+                self.controlStats = [None] * len(self.recordings)
+                return
+
         for ix, contour in enumerate(self.recordings):
             nodeTypes = [op for op, arg in contour.value]
             self.nodeTypes.append(nodeTypes)
@@ -116,6 +145,23 @@ class Glyph:
             # Add mirrored rotations
             add_isomorphisms(points.value, isomorphisms, True)
 
+        if cache is not None:
+            cache[key] = tuple(getattr(self, item) for item in self.CACHED_ITEMS)
+
+    def _cache_key(self, glyph, glyphset):
+        # The statistics only depend on the outline, so key them by its hash.
+        # Components are hashed along with the outlines they resolve to.
+        data = [contour.value for contour in self.recordings]
+        if any(
+            op == "addComponent"
+            for contour in self.recordings
+            for op, _ in contour.value
+        ):
+            pen = DecomposingRecordingPen(glyphset, skipMissingComponents=True)
+            glyph.draw(pen)
+            data.append(pen.value)
+        return hashlib.sha256(repr(data).encode("utf-8")).hexdigest()
+
     def draw(self, pen, countor_idx=None):
         if countor_idx is None:
             for contour in self.recordings:
@@ -136,7 +182,19 @@ def test_gen(
     upem=DEFAULT_UPEM,
     show_all=False,
     discrete_axes=[],
+    jobs=1,
+    cache=None,
 ):
+    """Yield (glyphname, problem) pairs for the interpolation problems found
+    between the glyphsets.
+
+    If ``jobs`` is greater than one, glyphs are tested in that many worker
+    processes. If ``cache`` is a dict, the per-master glyph statistics are
+    looked up in it by outline hash, and newly computed ones are added to it;
+    see ``load_cache`` and ``save_cache``. Once all glyphs are tested, the
+    entries that were not used are removed from it, so that the statistics of
+    outlines that were since modified do not pile up.
+    """
     if tolerance >= 10:
         tolerance *= 0.01
     assert 0 <= tolerance <= 1
@@ -155,432 +213,511 @@ def test_gen(
         glyphsets, locations, discrete_axes=discrete_axes
     )
 
-    def grand_parent(i, glyphname):
-        if i is None:
-            return None
+    options = dict(
+        ignore_missing=ignore_missing,
+        tolerance=tolerance,
+        kinkiness=kinkiness,
+        upem=upem,
+        show_all=show_all,
+    )
+
+    # Statistics looked up or computed in this run go to the first map.
+    usedCache = ChainMap({}, cache) if cache is not None else None
+
+    if jobs > 1:
+        # Glyphs are tested in worker processes, in chunks; their problems
+        # are yielded in the same order as when testing serially.
+        log.info("Running %d parallel processes", jobs)
+        glyphs = list(glyphs)
+        pool = mp.Pool(
+            jobs,
+            initializer=_init_test_glyph_worker,
+            initargs=(glyphsets, names, parents, order, cache, options),
+        )
+        chunksize = max(1, min(64, len(glyphs) // (jobs * 4)))
+        with closing(pool):
+            for problems, cached, used in pool.imap(
+                _test_glyph_worker, glyphs, chunksize
+            ):
+                if cache is not None:
+                    usedCache.maps[0].update(cached)
+                    usedCache.maps[0].update((key, cache[key]) for key in used)
+                yield from problems
+    else:
+        for glyph_name in glyphs:
+            yield from _test_glyph(
+                glyph_name, glyphsets, names, parents, order, usedCache, **options
+            )
+
+    if cache is not None:
+        cache.clear()
+        cache.update(usedCache.maps[0])
+
+
+def _grand_parent(i, glyphname, glyphsets, parents):
+    if i is None:
+        return None
+    i = parents[i]
+    if i is None:
+        return None
+    while parents[i] is not None and glyphsets[i][glyphname] is None:
         i = parents[i]
-        if i is None:
-            return None
-        while parents[i] is not None and glyphsets[i][glyphname] is None:
-            i = parents[i]
-        return i
-
-    for glyph_name in glyphs:
-        log.info("Testing glyph %s", glyph_name)
-        allGlyphs = [Glyph(glyph_name, glyphset) for glyphset in glyphsets]
-        if len([1 for glyph in allGlyphs if glyph is not None]) <= 1:
-            continue
-        for master_idx, (glyph, glyphset, name) in enumerate(
-            zip(allGlyphs, glyphsets, names)
-        ):
-            if glyph.doesnt_exist:
-                if not ignore_missing:
-                    yield (
-                        glyph_name,
-                        {
-                            "type": InterpolatableProblem.MISSING,
-                            "master": name,
-                            "master_idx": master_idx,
-                        },
-                    )
-                continue
+    return i
 
-            has_open = False
-            for ix, open in enumerate(glyph.openContours):
-                if not open:
-                    continue
-                has_open = True
+
+_test_glyph_worker_args = None
+
+
+def _init_test_glyph_worker(glyphsets, names, parents, order, cache, options):
+    global _test_glyph_worker_args
+    # Statistics computed by the worker go to the first map, to be sent back.
+    cache = ChainMap({}, cache) if cache is not None else None
+    _test_glyph_worker_args = (glyphsets, names, parents, order, cache, options)
+
+
+def _test_glyph_worker(glyph_name):
+    glyphsets, names, parents, order, cache, options = _test_glyph_worker_args
+    problems = list(
+        _test_glyph(glyph_name, glyphsets, names, parents, order, cache, **options)
+    )
+    # Send back the new statistics, and the keys of the ones looked up.
+    cached = {}
+    used = []
+    if cache is not None:
+        for key, value in cache.maps[0].items():
+            if key in cache.maps[1]:
+                used.append(key)
+            else:
+                cached[key] = value
+        cache.maps[0].clear()
+    return problems, cached, used
+
+
+def _test_glyph(
+    glyph_name,
+    glyphsets,
+    names,
+    parents,
+    order,
+    cache,
+    *,
+    ignore_missing,
+    tolerance,
+    kinkiness,
+    upem,
+    show_all,
+):
+    log.info("Testing glyph %s", glyph_name)
+    allGlyphs = [Glyph(glyph_name, glyphset, cache) for glyphset in glyphsets]
+    if len([1 for glyph in allGlyphs if glyph is not None]) <= 1:
+        return
+    for master_idx, (glyph, glyphset, name) in enumerate(
+        zip(allGlyphs, glyphsets, names)
+    ):
+        if glyph.doesnt_exist:
+            if not ignore_missing:
                 yield (
                     glyph_name,
                     {
-                        "type": InterpolatableProblem.OPEN_PATH,
+                        "type": InterpolatableProblem.MISSING,
                         "master": name,
                         "master_idx": master_idx,
-                        "contour": ix,
                     },
                 )
-            if has_open:
-                continue
-
-        matchings = [None] * len(glyphsets)
+            continue
 
-        for m1idx in order:
-            glyph1 = allGlyphs[m1idx]
-            if glyph1 is None or not glyph1.nodeTypes:
-                continue
-            m0idx = grand_parent(m1idx, glyph_name)
-            if m0idx is None:
-                continue
-            glyph0 = allGlyphs[m0idx]
-            if glyph0 is None or not glyph0.nodeTypes:
+        has_open = False
+        for ix, open in enumerate(glyph.openContours):
+            if not open:
                 continue
+            has_open = True
+            yield (
+                glyph_name,
+                {
+                    "type": InterpolatableProblem.OPEN_PATH,
+                    "master": name,
+                    "master_idx": master_idx,
+                    "contour": ix,
+                },
+            )
+        if has_open:
+            continue
 
-            #
-            # Basic compatibility checks
-            #
+    matchings = [None] * len(glyphsets)
 
-            m1 = glyph0.nodeTypes
-            m0 = glyph1.nodeTypes
-            if len(m0) != len(m1):
-                yield (
-                    glyph_name,
-                    {
-                        "type": InterpolatableProblem.PATH_COUNT,
-                        "master_1": names[m0idx],
-                        "master_2": names[m1idx],
-                        "master_1_idx": m0idx,
-                        "master_2_idx": m1idx,
-                        "value_1": len(m0),
-                        "value_2": len(m1),
-                    },
-                )
-                continue
+    for m1idx in order:
+        glyph1 = allGlyphs[m1idx]
+        if glyph1 is None or not glyph1.nodeTypes:
+            continue
+        m0idx = _grand_parent(m1idx, glyph_name, glyphsets, parents)
+        if m0idx is None:
+            continue
+        glyph0 = allGlyphs[m0idx]
+        if glyph0 is None or not glyph0.nodeTypes:
+            continue
 
-            if m0 != m1:
-                for pathIx, (nodes1, nodes2) in enumerate(zip(m0, m1)):
-                    if nodes1 == nodes2:
-                        continue
-                    if len(nodes1) != len(nodes2):
+        #
+        # Basic compatibility checks
+        #
+
+        m1 = glyph0.nodeTypes
+        m0 = glyph1.nodeTypes
+        if len(m0) != len(m1):
+            yield (
+                glyph_name,
+                {
+                    "type": InterpolatableProblem.PATH_COUNT,
+                    "master_1": names[m0idx],
+                    "master_2": names[m1idx],
+                    "master_1_idx": m0idx,
+                    "master_2_idx": m1idx,
+                    "value_1": len(m0),
+                    "value_2": len(m1),
+                },
+            )
+            continue
+
+        if m0 != m1:
+            for pathIx, (nodes1, nodes2) in enumerate(zip(m0, m1)):
+                if nodes1 == nodes2:
+                    continue
+                if len(nodes1) != len(nodes2):
+                    yield (
+                        glyph_name,
+                        {
+                            "type": InterpolatableProblem.NODE_COUNT,
+                            "path": pathIx,
+                            "master_1": names[m0idx],
+                            "master_2": names[m1idx],
+                            "master_1_idx": m0idx,
+                            "master_2_idx": m1idx,
+                            "value_1": len(nodes1),
+                            "value_2": len(nodes2),
+                        },
+                    )
+                    continue
+                for nodeIx, (n1, n2) in enumerate(zip(nodes1, nodes2)):
+                    if n1 != n2:
                         yield (
                             glyph_name,
                             {
-                                "type": InterpolatableProblem.NODE_COUNT,
+                                "type": InterpolatableProblem.NODE_INCOMPATIBILITY,
                                 "path": pathIx,
+                                "node": nodeIx,
                                 "master_1": names[m0idx],
                                 "master_2": names[m1idx],
                                 "master_1_idx": m0idx,
                                 "master_2_idx": m1idx,
-                                "value_1": len(nodes1),
-                                "value_2": len(nodes2),
+                                "value_1": n1,
+                                "value_2": n2,
                             },
                         )
                         continue
-                    for nodeIx, (n1, n2) in enumerate(zip(nodes1, nodes2)):
-                        if n1 != n2:
-                            yield (
-                                glyph_name,
-                                {
-                                    "type": InterpolatableProblem.NODE_INCOMPATIBILITY,
-                                    "path": pathIx,
-                                    "node": nodeIx,
-                                    "master_1": names[m0idx],
-                                    "master_2": names[m1idx],
-                                    "master_1_idx": m0idx,
-                                    "master_2_idx": m1idx,
-                                    "value_1": n1,
-                                    "value_2": n2,
-                                },
-                            )
-                            continue
 
-            #
-            # InterpolatableProblem.CONTOUR_ORDER check
-            #
+        #
+        # InterpolatableProblem.CONTOUR_ORDER check
+        #
+
+        this_tolerance, matching = test_contour_order(glyph0, glyph1)
+        if this_tolerance < tolerance:
+            yield (
+                glyph_name,
+                {
+                    "type": InterpolatableProblem.CONTOUR_ORDER,
+                    "master_1": names[m0idx],
+                    "master_2": names[m1idx],
+                    "master_1_idx": m0idx,
+                    "master_2_idx": m1idx,
+                    "value_1": list(range(len(matching))),
+                    "value_2": matching,
+                    "tolerance": this_tolerance,
+                },
+            )
+            matchings[m1idx] = matching
+
+        #
+        # wrong-start-point / weight check
+        #
+
+        m0Isomorphisms = glyph0.isomorphisms
+        m1Isomorphisms = glyph1.isomorphisms
+        m0Vectors = glyph0.greenVectors
+        m1Vectors = glyph1.greenVectors
+        recording0 = glyph0.recordings
+        recording1 = glyph1.recordings
+
+        # If contour-order is wrong, adjust it
+        matching = matchings[m1idx]
+        if matching is not None and m1Isomorphisms:  # m1 is empty for composite glyphs
+            m1Isomorphisms = [m1Isomorphisms[i] for i in matching]
+            m1Vectors = [m1Vectors[i] for i in matching]
+            recording1 = [recording1[i] for i in matching]
+
+        midRecording = []
+        for c0, c1 in zip(recording0, recording1):
+            try:
+                r = RecordingPen()
+                r.value = list(lerpRecordings(c0.value, c1.value))
+                midRecording.append(r)
+            except ValueError:
+                # Mismatch because of the reordering above
+                midRecording.append(None)
+
+        for ix, (contour0, contour1) in enumerate(zip(m0Isomorphisms, m1Isomorphisms)):
+            if (
+                contour0 is None
+                or contour1 is None
+                or len(contour0) == 0
+                or len(contour0) != len(contour1)
+            ):
+                # We already reported this; or nothing to do; or not compatible
+                # after reordering above.
+                continue
+
+            this_tolerance, proposed_point, reverse = test_starting_point(
+                glyph0, glyph1, ix, tolerance, matching
+            )
 
-            this_tolerance, matching = test_contour_order(glyph0, glyph1)
             if this_tolerance < tolerance:
                 yield (
                     glyph_name,
                     {
-                        "type": InterpolatableProblem.CONTOUR_ORDER,
+                        "type": InterpolatableProblem.WRONG_START_POINT,
+                        "contour": ix,
                         "master_1": names[m0idx],
                         "master_2": names[m1idx],
                         "master_1_idx": m0idx,
                         "master_2_idx": m1idx,
-                        "value_1": list(range(len(matching))),
-                        "value_2": matching,
+                        "value_1": 0,
+                        "value_2": proposed_point,
+                        "reversed": reverse,
                         "tolerance": this_tolerance,
                     },
                 )
-                matchings[m1idx] = matching
 
+            # Weight check.
             #
-            # wrong-start-point / weight check
+            # If contour could be mid-interpolated, and the two
+            # contours have the same area sign, proceeed.
             #
-
-            m0Isomorphisms = glyph0.isomorphisms
-            m1Isomorphisms = glyph1.isomorphisms
-            m0Vectors = glyph0.greenVectors
-            m1Vectors = glyph1.greenVectors
-            recording0 = glyph0.recordings
-            recording1 = glyph1.recordings
-
-            # If contour-order is wrong, adjust it
-            matching = matchings[m1idx]
-            if (
-                matching is not None and m1Isomorphisms
-            ):  # m1 is empty for composite glyphs
-                m1Isomorphisms = [m1Isomorphisms[i] for i in matching]
-                m1Vectors = [m1Vectors[i] for i in matching]
-                recording1 = [recording1[i] for i in matching]
-
-            midRecording = []
-            for c0, c1 in zip(recording0, recording1):
-                try:
-                    r = RecordingPen()
-                    r.value = list(lerpRecordings(c0.value, c1.value))
-                    midRecording.append(r)
-                except ValueError:
-                    # Mismatch because of the reordering above
-                    midRecording.append(None)
-
-            for ix, (contour0, contour1) in enumerate(
-                zip(m0Isomorphisms, m1Isomorphisms)
-            ):
-                if (
-                    contour0 is None
-                    or contour1 is None
-                    or len(contour0) == 0
-                    or len(contour0) != len(contour1)
+            # The sign difference can happen if it's a weirdo
+            # self-intersecting contour; ignore it.
+            contour = midRecording[ix]
+
+            if contour and (m0Vectors[ix][0] < 0) == (m1Vectors[ix][0] < 0):
+                midStats = StatisticsPen(glyphset=None)
+                contour.replay(midStats)
+
+                midVector = contour_vector_from_stats(midStats)
+
+                m0Vec = m0Vectors[ix]
+                m1Vec = m1Vectors[ix]
+                size0 = m0Vec[0] * m0Vec[0]
+                size1 = m1Vec[0] * m1Vec[0]
+                midSize = midVector[0] * midVector[0]
+
+                for overweight, problem_type in enumerate(
+                    (
+                        InterpolatableProblem.UNDERWEIGHT,
+                        InterpolatableProblem.OVERWEIGHT,
+                    )
                 ):
-                    # We already reported this; or nothing to do; or not compatible
-                    # after reordering above.
-                    continue
-
-                this_tolerance, proposed_point, reverse = test_starting_point(
-                    glyph0, glyph1, ix, tolerance, matching
-                )
+                    if overweight:
+                        expectedSize = max(size0, size1)
+                        continue
+                    else:
+                        expectedSize = sqrt(size0 * size1)
 
-                if this_tolerance < tolerance:
-                    yield (
-                        glyph_name,
-                        {
-                            "type": InterpolatableProblem.WRONG_START_POINT,
-                            "contour": ix,
-                            "master_1": names[m0idx],
-                            "master_2": names[m1idx],
-                            "master_1_idx": m0idx,
-                            "master_2_idx": m1idx,
-                            "value_1": 0,
-                            "value_2": proposed_point,
-                            "reversed": reverse,
-                            "tolerance": this_tolerance,
-                        },
+                    log.debug(
+                        "%s: actual size %g; threshold size %g, master sizes: %g, %g",
+                        problem_type,
+                        midSize,
+                        expectedSize,
+                        size0,
+                        size1,
                     )
 
-                # Weight check.
-                #
-                # If contour could be mid-interpolated, and the two
-                # contours have the same area sign, proceeed.
-                #
-                # The sign difference can happen if it's a weirdo
-                # self-intersecting contour; ignore it.
-                contour = midRecording[ix]
-
-                if contour and (m0Vectors[ix][0] < 0) == (m1Vectors[ix][0] < 0):
-                    midStats = StatisticsPen(glyphset=None)
-                    contour.replay(midStats)
-
-                    midVector = contour_vector_from_stats(midStats)
-
-                    m0Vec = m0Vectors[ix]
-                    m1Vec = m1Vectors[ix]
-                    size0 = m0Vec[0] * m0Vec[0]
-                    size1 = m1Vec[0] * m1Vec[0]
-                    midSize = midVector[0] * midVector[0]
-
-                    for overweight, problem_type in enumerate(
-                        (
-                            InterpolatableProblem.UNDERWEIGHT,
-                            InterpolatableProblem.OVERWEIGHT,
-                        )
-                    ):
-                        if overweight:
-                            expectedSize = max(size0, size1)
-                            continue
-                        else:
-                            expectedSize = sqrt(size0 * size1)
-
-                        log.debug(
-                            "%s: actual size %g; threshold size %g, master sizes: %g, %g",
-                            problem_type,
-                            midSize,
-                            expectedSize,
-                            size0,
-                            size1,
+                    if (
+                        not overweight and expectedSize * tolerance > midSize + 1e-5
+                    ) or (overweight and 1e-5 + expectedSize / tolerance < midSize):
+                        try:
+                            if overweight:
+                                this_tolerance = expectedSize / midSize
+                            else:
+                                this_tolerance = midSize / expectedSize
+                        except ZeroDivisionError:
+                            this_tolerance = 0
+                        log.debug("tolerance %g", this_tolerance)
+                        yield (
+                            glyph_name,
+                            {
+                                "type": problem_type,
+                                "contour": ix,
+                                "master_1": names[m0idx],
+                                "master_2": names[m1idx],
+                                "master_1_idx": m0idx,
+                                "master_2_idx": m1idx,
+                                "tolerance": this_tolerance,
+                            },
                         )
 
-                        if (
-                            not overweight and expectedSize * tolerance > midSize + 1e-5
-                        ) or (overweight and 1e-5 + expectedSize / tolerance < midSize):
-                            try:
-                                if overweight:
-                                    this_tolerance = expectedSize / midSize
-                                else:
-                                    this_tolerance = midSize / expectedSize
-                            except ZeroDivisionError:
-                                this_tolerance = 0
-                            log.debug("tolerance %g", this_tolerance)
-                            yield (
-                                glyph_name,
-                                {
-                                    "type": problem_type,
-                                    "contour": ix,
-                                    "master_1": names[m0idx],
-                                    "master_2": names[m1idx],
-                                    "master_1_idx": m0idx,
-                                    "master_2_idx": m1idx,
-                                    "tolerance": this_tolerance,
-                                },
-                            )
+        #
+        # "kink" detector
+        #
+        m0 = glyph0.points
+        m1 = glyph1.points
 
-            #
-            # "kink" detector
-            #
-            m0 = glyph0.points
-            m1 = glyph1.points
+        # If contour-order is wrong, adjust it
+        if matchings[m1idx] is not None and m1:  # m1 is empty for composite glyphs
+            m1 = [m1[i] for i in matchings[m1idx]]
 
-            # If contour-order is wrong, adjust it
-            if matchings[m1idx] is not None and m1:  # m1 is empty for composite glyphs
-                m1 = [m1[i] for i in matchings[m1idx]]
+        t = 0.1  # ~sin(radian(6)) for tolerance 0.95
+        deviation_threshold = (
+            upem * DEFAULT_KINKINESS_LENGTH * DEFAULT_KINKINESS / kinkiness
+        )
 
-            t = 0.1  # ~sin(radian(6)) for tolerance 0.95
-            deviation_threshold = (
-                upem * DEFAULT_KINKINESS_LENGTH * DEFAULT_KINKINESS / kinkiness
-            )
+        for ix, (contour0, contour1) in enumerate(zip(m0, m1)):
+            if (
+                contour0 is None
+                or contour1 is None
+                or len(contour0) == 0
+                or len(contour0) != len(contour1)
+            ):
+                # We already reported this; or nothing to do; or not compatible
+                # after reordering above.
+                continue
 
-            for ix, (contour0, contour1) in enumerate(zip(m0, m1)):
-                if (
-                    contour0 is None
-                    or contour1 is None
-                    or len(contour0) == 0
-                    or len(contour0) != len(contour1)
-                ):
-                    # We already reported this; or nothing to do; or not compatible
-                    # after reordering above.
+            # Walk the contour, keeping track of three consecutive points, with
+            # middle one being an on-curve. If the three are co-linear then
+            # check for kinky-ness.
+            for i in range(len(contour0)):
+                pt0 = contour0[i]
+                pt1 = contour1[i]
+                if not pt0[1] or not pt1[1]:
+                    # Skip off-curves
                     continue
+                pt0_prev = contour0[i - 1]
+                pt1_prev = contour1[i - 1]
+                pt0_next = contour0[(i + 1) % len(contour0)]
+                pt1_next = contour1[(i + 1) % len(contour1)]
 
-                # Walk the contour, keeping track of three consecutive points, with
-                # middle one being an on-curve. If the three are co-linear then
-                # check for kinky-ness.
-                for i in range(len(contour0)):
-                    pt0 = contour0[i]
-                    pt1 = contour1[i]
-                    if not pt0[1] or not pt1[1]:
-                        # Skip off-curves
-                        continue
-                    pt0_prev = contour0[i - 1]
-                    pt1_prev = contour1[i - 1]
-                    pt0_next = contour0[(i + 1) % len(contour0)]
-                    pt1_next = contour1[(i + 1) % len(contour1)]
-
-                    if pt0_prev[1] and pt1_prev[1]:
-                        # At least one off-curve is required
-                        continue
-                    if pt0_prev[1] and pt1_prev[1]:
-                        # At least one off-curve is required
-                        continue
-
-                    pt0 = complex(*pt0[0])
-                    pt1 = complex(*pt1[0])
-                    pt0_prev = complex(*pt0_prev[0])
-                    pt1_prev = complex(*pt1_prev[0])
-                    pt0_next = complex(*pt0_next[0])
-                    pt1_next = complex(*pt1_next[0])
-
-                    # We have three consecutive points. Check whether
-                    # they are colinear.
-                    d0_prev = pt0 - pt0_prev
-                    d0_next = pt0_next - pt0
-                    d1_prev = pt1 - pt1_prev
-                    d1_next = pt1_next - pt1
-
-                    sin0 = d0_prev.real * d0_next.imag - d0_prev.imag * d0_next.real
-                    sin1 = d1_prev.real * d1_next.imag - d1_prev.imag * d1_next.real
-                    try:
-                        sin0 /= abs(d0_prev) * abs(d0_next)
-                        sin1 /= abs(d1_prev) * abs(d1_next)
-                    except ZeroDivisionError:
-                        continue
-
-                    if abs(sin0) > t or abs(sin1) > t:
-                        # Not colinear / not smooth.
-                        continue
+                if pt0_prev[1] and pt1_prev[1]:
+                    # At least one off-curve is required
+                    continue
+                if pt0_prev[1] and pt1_prev[1]:
+                    # At least one off-curve is required
+                    continue
 
-                    # Check the mid-point is actually, well, in the middle.
-                    dot0 = d0_prev.real * d0_next.real + d0_prev.imag * d0_next.imag
-                    dot1 = d1_prev.real * d1_next.real + d1_prev.imag * d1_next.imag
-                    if dot0 < 0 or dot1 < 0:
-                        # Sharp corner.
-                        continue
+                pt0 = complex(*pt0[0])
+                pt1 = complex(*pt1[0])
+                pt0_prev = complex(*pt0_prev[0])
+                pt1_prev = complex(*pt1_prev[0])
+                pt0_next = complex(*pt0_next[0])
+                pt1_next = complex(*pt1_next[0])
+
+                # We have three consecutive points. Check whether
+                # they are colinear.
+                d0_prev = pt0 - pt0_prev
+                d0_next = pt0_next - pt0
+                d1_prev = pt1 - pt1_prev
+                d1_next = pt1_next - pt1
+
+                sin0 = d0_prev.real * d0_next.imag - d0_prev.imag * d0_next.real
+                sin1 = d1_prev.real * d1_next.imag - d1_prev.imag * d1_next.real
+                try:
+                    sin0 /= abs(d0_prev) * abs(d0_next)
+                    sin1 /= abs(d1_prev) * abs(d1_next)
+                except ZeroDivisionError:
+                    continue
 
-                    # Fine, if handle ratios are similar...
-                    r0 = abs(d0_prev) / (abs(d0_prev) + abs(d0_next))
-                    r1 = abs(d1_prev) / (abs(d1_prev) + abs(d1_next))
-                    r_diff = abs(r0 - r1)
-                    if abs(r_diff) < t:
-                        # Smooth enough.
-                        continue
+                if abs(sin0) > t or abs(sin1) > t:
+                    # Not colinear / not smooth.
+                    continue
 
-                    mid = (pt0 + pt1) / 2
-                    mid_prev = (pt0_prev + pt1_prev) / 2
-                    mid_next = (pt0_next + pt1_next) / 2
+                # Check the mid-point is actually, well, in the middle.
+                dot0 = d0_prev.real * d0_next.real + d0_prev.imag * d0_next.imag
+                dot1 = d1_prev.real * d1_next.real + d1_prev.imag * d1_next.imag
+                if dot0 < 0 or dot1 < 0:
+                    # Sharp corner.
+                    continue
 
-                    mid_d0 = mid - mid_prev
-                    mid_d1 = mid_next - mid
+                # Fine, if handle ratios are similar...
+                r0 = abs(d0_prev) / (abs(d0_prev) + abs(d0_next))
+                r1 = abs(d1_prev) / (abs(d1_prev) + abs(d1_next))
+                r_diff = abs(r0 - r1)
+                if abs(r_diff) < t:
+                    # Smooth enough.
+                    continue
 
-                    sin_mid = mid_d0.real * mid_d1.imag - mid_d0.imag * mid_d1.real
-                    try:
-                        sin_mid /= abs(mid_d0) * abs(mid_d1)
-                    except ZeroDivisionError:
-                        continue
+                mid = (pt0 + pt1) / 2
+                mid_prev = (pt0_prev + pt1_prev) / 2
+                mid_next = (pt0_next + pt1_next) / 2
 
-                    # ...or if the angles are similar.
-                    if abs(sin_mid) * (tolerance * kinkiness) <= t:
-                        # Smooth enough.
-                        continue
+                mid_d0 = mid - mid_prev
+                mid_d1 = mid_next - mid
 
-                    # How visible is the kink?
+                sin_mid = mid_d0.real * mid_d1.imag - mid_d0.imag * mid_d1.real
+                try:
+                    sin_mid /= abs(mid_d0) * abs(mid_d1)
+                except ZeroDivisionError:
+                    continue
 
-                    cross = sin_mid * abs(mid_d0) * abs(mid_d1)
-                    arc_len = abs(mid_d0 + mid_d1)
-                    deviation = abs(cross / arc_len)
-                    if deviation < deviation_threshold:
-                        continue
-                    deviation_ratio = deviation / arc_len
-                    if deviation_ratio > t:
-                        continue
+                # ...or if the angles are similar.
+                if abs(sin_mid) * (tolerance * kinkiness) <= t:
+                    # Smooth enough.
+                    continue
 
-                    this_tolerance = t / (abs(sin_mid) * kinkiness)
+                # How visible is the kink?
 
-                    log.debug(
-                        "kink: deviation %g; deviation_ratio %g; sin_mid %g; r_diff %g",
-                        deviation,
-                        deviation_ratio,
-                        sin_mid,
-                        r_diff,
-                    )
-                    log.debug("tolerance %g", this_tolerance)
-                    yield (
-                        glyph_name,
-                        {
-                            "type": InterpolatableProblem.KINK,
-                            "contour": ix,
-                            "master_1": names[m0idx],
-                            "master_2": names[m1idx],
-                            "master_1_idx": m0idx,
-                            "master_2_idx": m1idx,
-                            "value": i,
-                            "tolerance": this_tolerance,
-                        },
-                    )
+                cross = sin_mid * abs(mid_d0) * abs(mid_d1)
+                arc_len = abs(mid_d0 + mid_d1)
+                deviation = abs(cross / arc_len)
+                if deviation < deviation_threshold:
+                    continue
+                deviation_ratio = deviation / arc_len
+                if deviation_ratio > t:
+                    continue
 
-            #
-            # --show-all
-            #
+                this_tolerance = t / (abs(sin_mid) * kinkiness)
 
-            if show_all:
+                log.debug(
+                    "kink: deviation %g; deviation_ratio %g; sin_mid %g; r_diff %g",
+                    deviation,
+                    deviation_ratio,
+                    sin_mid,
+                    r_diff,
+                )
+                log.debug("tolerance %g", this_tolerance)
                 yield (
                     glyph_name,
                     {
-                        "type": InterpolatableProblem.NOTHING,
+                        "type": InterpolatableProblem.KINK,
+                        "contour": ix,
                         "master_1": names[m0idx],
                         "master_2": names[m1idx],
                         "master_1_idx": m0idx,
                         "master_2_idx": m1idx,
+                        "value": i,
+                        "tolerance": this_tolerance,
                     },
                 )
 
+        #
+        # --show-all
+        #
+
+        if show_all:
+            yield (
+                glyph_name,
+                {
+                    "type": InterpolatableProblem.NOTHING,
+                    "master_1": names[m0idx],
+                    "master_2": names[m1idx],
+                    "master_1_idx": m0idx,
+                    "master_2_idx": m1idx,
+                },
+            )
+
 
 @wraps(test_gen)
 def test(*args, **kwargs):
@@ -599,6 +736,79 @@ def recursivelyAddGlyph(glyphname, glyphset, ttGlyphSet, glyf):
         recursivelyAddGlyph(component.glyphName, glyphset, ttGlyphSet, glyf)
 
 
+def _encode_cached_items(cached):
+    # The contour vectors of the isomorphisms are complex numbers, which JSON
+    # does not have; store them as flat lists of real and imaginary parts.
+    greenVectors, controlVectors, nodeTypes, isomorphisms, points, openContours = cached
+    isomorphisms = [
+        (
+            None
+            if contourIsomorphisms is None
+            else [
+                [[c for z in vector for c in (z.real, z.imag)], start, reverse]
+                for vector, start, reverse in contourIsomorphisms
+            ]
+        )
+        for contourIsomorphisms in isomorphisms
+    ]
+    return [greenVectors, controlVectors, nodeTypes, isomorphisms, points, openContours]
+
+
+def _decode_cached_items(data):
+    greenVectors, controlVectors, nodeTypes, isomorphisms, points, openContours = data
+    greenVectors = [None if v is None else tuple(v) for v in greenVectors]
+    controlVectors = [None if v is None else tuple(v) for v in controlVectors]
+    isomorphisms = [
+        (
+            None
+            if contourIsomorphisms is None
+            else [
+                ([complex(*z) for z in zip(v[::2], v[1::2])], start, reverse)
+                for v, start, reverse in contourIsomorphisms
+            ]
+        )
+        for contourIsomorphisms in isomorphisms
+    ]
+    points = [
+        None if p is None else [(tuple(pt), onCurve) for pt, onCurve in p]
+        for p in points
+    ]
+    return (greenVectors, controlVectors, nodeTypes, isomorphisms, points, openContours)
+
+
+def load_cache(path):
+    """Load a glyph statistics cache saved by ``save_cache``. Return an empty
+    cache if the file does not exist or was written by another fontTools
+    version.
+
+    The cache is plain JSON data, so loading it runs no code; but the statistics
+    in it are used unchecked, so only use cache files you wrote yourself."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data["version"] != fontTools.version:
+            log.info("Ignoring cache %s of fontTools %s", path, data["version"])
+            return {}
+        return {
+            key: _decode_cached_items(value) for key, value in data["glyphs"].items()
+        }
+    except FileNotFoundError:
+        return {}
+    except (ValueError, TypeError, KeyError) as e:
+        log.warning("Ignoring unreadable cache %s: %s", path, e)
+        return {}
+
+
+def save_cache(cache, path):
+    """Save a glyph statistics cache filled in by ``test_gen``."""
+    data = {
+        "version": fontTools.version,
+        "glyphs": {key: _encode_cached_items(value) for key, value in cache.items()},
+    }
+    with open(ensure_parent_dir(path), "w", encoding="utf-8") as f:
+        json.dump(data, f, separators=(",", ":"))
+
+
 def ensure_parent_dir(path):
     dirname = os.path.dirname(path)
     if dirname:
@@ -686,6 +896,24 @@ def main(args=None):
         action="append",
         help="Name of the master to use in the report. If not provided, all are used.",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        nargs="?",
+        default=1,
+        const=cpuCount(),
+        metavar="N",
+        help="Test glyphs in N parallel processes (default: %(default)s; "
+        "N defaults to the number of CPUs)",
+    )
+    parser.add_argument(
+        "--cache",
+        metavar="FILE",
+        help="JSON file to keep the per-master glyph statistics in between runs, "
+        "so that only modified glyphs are measured again. The statistics in it "
+        "are not checked, so only use a cache file you wrote yourself",
+    )
     parser.add_argument("-v", "--verbose", action="store_true", help="Run verbosely.")
     parser.add_argument("--debug", action="store_true", help="Run with debug output.")
 
@@ -959,6 +1187,8 @@ def main(args=None):
     tolerance = args.tolerance or DEFAULT_TOLERANCE
     kinkiness = args.kinkiness if args.kinkiness is not None else DEFAULT_KINKINESS
 
+    cache = load_cache(args.cache) if args.cache else None
+
     try:
         log.info("Running on %d glyphsets", len(glyphsets))
         log.info("Locations: %s", pformat(locations))
@@ -973,6 +1203,8 @@ def main(args=None):
             kinkiness=kinkiness,
             show_all=args.show_all,
             discrete_axes=discrete_axes,
+            jobs=args.jobs,
+            cache=cache,
         )
         problems = defaultdict(list)
 
@@ -1127,6 +1359,9 @@ def main(args=None):
             for glyphname, problem in problems_gen:
                 problems[glyphname].append(problem)
 
+        if cache is not None:
+            save_cache(cache, args.cache)
+
         problems = sort_problems(problems)
 
         for p in "ps", "pdf":
@@ -2,6 +2,7 @@ from fontTools.ttLib.ttGlyphSet import LerpGlyphSet
 from fontTools.pens.basePen import AbstractPen, BasePen, DecomposingPen
 from fontTools.pens.pointPen import AbstractPointPen, SegmentToPointPen
 from fontTools.pens.recordingPen import RecordingPen, DecomposingRecordingPen
+from fontTools.misc.hungarian import linearSumAssignment
 from fontTools.misc.transform import Transform
 from collections import defaultdict, deque
 from math import sqrt, copysign, atan2, pi
@@ -157,6 +158,11 @@ def min_cost_perfect_bipartite_matching_munkres(G):
     return cols, matching_cost(G, cols)
 
 
+def min_cost_perfect_bipartite_matching_hungarian(G):
+    cols = linearSumAssignment(G)
+    return cols, matching_cost(G, cols)
+
+
 def min_cost_perfect_bipartite_matching_bruteforce(G):
     n = len(G)
 
@@ -187,7 +193,7 @@ except ImportError:
         )
     except ImportError:
         min_cost_perfect_bipartite_matching = (
-            min_cost_perfect_bipartite_matching_bruteforce
+            min_cost_perfect_bipartite_matching_hungarian
         )
 
 
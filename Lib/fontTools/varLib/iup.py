@@ -12,6 +12,11 @@ from typing import (
 )
 from numbers import Integral, Real
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 _Point = Tuple[Real, Real]
 _Delta = Tuple[Real, Real]
@@ -24,6 +29,11 @@ _Endpoints = Sequence[Integral]
 
 MAX_LOOKBACK = 8
 
+# Glyphs with fewer points than this, or with a larger share of points that
+# can't be interpolated, are quicker to optimize without numpy.
+NUMPY_MIN_POINTS = 64
+NUMPY_MAX_FORCED = 0.25
+
 
 @cython.cfunc
 @cython.locals(
@@ -199,18 +209,205 @@ def can_iup_in_between(
     )
 
 
+@cython.cfunc
+@cython.inline
 @cython.locals(
-    cj=cython.double,
+    n=cython.int,
+    i=cython.int,
+    s=cython.int,
+    e=cython.int,
+    k=cython.int,
+    x1=cython.double,
+    x2=cython.double,
+    dx1=cython.double,
+    dx2=cython.double,
+    xscale=cython.double,
+    y1=cython.double,
+    y2=cython.double,
+    dy1=cython.double,
+    dy2=cython.double,
+    yscale=cython.double,
+    x=cython.double,
+    y=cython.double,
+    p=cython.double,
+    q=cython.double,
+    nudge=cython.double,
+)
+@cython.returns(int)
+def _can_iup_span(
+    deltas: _DeltaSegment,
+    coords: _PointSegment,
+    i: Integral,
+    s: Integral,
+    tolerance: Real,
+):  # -> bool:
+    """Like can_iup_in_between(deltas, coords, i, i + s, tolerance), with
+    indices wrapping around the contour; the interpolation is done in place
+    and stops at the first point that is off by more than `tolerance`."""
+
+    n = len(coords)
+    e = (i + s) % n
+    x1, y1 = coords[i]
+    x2, y2 = coords[e]
+    dx1, dy1 = deltas[i]
+    dx2, dy2 = deltas[e]
+
+    # Same as iup_segment(), for both axes: see there.
+    if x1 == x2:
+        if dx1 != dx2:
+            dx1 = dx2 = 0
+    elif x1 > x2:
+        x1, x2 = x2, x1
+        dx1, dx2 = dx2, dx1
+    if x1 != x2:
+        xscale = (dx2 - dx1) / (x2 - x1)
+    if y1 == y2:
+        if dy1 != dy2:
+            dy1 = dy2 = 0
+    elif y1 > y2:
+        y1, y2 = y2, y1
+        dy1, dy2 = dy2, dy1
+    if y1 != y2:
+        yscale = (dy2 - dy1) / (y2 - y1)
+
+    for k in range(i + 1, i + s):
+        x, y = coords[k % n]
+        if x <= x1:
+            p = dx1
+        elif x >= x2:
+            p = dx2
+        else:
+            nudge = (x - x1) * xscale
+            p = dx1 + nudge
+        if y <= y1:
+            q = dy1
+        elif y >= y2:
+            q = dy2
+        else:
+            nudge = (y - y1) * yscale
+            q = dy1 + nudge
+        x, y = deltas[k % n]
+        if abs(complex(x - p, y - q)) > tolerance:
+            return False
+    return True
+
+
+def _iup_spans_numpy_geometry(coords: _PointSegment, ends: _Endpoints) -> tuple:
+    """Return the parts of _iup_spans_numpy() that only depend on the outline
+    of a glyph, with contour endpoints `ends` as in iup_delta_optimize()."""
+
+    # All (span length, offset of a point in between) pairs, grouped by span.
+    lengths = np.arange(2, MAX_LOOKBACK)
+    pair_lengths = np.repeat(lengths, lengths - 1)
+    pair_offsets = np.concatenate([np.arange(1, s) for s in lengths])
+    pair_spans = pair_lengths - 2
+    groups = (lengths - 1) * (lengths - 2) // 2
+
+    # Start index and size of the contour of each point
+    sizes = np.diff(np.array([-1] + list(ends)))
+    starts = np.repeat(np.cumsum(sizes) - sizes, sizes)[:, None]
+    sizes = np.repeat(sizes, sizes)[:, None]
+    # Indices of the start and end points of each span, and of each point in
+    # between the start and end points of each pair.
+    i = np.arange(len(coords))[:, None]
+    local = i - starts
+    e = (local + lengths) % sizes + starts
+    k = (local + pair_offsets) % sizes + starts
+    valid = lengths < np.minimum(sizes, MAX_LOOKBACK)
+
+    # Same as iup_segment(), for each axis, with the reference points of each
+    # span sorted by coordinate: see there.
+    axes = []
+    for c in np.array(coords, dtype=np.float64).reshape(-1, 2).T:
+        x1, x2 = c[i], c[e]
+        swap = x1 > x2
+        x1, x2 = np.where(swap, x2, x1), np.where(swap, x1, x2)
+        same = x1 == x2
+        x1, x2 = x1[:, pair_spans], x2[:, pair_spans]
+        x = c[k]
+        axes.append((swap, same, x <= x1, x >= x2, x - x1, x2 - x1))
+
+    return i, e, k, pair_spans, lengths, groups, valid, axes
+
+
+def _iup_spans_numpy(
+    deltas: _DeltaSegment,
+    geometry: tuple,
+    tolerance: Real,
+) -> list:
+    """Check all the interpolations that _iup_contour_optimize_dp() may need
+    for the contours of a glyph at once, given the glyph's
+    _iup_spans_numpy_geometry().
+
+    Returns a list with, for each point `i` of the glyph, a bitmask with bit
+    `s` set if the points between `i` and `i + s` (wrapping around the
+    contour) can be interpolated from those two within `tolerance`."""
+
+    i, e, k, pair_spans, lengths, groups, valid, axes = geometry
+    deltas = np.array(deltas, dtype=np.float64).reshape(-1, 2).T
+
+    errors = []
+    for d, (swap, same, below, above, offset, width) in zip(deltas, axes):
+        d1, d2 = d[i], d[e]
+        d1, d2 = np.where(swap, d2, d1), np.where(swap, d1, d2)
+        zero = same & (d1 != d2)
+        d1, d2 = np.where(zero, 0, d1), np.where(zero, 0, d2)
+        d1, d2 = d1[:, pair_spans], d2[:, pair_spans]
+        # Where the width is zero this divides by zero, but then the point is
+        # below or above the span.
+        with np.errstate(divide="ignore", invalid="ignore"):
+            nudge = offset * ((d2 - d1) / width)
+            interp = np.where(below, d1, np.where(above, d2, d1 + nudge))
+        errors.append(d[k] - interp)
+    ok = np.hypot(*errors) <= tolerance
+
+    feasible = np.logical_and.reduceat(ok, groups, axis=1) & valid
+    return (feasible << lengths).sum(axis=1).tolist()
+
+
+def _iup_contour_forced_geometry(coords: _PointSegment) -> list:
+    """Return the part of _iup_contour_bound_forced_set() that only depends
+    on the coordinates of the contour: for the X and for the Y axis, four
+    lists of (point, neighbor, neighbor) indices, with the neighbor with the
+    lower coordinate first, for points whose neighbors have the same
+    coordinate, are on either side of them, or are both after or both before
+    them."""
+
+    n = len(coords)
+    geometry = []
+    for j in (0, 1):  # For X and for Y
+        same, between, before, after = [], [], [], []
+        for i in range(n):
+            l, r = (i - 1) % n, (i + 1) % n
+            c, c1, c2 = coords[i][j], coords[l][j], coords[r][j]
+            if c1 > c2:
+                l, r, c1, c2 = r, l, c2, c1
+            if c1 == c2:
+                same.append((i, l, r))
+            elif c1 <= c <= c2:
+                between.append((i, l, r))
+            elif c < c1:
+                before.append((i, l, r))
+            else:
+                after.append((i, l, r))
+        geometry.append((same, between, before, after))
+    return geometry
+
+
+@cython.locals(
+    i=cython.int,
+    l=cython.int,
+    r=cython.int,
     dj=cython.double,
-    lcj=cython.double,
-    ldj=cython.double,
-    ncj=cython.double,
-    ndj=cython.double,
-    force=cython.int,
+    d1=cython.double,
+    d2=cython.double,
     forced=set,
 )
 def _iup_contour_bound_forced_set(
-    deltas: _DeltaSegment, coords: _PointSegment, tolerance: Real = 0
+    deltas: _DeltaSegment,
+    coords: _PointSegment,
+    tolerance: Real = 0,
+    geometry: list = None,
 ) -> set:
     """The forced set is a conservative set of points on the contour that must be encoded
     explicitly (ie. cannot be interpolated).  Calculating this set allows for significantly
@@ -218,74 +415,55 @@ def _iup_contour_bound_forced_set(
 
     The set is precise; that is, if an index is in the returned set, then there is no way
     that IUP can generate delta for that point, given `coords` and `deltas`.
+
+    `geometry` is the _iup_contour_forced_geometry() of `coords`, if already computed.
     """
     assert len(deltas) == len(coords)
 
-    n = len(deltas)
+    if geometry is None:
+        geometry = _iup_contour_forced_geometry(coords)
+
     forced = set()
-    # Track "last" and "next" points on the contour as we sweep.
-    for i in range(len(deltas) - 1, -1, -1):
-        ld, lc = deltas[i - 1], coords[i - 1]
-        d, c = deltas[i], coords[i]
-        nd, nc = deltas[i - n + 1], coords[i - n + 1]
-
-        for j in (0, 1):  # For X and for Y
-            cj = c[j]
-            dj = d[j]
-            lcj = lc[j]
-            ldj = ld[j]
-            ncj = nc[j]
-            ndj = nd[j]
-
-            if lcj <= ncj:
-                c1, c2 = lcj, ncj
-                d1, d2 = ldj, ndj
-            else:
-                c1, c2 = ncj, lcj
-                d1, d2 = ndj, ldj
+    for j, (same, between, before, after) in enumerate(geometry):
+        values = [d[j] for d in deltas]
+
+        # If the two coordinates are the same, then the interpolation
+        # algorithm produces the same delta if both deltas are equal,
+        # and zero if they differ.
+        for i, l, r in same:
+            if abs(values[l] - values[r]) > tolerance and abs(values[i]) > tolerance:
+                forced.add(i)
 
-            force = False
+        # If coordinate for current point is between coordinate of adjacent
+        # points on the two sides, but the delta for current point is NOT
+        # between delta for those adjacent points (considering tolerance
+        # allowance), then there is no way that current point can be IUP-ed.
+        # Mark it forced.
+        for i, l, r in between:
+            dj, d1, d2 = values[i], values[l], values[r]
+            if not (min(d1, d2) - tolerance <= dj <= max(d1, d2) + tolerance):
+                forced.add(i)
 
-            # If the two coordinates are the same, then the interpolation
-            # algorithm produces the same delta if both deltas are equal,
-            # and zero if they differ.
-            #
-            # This test has to be before the next one.
-            if c1 == c2:
-                if abs(d1 - d2) > tolerance and abs(dj) > tolerance:
-                    force = True
-
-            # If coordinate for current point is between coordinate of adjacent
-            # points on the two sides, but the delta for current point is NOT
-            # between delta for those adjacent points (considering tolerance
-            # allowance), then there is no way that current point can be IUP-ed.
-            # Mark it forced.
-            elif c1 <= cj <= c2:  # and c1 != c2
-                if not (min(d1, d2) - tolerance <= dj <= max(d1, d2) + tolerance):
-                    force = True
-
-            # Otherwise, the delta should either match the closest, or have the
-            # same sign as the interpolation of the two deltas.
-            else:  # cj < c1 or c2 < cj
-                if d1 != d2:
-                    if cj < c1:
-                        if (
-                            abs(dj) > tolerance
-                            and abs(dj - d1) > tolerance
-                            and ((dj - tolerance < d1) != (d1 < d2))
-                        ):
-                            force = True
-                    else:  # c2 < cj
-                        if (
-                            abs(dj) > tolerance
-                            and abs(dj - d2) > tolerance
-                            and ((d2 < dj + tolerance) != (d1 < d2))
-                        ):
-                            force = True
-
-            if force:
+        # Otherwise, the delta should either match the closest, or have the
+        # same sign as the interpolation of the two deltas.
+        for i, l, r in before:
+            dj, d1, d2 = values[i], values[l], values[r]
+            if (
+                d1 != d2
+                and abs(dj) > tolerance
+                and abs(dj - d1) > tolerance
+                and ((dj - tolerance < d1) != (d1 < d2))
+            ):
+                forced.add(i)
+        for i, l, r in after:
+            dj, d1, d2 = values[i], values[l], values[r]
+            if (
+                d1 != d2
+                and abs(dj) > tolerance
+                and abs(dj - d2) > tolerance
+                and ((d2 < dj + tolerance) != (d1 < d2))
+            ):
                 forced.add(i)
-                break
 
     return forced
 
@@ -305,6 +483,7 @@ def _iup_contour_optimize_dp(
     forced=set(),
     tolerance: Real = 0,
     lookback: Integral = None,
+    spans: list = None,
 ):
     """Straightforward Dynamic-Programming.  For each index i, find least-costly encoding of
     points 0 to i where i is explicitly encoded.  We find this by considering all previous
@@ -313,7 +492,11 @@ def _iup_contour_optimize_dp(
     Note that solution always encodes last point explicitly.  Higher-level is responsible
     for removing that restriction.
 
-    As major speedup, we stop looking further whenever we see a "forced" point."""
+    As major speedup, we stop looking further whenever we see a "forced" point.
+
+    If `spans` is given, as returned by _iup_spans_numpy() for the points of
+    the contour, whether points can be interpolated is looked up in it instead
+    of being checked."""
 
     n = len(deltas)
     if lookback is None:
@@ -333,7 +516,11 @@ def _iup_contour_optimize_dp(
         for j in range(i - 2, max(i - lookback, -2), -1):
             cost = costs[j] + 1
 
-            if cost < best_cost and can_iup_in_between(deltas, coords, j, i, tolerance):
+            if cost < best_cost and (
+                _can_iup_span(deltas, coords, j, i - j, tolerance)
+                if spans is None
+                else spans[j] >> (i - j) & 1
+            ):
                 costs[i] = best_cost = cost
                 chain[i] = j
 
@@ -360,14 +547,77 @@ def _rot_set(s: set, k: int, n: int):
     return {(v + k) % n for v in s}
 
 
+@cython.locals(
+    n=cython.int,
+    i=cython.int,
+    s=cython.int,
+    t=cython.int,
+    start=cython.int,
+    limit=cython.int,
+    lookback=cython.int,
+    forced=set,
+    tolerance=cython.double,
+)
+def _iup_contour_optimize_greedy(
+    deltas: _DeltaSegment,
+    coords: _PointSegment,
+    forced=set(),
+    tolerance: Real = 0,
+):
+    """Greedy alternative to the dynamic-programming: going around the contour
+    from a forced point (or the first point), skip points for as long as they
+    can be interpolated from the last encoded point and the next one.  This
+    checks a couple of spans per point, but may encode more points than the
+    optimal solution does.
+
+    Returns the set of indices of the points to encode."""
+
+    n = len(deltas)
+    lookback = min(n, MAX_LOOKBACK)
+    start = max(forced) if forced else 0
+    solution = {start}
+    i = start
+    while True:
+        # Don't go past the start point, nor interpolate over a forced point.
+        limit = min(lookback - 1, (start - i - 1) % n + 1)
+        for s in range(1, limit):
+            if (i + s) % n in forced:
+                limit = s
+                break
+        # Find the farthest point that the ones since point i can be
+        # interpolated from, giving up after two points in a row that can't.
+        s = 1
+        for t in range(2, limit + 1):
+            if _can_iup_span(deltas, coords, i, t, tolerance):
+                s = t
+            elif t > s + 1:
+                break
+        i = (i + s) % n
+        if i == start:
+            break
+        solution.add(i)
+    return solution
+
+
 def iup_contour_optimize(
-    deltas: _DeltaSegment, coords: _PointSegment, tolerance: Real = 0.0
+    deltas: _DeltaSegment,
+    coords: _PointSegment,
+    tolerance: Real = 0.0,
+    fast: bool = False,
+    spans: list = None,
+    forced: set = None,
 ) -> _DeltaOrNoneSegment:
     """For contour with coordinates `coords`, optimize a set of delta
     values `deltas` within error `tolerance`.
 
     Returns delta vector that has most number of None items instead of
     the input delta.
+
+    If `fast` is true, a greedy heuristic is used instead of finding the
+    optimal solution, which is much quicker but may keep a few more deltas.
+    Otherwise, `spans` can be given as computed by _iup_spans_numpy() for
+    the points of the contour. `forced` is the contour's
+    _iup_contour_bound_forced_set(), if already computed.
     """
 
     n = len(deltas)
@@ -389,7 +639,13 @@ def iup_contour_optimize(
 
     # Else, solve the general problem using Dynamic Programming.
 
-    forced = _iup_contour_bound_forced_set(deltas, coords, tolerance)
+    if forced is None:
+        forced = _iup_contour_bound_forced_set(deltas, coords, tolerance)
+
+    if fast:
+        solution = _iup_contour_optimize_greedy(deltas, coords, forced, tolerance)
+        return [deltas[i] if i in solution else None for i in range(n)]
+
     # The _iup_contour_optimize_dp() routine returns the optimal encoding
     # solution given the constraint that the last point is always encoded.
     # To remove this constraint, we use two different methods, depending on
@@ -407,10 +663,14 @@ def iup_contour_optimize(
         deltas = _rot_list(deltas, k)
         coords = _rot_list(coords, k)
         forced = _rot_set(forced, k, n)
+        if spans is not None:
+            spans = _rot_list(spans, k)
 
         # Debugging: Pass a set() instead of forced variable to the next call
         # to exercise forced-set computation for under-counting.
-        chain, costs = _iup_contour_optimize_dp(deltas, coords, forced, tolerance)
+        chain, costs = _iup_contour_optimize_dp(
+            deltas, coords, forced, tolerance, spans=spans
+        )
 
         # Assemble solution.
         solution = set()
@@ -434,7 +694,12 @@ def iup_contour_optimize(
         # circular n-length problem in the solution for new linear case.  I cannot prove that
         # this always produces the optimal solution...
         chain, costs = _iup_contour_optimize_dp(
-            deltas + deltas, coords + coords, forced, tolerance, n
+            deltas + deltas,
+            coords + coords,
+            forced,
+            tolerance,
+            n,
+            None if spans is None else spans + spans,
         )
         best_sol, best_cost = None, n + 1
 
@@ -461,11 +726,51 @@ def iup_contour_optimize(
     return deltas
 
 
+class IUPGeometry:
+    """The parts of the IUP optimization of the deltas of a glyph that only
+    depend on its outline, given in `coords` and `ends` as for
+    iup_delta_optimize().
+
+    They are computed the first time they are needed, and reused when the
+    same object is passed to iup_delta_optimize() for the deltas of each
+    master or tuple variation of the glyph. The outline must not change in
+    the meantime.
+    """
+
+    def __init__(self, coords: _PointSegment, ends: _Endpoints):
+        assert sorted(ends) == ends and len(coords) == (ends[-1] + 1 if ends else 0) + 4
+        n = len(coords)
+        self.coords = coords
+        self.ends = ends + [n - 4, n - 3, n - 2, n - 1]
+        self.starts = [0] + [end + 1 for end in self.ends[:-1]]
+        self.contours = [
+            coords[start : end + 1] for start, end in zip(self.starts, self.ends)
+        ]
+        self._forced = [None] * len(self.ends)
+        self._spans = None
+
+    def forced(self, index: int) -> list:
+        """Return the _iup_contour_forced_geometry() of contour `index`."""
+        geometry = self._forced[index]
+        if geometry is None:
+            geometry = _iup_contour_forced_geometry(self.contours[index])
+            self._forced[index] = geometry
+        return geometry
+
+    def spans(self, deltas: _DeltaSegment, tolerance: Real) -> list:
+        """Return _iup_spans_numpy() for `deltas`; numpy must be available."""
+        if self._spans is None:
+            self._spans = _iup_spans_numpy_geometry(self.coords, self.ends)
+        return _iup_spans_numpy(deltas, self._spans, tolerance)
+
+
 def iup_delta_optimize(
     deltas: _DeltaSegment,
     coords: _PointSegment,
     ends: _Endpoints,
     tolerance: Real = 0.0,
+    fast: bool = False,
+    geometry: IUPGeometry = None,
 ) -> _DeltaOrNoneSegment:
     """For the outline given in `coords`, with contour endpoints given
     in sorted increasing order in `ends`, optimize a set of delta
@@ -473,18 +778,48 @@ def iup_delta_optimize(
 
     Returns delta vector that has most number of None items instead of
     the input delta.
+
+    If `fast` is true, a greedy heuristic is used instead of finding the
+    optimal solution; see iup_contour_optimize(). Otherwise, if numpy is
+    available, the interpolations that the optimization may need are all
+    checked at once for the whole glyph, if it has enough points.
+
+    To optimize the deltas of several masters of the same glyph, pass an
+    IUPGeometry of `coords` and `ends` as `geometry` to each call, so that
+    what only depends on the outline is computed once.
     """
-    assert sorted(ends) == ends and len(coords) == (ends[-1] + 1 if ends else 0) + 4
-    n = len(coords)
-    ends = ends + [n - 4, n - 3, n - 2, n - 1]
+    if geometry is None:
+        geometry = IUPGeometry(coords, ends)
+    n = len(geometry.coords)
+    contours = []
+    num_forced = 0
+    for index, (start, end) in enumerate(zip(geometry.starts, geometry.ends)):
+        contour = deltas[start : end + 1]
+        forced = _iup_contour_bound_forced_set(
+            contour, geometry.contours[index], tolerance, geometry.forced(index)
+        )
+        num_forced += len(forced)
+        contours.append((contour, forced))
+    spans = None
+    if (
+        not fast
+        and np is not None
+        and n >= NUMPY_MIN_POINTS
+        and num_forced <= n * NUMPY_MAX_FORCED
+    ):
+        spans = geometry.spans(deltas, tolerance)
     out = []
-    start = 0
-    for end in ends:
+    for index, (start, end) in enumerate(zip(geometry.starts, geometry.ends)):
+        contour, forced = contours[index]
         contour = iup_contour_optimize(
-            deltas[start : end + 1], coords[start : end + 1], tolerance
+            contour,
+            geometry.contours[index],
+            tolerance,
+            fast,
+            None if spans is None else spans[start : end + 1],
+            forced,
         )
         assert len(contour) == end - start + 1
         out.extend(contour)
-        start = end + 1
 
     return out
@@ -509,84 +509,218 @@ def _ClassDef_merge_classify(lst, allGlyphses=None):
     return self, classes
 
 
-def _PairPosFormat2_align_matrices(self, lst, font, transparent=False):
-    matrices = [l.Class1Record for l in lst]
+def _PairPosFormat2_align_classes(self, lst):
+    """Merge the class definitions of the subtables in lst into self.
 
-    # Align first classes
+    Return, for each subtable, the list of its old first class for each new
+    first class, or None where the subtable does not cover the class; and
+    the list of its old second class for each new second class.
+    """
     self.ClassDef1, classes = _ClassDef_merge_classify(
         [l.ClassDef1 for l in lst], [l.Coverage.glyphs for l in lst]
     )
     self.Class1Count = len(classes)
-    new_matrices = []
-    for l, matrix in zip(lst, matrices):
-        nullRow = None
+    class1Maps = []
+    for l in lst:
         coverage = set(l.Coverage.glyphs)
         classDef1 = l.ClassDef1.classDefs
-        class1Records = []
+        class1Map = []
         for classSet in classes:
             exemplarGlyph = next(iter(classSet))
             if exemplarGlyph not in coverage:
-                # Follow-up to e6125b353e1f54a0280ded5434b8e40d042de69f,
-                # Fixes https://github.com/googlei18n/fontmake/issues/470
-                # Again, revert 8d441779e5afc664960d848f62c7acdbfc71d7b9
-                # when merger becomes selfless.
-                nullRow = None
-                if nullRow is None:
-                    nullRow = ot.Class1Record()
-                    class2records = nullRow.Class2Record = []
-                    # TODO: When merger becomes selfless, revert e6125b353e1f54a0280ded5434b8e40d042de69f
-                    for _ in range(l.Class2Count):
-                        if transparent:
-                            rec2 = None
-                        else:
-                            rec2 = ot.Class2Record()
-                            rec2.Value1 = (
-                                otBase.ValueRecord(self.ValueFormat1)
-                                if self.ValueFormat1
-                                else None
-                            )
-                            rec2.Value2 = (
-                                otBase.ValueRecord(self.ValueFormat2)
-                                if self.ValueFormat2
-                                else None
-                            )
-                        class2records.append(rec2)
-                rec1 = nullRow
+                class1Map.append(None)
             else:
-                klass = classDef1.get(exemplarGlyph, 0)
-                rec1 = matrix[klass]  # TODO handle out-of-range?
-            class1Records.append(rec1)
-        new_matrices.append(class1Records)
-    matrices = new_matrices
-    del new_matrices
+                class1Map.append(classDef1.get(exemplarGlyph, 0))
+        class1Maps.append(class1Map)
 
-    # Align second classes
     self.ClassDef2, classes = _ClassDef_merge_classify([l.ClassDef2 for l in lst])
     self.Class2Count = len(classes)
-    new_matrices = []
-    for l, matrix in zip(lst, matrices):
+    class2Maps = []
+    for l in lst:
         classDef2 = l.ClassDef2.classDefs
+        class2Map = []
+        for classSet in classes:
+            if not classSet:  # class=0
+                class2Map.append(0)
+            else:
+                class2Map.append(classDef2.get(next(iter(classSet)), 0))
+        class2Maps.append(class2Map)
+
+    return class1Maps, class2Maps
+
+
+def _PairPosFormat2_align_matrices(self, lst, font, transparent=False):
+    class1Maps, class2Maps = _PairPosFormat2_align_classes(self, lst)
+    return _PairPosFormat2_build_matrices(
+        self, lst, class1Maps, class2Maps, transparent
+    )
+
+
+def _PairPosFormat2_build_matrices(self, lst, class1Maps, class2Maps, transparent):
+    matrices = []
+    for l, class1Map, class2Map in zip(lst, class1Maps, class2Maps):
+        matrix = l.Class1Record
         class1Records = []
-        for rec1old in matrix:
-            oldClass2Records = rec1old.Class2Record
-            rec1new = ot.Class1Record()
-            class2Records = rec1new.Class2Record = []
-            for classSet in classes:
-                if not classSet:  # class=0
-                    rec2 = oldClass2Records[0]
-                else:
-                    exemplarGlyph = next(iter(classSet))
-                    klass = classDef2.get(exemplarGlyph, 0)
-                    rec2 = oldClass2Records[klass]
-                class2Records.append(copy.deepcopy(rec2))
-            class1Records.append(rec1new)
-        new_matrices.append(class1Records)
-    matrices = new_matrices
-    del new_matrices
+        for klass1 in class1Map:
+            if klass1 is None:
+                # Follow-up to e6125b353e1f54a0280ded5434b8e40d042de69f,
+                # Fixes https://github.com/googlei18n/fontmake/issues/470
+                # Again, revert 8d441779e5afc664960d848f62c7acdbfc71d7b9
+                # when merger becomes selfless.
+                oldClass2Records = []
+                # TODO: When merger becomes selfless, revert e6125b353e1f54a0280ded5434b8e40d042de69f
+                for _ in range(l.Class2Count):
+                    if transparent:
+                        rec2 = None
+                    else:
+                        rec2 = ot.Class2Record()
+                        rec2.Value1 = (
+                            otBase.ValueRecord(self.ValueFormat1)
+                            if self.ValueFormat1
+                            else None
+                        )
+                        rec2.Value2 = (
+                            otBase.ValueRecord(self.ValueFormat2)
+                            if self.ValueFormat2
+                            else None
+                        )
+                    oldClass2Records.append(rec2)
+            else:
+                oldClass2Records = matrix[klass1].Class2Record  # TODO out-of-range?
+            rec1 = ot.Class1Record()
+            rec1.Class2Record = [
+                copy.deepcopy(oldClass2Records[klass2]) for klass2 in class2Map
+            ]
+            class1Records.append(rec1)
+        matrices.append(class1Records)
 
     return matrices
 
 
+# The simple ValueRecord fields that VariationMerger builds deltas for.
+_VALUE_RECORD_DEVICES = (
+    ("XAdvance", "XAdvDevice"),
+    ("YAdvance", "YAdvDevice"),
+    ("XPlacement", "XPlaDevice"),
+    ("YPlacement", "YPlaDevice"),
+)
+
+
+def _PairPosFormat2_value_arrays(l, isDefault):
+    """Return the values of each ValueRecord field of the first values of the
+    class kerning subtable l, as dense arrays indexed by class1 * Class2Count +
+    class2, followed by a zero for the pairs it does not cover; and for the
+    default master also its Class2Records. Return None if the records can not
+    be represented this way."""
+    class2Count = l.Class2Count
+    if any(len(rec1.Class2Record) != class2Count for rec1 in l.Class1Record):
+        return None
+    records = [rec2 for rec1 in l.Class1Record for rec2 in rec1.Class2Record]
+    keys = {"Value1", "Value2"}
+    if not all(rec2.__dict__.keys() == keys for rec2 in records) or any(
+        rec2.Value1 is None or rec2.Value2 is not None for rec2 in records
+    ):
+        return None
+    dicts = [rec2.Value1.__dict__ for rec2 in records]
+    names = [name for name, _ in _VALUE_RECORD_DEVICES]
+    # Only the simple fields are copied into the merged records.
+    if isDefault and any(
+        v is not None for d in dicts for k, v in d.items() if k not in names
+    ):
+        return None
+    values = {name: [d.get(name, 0) for d in dicts] + [0] for name in names}
+    return values, (records if isDefault else None)
+
+
+def _PairPosFormat2_merge_variations(self, lst, merger, class1Maps, class2Maps):
+    """Build the variations of the aligned class kerning subtables in lst, as
+    dense per-master arrays of values rather than per-record objects. Return
+    False, having done nothing, if the subtables need the generic merger."""
+    if self.ValueFormat2 or not self.ValueFormat1:
+        return False
+    masterValues = []
+    for i, l in enumerate(lst):
+        arrays = _PairPosFormat2_value_arrays(l, i == 0)
+        if arrays is None:
+            return False
+        values, records = arrays
+        masterValues.append(values)
+        if i == 0:
+            defaultRecords = records
+
+    # For each master, the index in its arrays of each aligned class pair.
+    masterIndices = []
+    for l, class1Map, class2Map in zip(lst, class1Maps, class2Maps):
+        class2Count = l.Class2Count
+        nullIndex = len(l.Class1Record) * class2Count
+        if max(class2Map) >= class2Count or any(
+            klass1 is not None and klass1 >= len(l.Class1Record) for klass1 in class1Map
+        ):
+            return False
+        indices = []
+        for klass1 in class1Map:
+            if klass1 is None:
+                indices.extend([nullIndex] * len(class2Map))
+            else:
+                base = klass1 * class2Count
+                indices.extend([base + klass2 for klass2 in class2Map])
+        masterIndices.append(indices)
+
+    def gather(name):
+        # The master values of a field, for each aligned class pair.
+        return list(
+            zip(
+                *(
+                    [values[name][i] for i in indices]
+                    for values, indices in zip(masterValues, masterIndices)
+                )
+            )
+        )
+
+    columns = {}
+    varIdxes = {}
+    storeBuilder = merger.store_builder
+    nullValue = otBase.ValueRecord(self.ValueFormat1)
+    defaultIndices = masterIndices[0]
+    defaultNullIndex = len(defaultRecords)
+    class2Count = self.Class2Count
+    self.Class1Record = []
+    for class1 in range(self.Class1Count):
+        rec1 = ot.Class1Record()
+        rec1.Class2Record = []
+        self.Class1Record.append(rec1)
+        for cell in range(class1 * class2Count, (class1 + 1) * class2Count):
+            rec2 = ot.Class2Record()
+            index = defaultIndices[cell]
+            if index == defaultNullIndex:
+                value = otBase.ValueRecord(src=nullValue)
+                rec2.Value2 = None
+            else:
+                template = defaultRecords[index]
+                rec2.__dict__.update(template.__dict__)
+                value = otBase.ValueRecord(src=template.Value1)
+            rec2.Value1 = value
+            rec1.Class2Record.append(rec2)
+            for name, tableName in _VALUE_RECORD_DEVICES:
+                if not hasattr(value, name):
+                    continue
+                if name not in columns:
+                    columns[name] = gather(name)
+                values = columns[name][cell]
+                if allEqual(values):
+                    setattr(value, name, values[0])
+                    continue
+                # Identical master values need not go through the model again.
+                stored = varIdxes.get(values)
+                if stored is None:
+                    stored = varIdxes[values] = storeBuilder.storeMasters(list(values))
+                base, varIdx = stored
+                setattr(value, name, base)
+                setattr(value, tableName, builder.buildVarDevTable(varIdx))
+
+    return True
+
+
 def _PairPosFormat2_merge(self, lst, merger):
     assert allEqual(
         [l.ValueFormat2 == 0 for l in lst if l.Class1Record]
@@ -622,7 +756,18 @@ def _PairPosFormat2_merge(self, lst, merger):
         if l.Coverage.glyphs != glyphs:
             assert l == subtables[-1]
 
-    matrices = _PairPosFormat2_align_matrices(self, lst, merger.font)
+    class1Maps, class2Maps = _PairPosFormat2_align_classes(self, lst)
+
+    # Building the variations of large class kerning record by record is slow;
+    # do it on arrays of values when possible.
+    if isinstance(merger, VariationMerger) and _PairPosFormat2_merge_variations(
+        self, lst, merger, class1Maps, class2Maps
+    ):
+        return
+
+    matrices = _PairPosFormat2_build_matrices(
+        self, lst, class1Maps, class2Maps, transparent=False
+    )
 
     self.Class1Record = list(matrices[0])  # TODO move merger to be selfless
     merger.mergeLists(self.Class1Record, matrices)
@@ -1300,12 +1445,7 @@ def merge(merger, self, lst):
 
 @VariationMerger.merger(otBase.ValueRecord)
 def merge(merger, self, lst):
-    for name, tableName in [
-        ("XAdvance", "XAdvDevice"),
-        ("YAdvance", "YAdvDevice"),
-        ("XPlacement", "XPlaDevice"),
-        ("YPlacement", "YPlaDevice"),
-    ]:
+    for name, tableName in _VALUE_RECORD_DEVICES:
         if hasattr(self, name):
             value, deviceTable = buildVarDevTable(
                 merger.store_builder, [getattr(a, name, 0) for a in lst]
@@ -6,11 +6,19 @@ __all__ = [
     "supportScalar",
     "piecewiseLinearMap",
     "VariationModel",
+    "RegionScalars",
 ]
 
-from fontTools.misc.roundTools import noRound
+from fontTools.misc.roundTools import noRound, otRound
+from collections import OrderedDict, defaultdict, namedtuple
+import builtins
 from .errors import VariationModelError
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 def nonNone(lst):
     return [l for l in lst if l is not None]
@@ -206,6 +214,90 @@ def supportScalar(location, support, ot=True, extrapolate=False, axisRanges=None
     return scalar
 
 
+class RegionScalars(object):
+    """Computes the scalars of a fixed list of supports (regions) at a location.
+
+    Calling the object with a location returns the same list as calling
+    supportScalar() with each of the supports, but the supports are prepared
+    once, so that all the scalars for a location are computed in a single
+    pass.  The results for the last cacheSize locations are cached.
+
+      >>> regionScalars = RegionScalars([{'wght': (0, 1, 1)}, {'wdth': (0, 1, 1)}])
+      >>> regionScalars({'wght': .5})
+      [0.5, 0.0]
+      >>> regionScalars({'wght': .5, 'wdth': 0})  # same as above, from the cache
+      [0.5, 0.0]
+    """
+
+    def __init__(self, supports, *, extrapolate=False, axisRanges=None, cacheSize=64):
+        self.supports = supports
+        self.extrapolate = extrapolate
+        self.axisRanges = axisRanges
+        self.cacheSize = cacheSize
+        self._cache = OrderedDict()
+        if extrapolate:
+            self._regions = None
+        else:
+            self._regions = [self._prepareSupport(s) for s in supports]
+
+    @staticmethod
+    def _prepareSupport(support):
+        # Drop the axes that supportScalar() would skip for any location.
+        return tuple(
+            (axis, lower, peak, upper)
+            for axis, (lower, peak, upper) in support.items()
+            if peak != 0.0
+            and lower <= peak <= upper
+            and not (lower < 0.0 and upper > 0.0)
+        )
+
+    def __call__(self, location):
+        key = tuple(sorted((axis, v) for axis, v in location.items() if v != 0.0))
+        cache = self._cache
+        scalars = cache.get(key)
+        if scalars is None:
+            scalars = self._computeScalars(location)
+            cache[key] = scalars
+            if len(cache) > self.cacheSize:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        return list(scalars)
+
+    def _computeScalars(self, location):
+        if self._regions is None:
+            return [
+                supportScalar(
+                    location,
+                    support,
+                    extrapolate=self.extrapolate,
+                    axisRanges=self.axisRanges,
+                )
+                for support in self.supports
+            ]
+        scalars = []
+        for region in self._regions:
+            scalar = 1.0
+            for axis, lower, peak, upper in region:
+                v = location.get(axis, 0.0)
+                if v == peak:
+                    continue
+                if v <= lower or upper <= v:
+                    scalar = 0.0
+                    break
+                if v < peak:
+                    scalar *= (v - lower) / (peak - lower)
+                else:  # v > peak
+                    scalar *= (v - upper) / (peak - upper)
+            scalars.append(scalar)
+        return scalars
+
+
+SubModelCacheInfo = namedtuple(
+    "SubModelCacheInfo", ["hits", "misses", "maxsize", "currsize"]
+)
+
+
 class VariationModel(object):
     """Locations must have the base master at the origin (ie. 0).
 
@@ -284,7 +376,11 @@ class VariationModel(object):
         self.reverseMapping = [locations.index(l) for l in self.locations]
 
         self._computeMasterSupports()
-        self._subModels = {}
+        self._subModels = OrderedDict()
+        self._subModelCacheHits = self._subModelCacheMisses = 0
+
+    # Maximum number of sub-models kept by getSubModel().
+    subModelCacheSize = 1024
 
     def getSubModel(self, items):
         """Return a sub-model and the items that are not None.
@@ -292,16 +388,43 @@ class VariationModel(object):
         The sub-model is necessary for working with the subset
         of items when some are None.
 
-        The sub-model is cached."""
+        The sub-models are kept in a least-recently-used cache, keyed
+        by which items are present, of at most subModelCacheSize entries.
+        See getSubModelCacheInfo()."""
         if None not in items:
             return self, items
         key = tuple(v is not None for v in items)
-        subModel = self._subModels.get(key)
+        subModels = self._subModels
+        subModel = subModels.get(key)
         if subModel is None:
+            self._subModelCacheMisses += 1
             subModel = VariationModel(subList(key, self.origLocations), self.axisOrder)
-            self._subModels[key] = subModel
+            subModels[key] = subModel
+            if len(subModels) > self.subModelCacheSize:
+                subModels.popitem(last=False)
+        else:
+            self._subModelCacheHits += 1
+            subModels.move_to_end(key)
         return subModel, subList(key, items)
 
+    def getSubModelCacheInfo(self):
+        """Return statistics of the getSubModel() cache, as a named tuple
+        like functools.lru_cache's cache_info().
+
+          >>> model = VariationModel([{}, {'wght': 1}, {'wght': -1}])
+          >>> _ = model.getSubModel([100, None, 90])
+          >>> _ = model.getSubModel([100, 120, None])
+          >>> _ = model.getSubModel([200, None, 180])
+          >>> model.getSubModelCacheInfo()
+          SubModelCacheInfo(hits=1, misses=2, maxsize=1024, currsize=2)
+        """
+        return SubModelCacheInfo(
+            self._subModelCacheHits,
+            self._subModelCacheMisses,
+            self.subModelCacheSize,
+            len(self._subModels),
+        )
+
     @staticmethod
     def computeAxisRanges(locations):
         axisRanges = {}
@@ -376,7 +499,7 @@ class VariationModel(object):
         ]
         self.mapping = [self.locations.index(l) for l in locations]
         self.reverseMapping = [locations.index(l) for l in self.locations]
-        self._subModels = {}
+        self._subModels = OrderedDict()
         return new_list
 
     def _computeMasterSupports(self):
@@ -433,6 +556,7 @@ class VariationModel(object):
                 for axis, triple in bestAxes.items():
                     region[axis] = triple
             self.supports.append(region)
+        self._regionScalars = None
         self._computeDeltaWeights()
 
     def _locationsToRegions(self):
@@ -478,21 +602,105 @@ class VariationModel(object):
             out.append(round(delta))
         return out
 
+    def getDeltasMany(self, masterVectors, *, round=noRound):
+        """Like getDeltas(), but for many values at once.
+
+        masterVectors is a list with one sequence of numbers per master, all of
+        the same length. Returns one list of deltas per support, such that
+        element k of each is getDeltas() of element k of every master.
+
+        The deltas of each master depend on the rounded deltas of the masters
+        before it, so they are computed by forward substitution, one master
+        at a time over all the values.  This gives the same results as calling
+        getDeltas() for each value separately.  numpy is used if available;
+        in that case the deltas are returned as floats, unless round is given.
+        round is called on individual numbers.
+
+          >>> model = VariationModel([{}, {'wght': 1}, {'wght': -1}])
+          >>> model.getDeltasMany([[100, 50], [120, 80], [90, 50]], round=round)
+          [[100, 50], [-10, 0], [20, 30]]
+        """
+        assert len(masterVectors) == len(self.deltaWeights), (
+            len(masterVectors),
+            len(self.deltaWeights),
+        )
+        if np is None:
+            return self._getDeltasManyPure(masterVectors, round)
+        return self._getDeltasManyNumpy(masterVectors, round)
+
+    def _getDeltasManyPure(self, masterVectors, round):
+        mapping = self.reverseMapping
+        out = []
+        for i, weights in enumerate(self.deltaWeights):
+            delta = list(masterVectors[mapping[i]])
+            for j, weight in weights.items():
+                if weight == 1:
+                    delta = [d - o for d, o in zip(delta, out[j])]
+                else:
+                    delta = [d - o * weight for d, o in zip(delta, out[j])]
+            if round is not noRound:
+                delta = [round(d) for d in delta]
+            out.append(delta)
+        return out
+
+    def _getDeltasManyNumpy(self, masterVectors, round):
+        values = np.asarray(masterVectors, dtype=np.float64)
+        mapping = self.reverseMapping
+        out = []
+        for i, weights in enumerate(self.deltaWeights):
+            delta = values[mapping[i]].copy()
+            for j, weight in weights.items():
+                if weight == 1:
+                    delta -= out[j]
+                else:
+                    delta -= out[j] * weight
+            if round is otRound:
+                delta = np.floor(delta + 0.5)
+            elif round is builtins.round:
+                # Both round half to even.
+                delta = np.round(delta)
+            elif round is not noRound:
+                delta = np.array([round(d) for d in delta.tolist()], dtype=np.float64)
+            out.append(delta)
+        if round is noRound:
+            return [delta.tolist() for delta in out]
+        return [delta.astype(np.int64).tolist() for delta in out]
+
     def getDeltasAndSupports(self, items, *, round=noRound):
         model, items = self.getSubModel(items)
         return model.getDeltas(items, round=round), model.supports
 
+    def getDeltasAndSupportsMany(self, itemsList, *, round=noRound):
+        """Return the list of getDeltasAndSupports() for each of itemsList.
+
+        Items with the same masters present share a sub-model, and their
+        deltas are computed together with getDeltasMany().
+        """
+        groups = defaultdict(list)
+        for index, items in enumerate(itemsList):
+            groups[tuple(v is not None for v in items)].append(index)
+
+        result = [None] * len(itemsList)
+        for key, indices in groups.items():
+            model, _ = self.getSubModel(itemsList[indices[0]])
+            masterVectors = list(zip(*(subList(key, itemsList[i]) for i in indices)))
+            deltaVectors = model.getDeltasMany(masterVectors, round=round)
+            supports = model.supports
+            for k, index in enumerate(indices):
+                result[index] = ([delta[k] for delta in deltaVectors], supports)
+        return result
+
     def getScalars(self, loc):
         """Return scalars for each delta, for the given location.
         If interpolating many master-values at the same location,
         this function allows speed up by fetching the scalars once
         and using them with interpolateFromMastersAndScalars()."""
-        return [
-            supportScalar(
-                loc, support, extrapolate=self.extrapolate, axisRanges=self.axisRanges
+        regionScalars = self._regionScalars
+        if regionScalars is None:
+            regionScalars = self._regionScalars = RegionScalars(
+                self.supports, extrapolate=self.extrapolate, axisRanges=self.axisRanges
             )
-            for support in self.supports
-        ]
+        return regionScalars(loc)
 
     def getMasterScalars(self, targetLocation):
         """Return multipliers for each master, for the given location.
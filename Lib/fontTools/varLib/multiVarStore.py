@@ -2,7 +2,7 @@ from fontTools.misc.roundTools import noRound, otRound
 from fontTools.misc.intTools import bit_count
 from fontTools.misc.vector import Vector
 from fontTools.ttLib.tables import otTables as ot
-from fontTools.varLib.models import supportScalar
+from fontTools.varLib.models import RegionScalars
 import fontTools.varLib.varStore  # For monkey-patching
 from fontTools.varLib.builder import (
     buildVarRegionList,
@@ -163,6 +163,7 @@ class MultiVarStoreInstancer(object):
         self._regions = (
             multivarstore.SparseVarRegionList.Region if multivarstore else []
         )
+        self._regionScalars = None
         self.setLocation(location)
 
     def setLocation(self, location):
@@ -170,15 +171,18 @@ class MultiVarStoreInstancer(object):
         self._clearCaches()
 
     def _clearCaches(self):
-        self._scalars = {}
+        self._scalars = None
 
     def _getScalar(self, regionIdx):
-        scalar = self._scalars.get(regionIdx)
-        if scalar is None:
-            support = self._regions[regionIdx].get_support(self.fvar_axes)
-            scalar = supportScalar(self.location, support)
-            self._scalars[regionIdx] = scalar
-        return scalar
+        scalars = self._scalars
+        if scalars is None:
+            regionScalars = self._regionScalars
+            if regionScalars is None:
+                regionScalars = self._regionScalars = RegionScalars(
+                    [region.get_support(self.fvar_axes) for region in self._regions]
+                )
+            scalars = self._scalars = regionScalars(self.location)
+        return scalars[regionIdx]
 
     @staticmethod
     def interpolateFromDeltasAndScalars(deltas, scalars):
@@ -1,7 +1,7 @@
 from fontTools.misc.roundTools import noRound, otRound
 from fontTools.misc.intTools import bit_count
 from fontTools.ttLib.tables import otTables as ot
-from fontTools.varLib.models import supportScalar
+from fontTools.varLib.models import RegionScalars
 from fontTools.varLib.builder import (
     buildVarRegionList,
     buildVarStore,
@@ -9,8 +9,11 @@ from fontTools.varLib.builder import (
     buildVarData,
 )
 from functools import partial
+from array import array
+from operator import itemgetter
 from collections import defaultdict
-from heapq import heappush, heappop
+from heapq import heapify, heappush, heappop
+from bisect import bisect_left
 
 
 NO_VARIATION_INDEX = ot.NO_VARIATION_INDEX
@@ -21,6 +24,49 @@ def _getLocationKey(loc):
     return tuple(sorted(loc.items(), key=lambda kv: kv[0]))
 
 
+class _VarDataRows(object):
+    """Delta rows of a VarData being built, stored flat in a compact array.
+
+    Keeping rows as machine ints instead of a list of Python int lists
+    cuts the memory taken by builders that collect millions of rows."""
+
+    def __init__(self, regionCount):
+        self.regionCount = regionCount
+        self.values = array("i")
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def extend(self, rows):
+        for row in rows:
+            self.values.extend(row)
+        self.count += len(rows)
+
+    def matches(self, inner, rows):
+        """Returns whether rows are stored starting at row inner."""
+        if inner + len(rows) > self.count:
+            return False
+        n = self.regionCount
+        values = array("i")
+        for row in rows:
+            values.extend(row)
+        return self.values[inner * n : (inner + len(rows)) * n] == values
+
+    def items(self, ints):
+        """Returns the rows as lists, sharing equal int objects through the
+        ints dict."""
+        n = self.regionCount
+        if not n:
+            return [[] for _ in range(self.count)]
+        values = self.values
+        intern = ints.setdefault
+        return [
+            list(map(intern, row, row))
+            for row in (values[i : i + n] for i in range(0, len(values), n))
+        ]
+
+
 class OnlineVarStoreBuilder(object):
     def __init__(self, axisTags):
         self._axisTags = axisTags
@@ -28,11 +74,14 @@ class OnlineVarStoreBuilder(object):
         self._regionList = buildVarRegionList([], axisTags)
         self._store = buildVarStore(self._regionList, [])
         self._data = None
+        self._rows = None
+        self._dataRows = []
         self._model = None
         self._supports = None
         self._varDataIndices = {}
         self._varDataCaches = {}
         self._cache = None
+        self._collisions = None
 
     def setModel(self, model):
         self.setSupports(model.supports)
@@ -44,12 +93,18 @@ class OnlineVarStoreBuilder(object):
         if self._supports and not self._supports[0]:
             del self._supports[0]  # Drop base master support
         self._cache = None
+        self._collisions = None
         self._data = None
+        self._rows = None
 
     def finish(self, optimize=True):
         self._regionList.RegionCount = len(self._regionList.Region)
         self._store.VarDataCount = len(self._store.VarData)
-        for data in self._store.VarData:
+        # Write out the VarData items from the row buffers; deltas repeat a
+        # lot, so their int objects are shared.
+        ints = {}
+        for data, rows in zip(self._store.VarData, self._dataRows):
+            data.Item = rows.items(ints)
             data.ItemCount = len(data.Item)
             data.calculateNumShorts(optimize=optimize)
         return self._store
@@ -75,19 +130,47 @@ class OnlineVarStoreBuilder(object):
         if varDataIdx is not None:
             self._outer = varDataIdx
             self._data = self._store.VarData[varDataIdx]
-            self._cache = self._varDataCaches[key]
-            if len(self._data.Item) + num_items > 0xFFFF:
+            self._rows = self._dataRows[varDataIdx]
+            self._cache, self._collisions = self._varDataCaches[key]
+            if len(self._rows) + num_items > 0xFFFF:
                 # This is full.  Need new one.
                 varDataIdx = None
 
         if varDataIdx is None:
             self._data = buildVarData(regionIndices, [], optimize=False)
+            self._rows = _VarDataRows(len(regionIndices))
             self._outer = len(self._store.VarData)
             self._store.VarData.append(self._data)
+            self._dataRows.append(self._rows)
             self._varDataIndices[key] = self._outer
             if key not in self._varDataCaches:
-                self._varDataCaches[key] = {}
-            self._cache = self._varDataCaches[key]
+                # Rows are deduplicated by their hash alone, to not keep a
+                # copy of each row around as a dict key; the rare rows
+                # whose hash is already taken by another row are cached
+                # separately.
+                self._varDataCaches[key] = ({}, {})
+            self._cache, self._collisions = self._varDataCaches[key]
+
+    def _lookup(self, key, rows):
+        varIdx = self._cache.get(hash(key))
+        if varIdx is not None:
+            if self._dataRows[varIdx >> 16].matches(varIdx & 0xFFFF, rows):
+                return varIdx
+            return self._collisions.get(key)
+        return None
+
+    def _remember(self, key, varIdx):
+        h = hash(key)
+        if h in self._cache:
+            self._collisions[key] = varIdx
+        else:
+            self._cache[h] = varIdx
+
+    def _trimDeltas(self, deltas):
+        if len(deltas) == len(self._supports) + 1:
+            return tuple(deltas[1:])
+        assert len(deltas) == len(self._supports)
+        return tuple(deltas)
 
     def storeMasters(self, master_values, *, round=round):
         deltas = self._model.getDeltas(master_values, round=round)
@@ -103,55 +186,51 @@ class OnlineVarStoreBuilder(object):
         return base_list, self.storeDeltasMany(deltas_list, round=noRound)
 
     def storeDeltas(self, deltas, *, round=round):
-        deltas = [round(d) for d in deltas]
-        if len(deltas) == len(self._supports) + 1:
-            deltas = tuple(deltas[1:])
-        else:
-            assert len(deltas) == len(self._supports)
-            deltas = tuple(deltas)
+        deltas = self._trimDeltas([round(d) for d in deltas])
 
         if not self._data:
             self._add_VarData()
 
-        varIdx = self._cache.get(deltas)
+        varIdx = self._lookup(deltas, (deltas,))
         if varIdx is not None:
             return varIdx
 
-        inner = len(self._data.Item)
+        inner = len(self._rows)
         if inner == 0xFFFF:
             # Full array. Start new one.
             self._add_VarData()
             return self.storeDeltas(deltas, round=noRound)
-        self._data.addItem(deltas, round=noRound)
+        self._rows.extend((deltas,))
 
         varIdx = (self._outer << 16) + inner
-        self._cache[deltas] = varIdx
+        self._remember(deltas, varIdx)
         return varIdx
 
     def storeDeltasMany(self, deltas_list, *, round=round):
-        deltas_list = [[round(d) for d in deltas] for deltas in deltas_list]
-        deltas_list = tuple(tuple(deltas) for deltas in deltas_list)
+        deltas_list = tuple(
+            self._trimDeltas([round(d) for d in deltas]) for deltas in deltas_list
+        )
 
         if not self._data:
             self._add_VarData(len(deltas_list))
 
-        varIdx = self._cache.get(deltas_list)
+        varIdx = self._lookup(deltas_list, deltas_list)
         if varIdx is not None:
             return varIdx
 
-        inner = len(self._data.Item)
+        inner = len(self._rows)
         if inner + len(deltas_list) > 0xFFFF:
             # Full array. Start new one.
             self._add_VarData(len(deltas_list))
             return self.storeDeltasMany(deltas_list, round=noRound)
-        for i, deltas in enumerate(deltas_list):
-            self._data.addItem(deltas, round=noRound)
+        self._rows.extend(deltas_list)
 
+        for i, deltas in enumerate(deltas_list):
             varIdx = (self._outer << 16) + inner + i
-            self._cache[deltas] = varIdx
+            self._remember(deltas, varIdx)
 
         varIdx = (self._outer << 16) + inner
-        self._cache[deltas_list] = varIdx
+        self._remember(deltas_list, varIdx)
 
         return varIdx
 
@@ -197,6 +276,7 @@ class VarStoreInstancer(object):
         assert varstore is None or varstore.Format == 1
         self._varData = varstore.VarData if varstore else []
         self._regions = varstore.VarRegionList.Region if varstore else []
+        self._regionScalars = None
         self.setLocation(location)
 
     def setLocation(self, location):
@@ -204,15 +284,31 @@ class VarStoreInstancer(object):
         self._clearCaches()
 
     def _clearCaches(self):
-        self._scalars = {}
+        self._scalars = None
+        self._varDataScalars = {}
 
     def _getScalar(self, regionIdx):
-        scalar = self._scalars.get(regionIdx)
-        if scalar is None:
-            support = self._regions[regionIdx].get_support(self.fvar_axes)
-            scalar = supportScalar(self.location, support)
-            self._scalars[regionIdx] = scalar
-        return scalar
+        # The scalars of all regions are computed together the first time any
+        # is needed at a location, and are cached for recently used locations.
+        scalars = self._scalars
+        if scalars is None:
+            regionScalars = self._regionScalars
+            if regionScalars is None:
+                regionScalars = self._regionScalars = RegionScalars(
+                    [region.get_support(self.fvar_axes) for region in self._regions]
+                )
+            scalars = self._scalars = regionScalars(self.location)
+        return scalars[regionIdx]
+
+    def _getScalars(self, varDataIndex):
+        # The scalar vector of a VarData only depends on the location, so
+        # compute it once and reuse it for every item (or CFF2 blend) of it.
+        scalars = self._varDataScalars.get(varDataIndex)
+        if scalars is None:
+            regionIndices = self._varData[varDataIndex].VarRegionIndex
+            scalars = [self._getScalar(ri) for ri in regionIndices]
+            self._varDataScalars[varDataIndex] = scalars
+        return scalars
 
     @staticmethod
     def interpolateFromDeltasAndScalars(deltas, scalars):
@@ -227,14 +323,12 @@ class VarStoreInstancer(object):
         major, minor = varidx >> 16, varidx & 0xFFFF
         if varidx == NO_VARIATION_INDEX:
             return 0.0
-        varData = self._varData
-        scalars = [self._getScalar(ri) for ri in varData[major].VarRegionIndex]
-        deltas = varData[major].Item[minor]
+        scalars = self._getScalars(major)
+        deltas = self._varData[major].Item[minor]
         return self.interpolateFromDeltasAndScalars(deltas, scalars)
 
     def interpolateFromDeltas(self, varDataIndex, deltas):
-        varData = self._varData
-        scalars = [self._getScalar(ri) for ri in varData[varDataIndex].VarRegionIndex]
+        scalars = self._getScalars(varDataIndex)
         return self.interpolateFromDeltasAndScalars(deltas, scalars)
 
 
@@ -454,37 +548,44 @@ class _EncodingDict(dict):
         r = self[chars] = _Encoding(chars)
         return r
 
-    def add_row(self, row):
-        chars = self._row_characteristics(row)
+    def add_row(self, row, columns=None):
+        chars = self._row_characteristics(row, columns)
         self[chars].append(row)
 
     @staticmethod
-    def _row_characteristics(row):
-        """Returns encoding characteristics for a row."""
+    def _row_characteristics(row, columns=None):
+        """Returns encoding characteristics for a row.
+
+        If columns is given, it is a sorted list of the only indices
+        at which row can be non-zero."""
+        if columns is None:
+            columns = range(len(row))
         longWords = False
 
         chars = 0
-        i = 1
-        for v in row:
-            if v:
-                chars += i
+        for column in columns:
+            v = row[column]
+            if not v:
+                continue
+            i = 1 << (column * 4)
+            chars += i
             if not (-128 <= v <= 127):
                 chars += i * 0b0010
             if not (-32768 <= v <= 32767):
                 longWords = True
                 break
-            i <<= 4
 
         if longWords:
             # Redo; only allow 2byte/4byte encoding
             chars = 0
-            i = 1
-            for v in row:
-                if v:
-                    chars += i * 0b0011
+            for column in columns:
+                v = row[column]
+                if not v:
+                    continue
+                i = 1 << (column * 4)
+                chars += i * 0b0011
                 if not (-32768 <= v <= 32767):
                     chars += i * 0b1100
-                i <<= 4
 
         return chars
 
@@ -575,26 +676,37 @@ def VarStore_optimize(self, use_NO_VARIATION_INDEX=True, quantization=1):
     # Collect all items into a set of full rows (with lots of zeroes.)
     for major, data in enumerate(self.VarData):
         regionIndices = data.VarRegionIndex
+        numColumns = len(regionIndices)
+        columns = sorted(set(regionIndices))
+
+        # Unless a region is referenced twice, a full row can be gathered
+        # from the item padded with a zero, with a single itemgetter call.
+        getRow = None
+        if n > 1 and len(columns) == numColumns:
+            positions = [numColumns] * n
+            for position, regionIdx in enumerate(regionIndices):
+                positions[regionIdx] = position
+            getRow = itemgetter(*positions)
 
         for minor, item in enumerate(data.Item):
-            row = list(zeroes)
+            if quantization != 1:
+                item = [
+                    round(v / quantization) * quantization for v in item
+                ]  # TODO https://github.com/fonttools/fonttools/pull/3126#discussion_r1205439785
 
-            if quantization == 1:
-                for regionIdx, v in zip(regionIndices, item):
-                    row[regionIdx] += v
+            if getRow is not None and len(item) == numColumns:
+                row = getRow([*item, 0])
             else:
+                row = list(zeroes)
                 for regionIdx, v in zip(regionIndices, item):
-                    row[regionIdx] += (
-                        round(v / quantization) * quantization
-                    )  # TODO https://github.com/fonttools/fonttools/pull/3126#discussion_r1205439785
-
-            row = tuple(row)
+                    row[regionIdx] += v
+                row = tuple(row)
 
             if use_NO_VARIATION_INDEX and not any(row):
                 front_mapping[(major << 16) + minor] = None
                 continue
 
-            encodings.add_row(row)
+            encodings.add_row(row, columns)
             front_mapping[(major << 16) + minor] = row
 
     # Prepare for the main algorithm.
@@ -602,22 +714,57 @@ def VarStore_optimize(self, use_NO_VARIATION_INDEX=True, quantization=1):
     del encodings
 
     # Repeatedly pick two best encodings to combine, and combine them.
+    #
+    # Computing the pairwise gains dominates the running time, so it is done
+    # inline on flat lists of the encodings' properties.  With s the number
+    # of characteristic bits two encodings share, the gain_from_merging()
+    # formula simplifies to:
+    #
+    #   10 + 2 * (number of shared columns)
+    #      - (width_j - s) * count_i - (width_i - s) * count_j
+    #
+    # The gain can not exceed the smaller of the two overheads, minus the
+    # bytes that widening the narrower encoding to the wider one's width
+    # costs; pairs for which this bound is not positive are skipped.  Heap
+    # entries (-gain, i, j) are packed into single ints, which order the
+    # same as the tuples but compare faster.  Entries referring to
+    # encodings that have since been merged are skipped when popped.
+
+    chars = [encoding.chars for encoding in todo]
+    widths = [encoding.width for encoding in todo]
+    columns = [encoding.columns for encoding in todo]
+    overheads = [encoding.overhead for encoding in todo]
+    counts = [len(encoding.items) for encoding in todo]
 
     heap = []
-    for i, encoding in enumerate(todo):
-        for j in range(i + 1, len(todo)):
-            other_encoding = todo[j]
-            combining_gain = encoding.gain_from_merging(other_encoding)
+    for i in range(len(todo)):
+        chars_i, width_i, columns_i = chars[i], widths[i], columns[i]
+        count_i = counts[i]
+        # todo is sorted by width; all encodings from end on are too wide
+        # to merge into this one with any gain.
+        end = bisect_left(widths, width_i + -(-overheads[i] // count_i), i + 1)
+        for j in range(i + 1, end):
+            shared = bit_count(chars_i & chars[j])
+            combining_gain = (
+                10
+                + 2 * bit_count(columns_i & columns[j])
+                - (widths[j] - shared) * count_i
+                - (width_i - shared) * counts[j]
+            )
             if combining_gain > 0:
-                heappush(heap, (-combining_gain, i, j))
+                heap.append((-combining_gain << 64) | (i << 32) | j)
+    heapify(heap)
 
+    alive = dict.fromkeys(range(len(todo)))  # Ordered set of todo indices
     while heap:
-        _, i, j = heappop(heap)
-        if todo[i] is None or todo[j] is None:
+        key = heappop(heap)
+        i, j = (key >> 32) & 0xFFFFFFFF, key & 0xFFFFFFFF
+        if i not in alive or j not in alive:
             continue
 
         encoding, other_encoding = todo[i], todo[j]
         todo[i], todo[j] = None, None
+        del alive[i], alive[j]
 
         # Combine the two encodings
         combined_chars = other_encoding.chars | encoding.chars
@@ -625,22 +772,46 @@ def VarStore_optimize(self, use_NO_VARIATION_INDEX=True, quantization=1):
         combined_encoding.extend(encoding.items)
         combined_encoding.extend(other_encoding.items)
 
-        for k, enc in enumerate(todo):
-            if enc is None:
-                continue
-
+        new = len(todo)
+        width_new = combined_encoding.width
+        columns_new = combined_encoding.columns
+        overhead_new = combined_encoding.overhead
+        count_new = len(combined_encoding.items)
+        for k in list(alive):
             # In the unlikely event that the same encoding exists already,
             # combine it.
-            if enc.chars == combined_chars:
-                combined_encoding.extend(enc.items)
+            if chars[k] == combined_chars:
+                combined_encoding.extend(todo[k].items)
+                count_new = len(combined_encoding.items)
                 todo[k] = None
+                del alive[k]
                 continue
 
-            combining_gain = combined_encoding.gain_from_merging(enc)
+            width_k, count_k = widths[k], counts[k]
+            bound = min(overheads[k], overhead_new)
+            if width_k < width_new:
+                bound -= (width_new - width_k) * count_k
+            else:
+                bound -= (width_k - width_new) * count_new
+            if bound <= 0:
+                continue
+            shared = bit_count(chars[k] & combined_chars)
+            combining_gain = (
+                10
+                + 2 * bit_count(columns[k] & columns_new)
+                - (width_new - shared) * count_k
+                - (width_k - shared) * count_new
+            )
             if combining_gain > 0:
-                heappush(heap, (-combining_gain, k, len(todo)))
+                heappush(heap, (-combining_gain << 64) | (k << 32) | new)
 
         todo.append(combined_encoding)
+        alive[new] = None
+        chars.append(combined_chars)
+        widths.append(width_new)
+        columns.append(columns_new)
+        overheads.append(overhead_new)
+        counts.append(count_new)
 
     encodings = [encoding for encoding in todo if encoding is not None]
 
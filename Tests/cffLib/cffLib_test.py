@@ -1,4 +1,16 @@
-from fontTools.cffLib import TopDict, PrivateDict, CharStrings
+from fontTools.cffLib import (
+    TopDict,
+    PrivateDict,
+    CharStrings,
+    FDSelect,
+    packCharset,
+    packCharset0,
+    packFDSelect0,
+    packFDSelect3,
+    packFDSelect4,
+    parseCharset,
+    parseCharset0,
+)
 from fontTools.misc.testTools import parseXML, DataFilesHandler
 from fontTools.ttLib import TTFont
 import copy
@@ -104,6 +116,36 @@ class CffLibTest(DataFilesHandler):
         self.assertEqual(topDict2.FDSelect.format, 4)
         self.assertEqual(topDict2.FDSelect.gidArray, [0, 0, 1])
 
+    def test_FDSelect_pack_parse_roundtrip(self):
+        gidArray = [0] * 10 + [2] * 300 + [1] + [0] * 5
+        for fmt, pack in [
+            (0, packFDSelect0),
+            (3, packFDSelect3),
+            (4, packFDSelect4),
+        ]:
+            data = pack(gidArray)
+            fdSelect = FDSelect(BytesIO(data), len(gidArray))
+            self.assertEqual(fdSelect.format, fmt)
+            self.assertEqual(fdSelect.gidArray, gidArray)
+        self.assertEqual(len(packFDSelect3(gidArray)), 5 + 3 * 4)
+
+    def test_charset_CID_pack_parse_roundtrip(self):
+        cids = [1, 2, 3, 500, *range(1000, 1400)]
+        charset = [".notdef"] + ["cid%05d" % cid for cid in cids]
+        numGlyphs = len(charset)
+
+        data = packCharset0(charset, True, None)
+        file = BytesIO(data)
+        self.assertEqual(file.read(1), b"\0")
+        self.assertEqual(parseCharset0(numGlyphs, file, None, True), charset)
+
+        data = packCharset(charset, True, None)
+        file = BytesIO(data)
+        # the 400-glyph run does not fit in format 1's Card8 nLeft
+        self.assertEqual(file.read(1), b"\2")
+        self.assertEqual(parseCharset(numGlyphs, file, None, True, 2), charset)
+        self.assertEqual(len(data), 1 + 3 * 4)
+
     def test_unique_glyph_names(self):
         font_path = self.getpath("LinLibertine_RBI.otf")
         font = TTFont(font_path, recalcBBoxes=False, recalcTimestamp=False)
@@ -131,6 +173,35 @@ class CFFToCFF2Test(DataFilesHandler):
         f = BytesIO()
         font.save(f)
 
+    def test_roundtrip(self):
+        font_path = self.getpath("CFFToCFF2-1.otf")
+        from fontTools.cffLib.CFFToCFF2 import convertCFFToCFF2
+        from fontTools.cffLib.CFF2ToCFF import convertCFF2ToCFF
+        from fontTools.pens.recordingPen import RecordingPen
+
+        font = TTFont(font_path)
+        convertCFFToCFF2(font)
+        f = BytesIO()
+        font.save(f)
+
+        font = TTFont(f, recalcBBoxes=False)
+        convertCFF2ToCFF(font)
+        f = BytesIO()
+        font.save(f)
+
+        font = TTFont(f)
+        topDict = font["CFF "].cff.topDictIndex[0]
+        origFont = TTFont(font_path)
+        origCharStrings = origFont["CFF "].cff.topDictIndex[0].CharStrings
+        for glyphID, glyphName in enumerate(origFont.getGlyphOrder()):
+            expected = RecordingPen()
+            origCharStrings[glyphName].draw(expected)
+            cs = topDict.CharStrings[topDict.charset[glyphID]]
+            pen = RecordingPen()
+            cs.draw(pen)
+            self.assertEqual(pen.value, expected.value)
+            self.assertEqual(cs.width, origFont["hmtx"][glyphName][0])
+
 
 if __name__ == "__main__":
     sys.exit(unittest.main())
@@ -1,4 +1,5 @@
-from fontTools.misc.classifyTools import classify
+from fontTools.misc.classifyTools import Classifier, classify
+import random
 
 
 def test_classify():
@@ -31,3 +32,38 @@ def test_classify():
         [frozenset(s) for s in ({1, 9}, {4}, {2}, {5}, {15})]
     )
     assert mapping == {1: {1, 9}, 2: {2}, 4: {4}, 5: {5}, 9: {1, 9}, 15: {15}}
+
+
+def test_classify_repeated_sets():
+    assert classify([[1, 2], [3], [1, 2]], sort=False) == (
+        [{3}, {1, 2}],
+        {1: {1, 2}, 2: {1, 2}, 3: {3}},
+    )
+    assert classify([[1, 2, 3], [1, 2], [3, 4], [1, 2]]) == (
+        [{1, 2}, {3}, {4}],
+        {1: {1, 2}, 2: {1, 2}, 3: {3}, 4: {4}},
+    )
+
+
+def test_classifier_incremental():
+    classifier = Classifier()
+    classifier.update([[1, 2, 3], [3, 4]])
+    assert classifier.getClasses() == [{1, 2}, {3}, {4}]
+    classifier.add([2])
+    assert classifier.getClasses() == [{1}, {2}, {3}, {4}]
+    assert classifier.getThings() == {1, 2, 3, 4}
+
+
+def test_classify_random():
+    rng = random.Random(0)
+    for _ in range(50):
+        sets = [rng.sample(range(30), rng.randint(0, 10)) for _ in range(8)]
+        sets += rng.sample(sets, 3)
+        classes, mapping = classify(sets)
+        # Things are in the same class iff they are in the same input sets.
+        signature = lambda thing: [thing in s for s in sets]
+        for thing, c in mapping.items():
+            assert thing in c
+            assert all(signature(other) == signature(thing) for other in c)
+        assert sum(len(c) for c in classes) == len(mapping)
+        assert len({tuple(signature(thing)) for thing in mapping}) == len(classes)
@@ -0,0 +1,45 @@
+from fontTools.misc.hungarian import linearSumAssignment
+from fontTools.varLib.interpolatableHelpers import (
+    matching_cost,
+    min_cost_perfect_bipartite_matching_bruteforce,
+)
+import random
+import pytest
+
+
+@pytest.mark.parametrize("n", range(1, 7))
+def test_linearSumAssignment_bruteforce(n):
+    rng = random.Random(n)
+    for _ in range(20):
+        G = [[rng.uniform(-100, 100) for _ in range(n)] for _ in range(n)]
+        cols = linearSumAssignment(G)
+        assert sorted(cols) == list(range(n))
+        _, expected = min_cost_perfect_bipartite_matching_bruteforce(G)
+        assert matching_cost(G, cols) == pytest.approx(expected)
+
+
+def test_linearSumAssignment_ties():
+    assert linearSumAssignment([[0] * 4] * 4) == [0, 1, 2, 3]
+    G = [[abs(i - j) for j in range(10)] for i in range(10)]
+    assert linearSumAssignment(G) == list(range(10))
+    G = [[1 if i == j else 0 for j in range(10)] for i in range(10)]
+    assert matching_cost(G, linearSumAssignment(G)) == 0
+
+
+def test_linearSumAssignment_scipy():
+    pytest.importorskip("scipy")
+    from scipy.optimize import linear_sum_assignment
+
+    rng = random.Random(0)
+    for n in (10, 30, 100):
+        G = [[rng.uniform(0, 1000) for _ in range(n)] for _ in range(n)]
+        _, expected = linear_sum_assignment(G)
+        cols = linearSumAssignment(G)
+        assert matching_cost(G, cols) == pytest.approx(matching_cost(G, expected))
+
+
+def test_linearSumAssignment_errors():
+    with pytest.raises(ValueError, match="not square"):
+        linearSumAssignment([[1, 2]])
+    with pytest.raises(ValueError, match="infeasible"):
+        linearSumAssignment([[float("inf")] * 2] * 2)
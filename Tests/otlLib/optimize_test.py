@@ -1,4 +1,5 @@
 import contextlib
+import io
 import logging
 import os
 from pathlib import Path
@@ -164,3 +165,27 @@ def test_optimization_mode(
     addOpenTypeFeaturesFromString(fb.font, features)
     assert expected_subtables == count_pairpos_subtables(fb.font)
     assert expected_bytes == count_pairpos_bytes(fb.font)
+
+
+def test_compact_jobs():
+    """Check that compacting lookups in parallel processes gives the same
+    result as compacting them one after the other."""
+    from fontTools.otlLib.optimize.gpos import compact
+
+    glyphs, features = get_kerning_by_blocks([(4, 4) for _ in range(10)])
+    other_glyphs, other_features = get_kerning_by_blocks([(15, 3), (2, 10)])
+    other_glyphs = [g.replace("g_", "h_") for g in other_glyphs]
+    other_features = other_features.replace("g_", "h_").replace("kern", "dist")
+
+    fb = FontBuilder(1000)
+    fb.setupGlyphOrder([".notdef", "space"] + glyphs + other_glyphs)
+    addOpenTypeFeaturesFromString(fb.font, features + other_features)
+    buf = io.BytesIO()
+    fb.save(buf)
+
+    results = []
+    for jobs in (1, 2):
+        buf.seek(0)
+        font = compact(TTFont(buf), 9, jobs=jobs)
+        results.append((count_pairpos_subtables(font), count_pairpos_bytes(font)))
+    assert results[0] == results[1] == (12, 1244)
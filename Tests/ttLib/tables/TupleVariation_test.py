@@ -12,6 +12,8 @@ from fontTools.ttLib.tables.TupleVariation import (
     inferRegion_,
 )
 from io import BytesIO
+import copy
+import pickle
 import random
 import unittest
 
@@ -410,6 +412,48 @@ class TupleVariationTest(unittest.TestCase):
             hexencode(deltas),
         )
 
+    def test_getCompiledSize(self):
+        axisTags = ["wght", "wdth"]
+        for axes in (
+            {"wght": (0.0, 0.5, 0.5), "wdth": (0.0, 0.8, 0.8)},
+            {"wght": (0.0, 0.5, 1.0), "wdth": (0.0, 0.8, 1.0)},
+        ):
+            for coordinates in (
+                [(7, 4), (8, 5), (9, 6)],
+                [(7, 4), None, (300, 0)],
+                [None, None, None],
+            ):
+                var = TupleVariation(axes, coordinates)
+                for sharedPeakIndices in ({}, {var.compileCoord(axisTags): 0x77}):
+                    for pointData in (None, b""):
+                        tup, deltas = var.compile(
+                            axisTags, sharedPeakIndices, pointData
+                        )
+                        self.assertEqual(
+                            len(tup) + len(deltas),
+                            var.getCompiledSize(axisTags, sharedPeakIndices, pointData),
+                        )
+
+    def test_compileDeltas_modifiedCoordinates(self):
+        var = TupleVariation({}, [(1, 0), (2, 0)])
+        self.assertEqual("01 01 02 81", hexencode(var.compileDeltas()))
+        var.coordinates[1] = (300, 0)
+        self.assertEqual("00 01 40 01 2C 81", hexencode(var.compileDeltas()))
+        self.assertEqual(
+            "41 00 01 01 2C 81", hexencode(var.compileDeltas(optimizeSize=False))
+        )
+
+    def test_compileDeltas_cacheNotKept(self):
+        var = TupleVariation({"wght": (0.0, 1.0, 1.0)}, [(1, 0), (2, 0)])
+        var.getCompiledSize(["wght"])
+        self.assertIsNotNone(var._compiledDeltas)
+        self.assertIsNone(copy.deepcopy(var)._compiledDeltas)
+        self.assertIsNone(pickle.loads(pickle.dumps(var))._compiledDeltas)
+        self.assertEqual(copy.deepcopy(var), var)
+
+        compileTupleVariationStore([var], 2, ["wght"], {})
+        self.assertIsNone(var._compiledDeltas)
+
     def test_compileCoord(self):
         var = TupleVariation(
             {"wght": (-1.0, -1.0, -1.0), "wdth": (0.4, 0.5, 0.6)}, [None] * 4
@@ -25,3 +25,26 @@ def test_lazy_open_file(lazy):
         assert len(collection) == 2
         assert collection[0]["maxp"].numGlyphs == 6
         assert collection[1]["maxp"].numGlyphs == 6
+
+
+def test_getSharingReport():
+    from fontTools.ttLib import TTFont
+
+    otf_path = TTX_DATA_DIR / "TestOTF.otf"
+    collection = TTCollection()
+    collection.fonts = [TTFont(otf_path), TTFont(otf_path), TTFont(otf_path)]
+    # make the last member's CFF table differ, without touching any glyphs
+    collection.fonts[2]["CFF "].cff.topDictIndex[0].Notice = "Something else"
+
+    report = collection.getSharingReport()
+
+    headSize = len(collection.fonts[0].getTableData("head"))
+    assert report["head"] == (3 * headSize, headSize)
+
+    sizes = [len(font.getTableData("CFF ")) for font in collection.fonts]
+    assert report["CFF "] == (sum(sizes), sizes[0] + sizes[2])
+
+    # charstrings are only counted once per distinct CFF table
+    total, unique = report["CFF .CharStrings"]
+    assert total == 2 * unique
+    assert "CFF .GlobalSubrs" in report
@@ -8,6 +8,7 @@ from fontTools.pens.recordingPen import (
 )
 from fontTools.misc.roundTools import otRound
 from fontTools.misc.transform import DecomposedTransform
+from copy import deepcopy
 import os
 import pytest
 
@@ -212,6 +213,68 @@ class TTGlyphSetTest(object):
 
         assert actual == expected, (locations, actual, expected)
 
+    def test_glyphset_cff2_setLocation(self):
+        font = TTFont(self.getpath("I.otf"))
+        glyphset = font.getGlyphSet(location={"wght": 400})
+        instancer = glyphset.blendInstancer
+        assert instancer is not None
+
+        for location in ({"wght": 1000}, {"wght": 700}, {"wght": 400}):
+            normalized = font.normalizeLocation(location)
+            glyphset.setLocation(normalized)
+            # the same VarStoreInstancer is reused across locations
+            assert glyphset.blendInstancer is instancer
+
+            pen = RecordingPen()
+            glyphset["I"].draw(pen)
+            expected = RecordingPen()
+            font.getGlyphSet(location=location)["I"].draw(expected)
+            assert pen.value == expected.value, location
+
+    def test_glyphset_gvarInterpolator(self):
+        from fontTools.ttLib.tables._g_l_y_f import GlyphCoordinates
+        from fontTools.varLib.models import supportScalar
+
+        font = TTFont(self.getpath("I.ttf"))
+        glyfTable = font["glyf"]
+        variations = font["gvar"].variations["I"]
+
+        def expected(location):
+            coords, control = glyfTable._getCoordinatesAndControls(
+                "I", font["hmtx"].metrics
+            )
+            for var in variations:
+                var = deepcopy(var)
+                var.calcInferredDeltas(coords.copy(), control.endPts)
+                scalar = supportScalar(location, var.axes)
+                coords += GlyphCoordinates(var.coordinates) * scalar
+            return coords
+
+        glyphset = font.getGlyphSet(location={"wght": 1000})
+        interpolator = glyphset.gvarInterpolator
+        assert isinstance(interpolator, ttGlyphSet.GvarInterpolator)
+        assert font.getGlyphSet(location={"wght": 100}).gvarInterpolator is interpolator
+
+        locations = [{"wght": 1.0}, {"wght": -0.5, "wdth": 0.3, "XOPQ": 0.7}]
+        for location in locations:
+            assert interpolator.getCoordinates("I", location) == expected(location)
+
+        # Tuple variations rebind their coordinates when scaled.
+        for var in variations:
+            var.scaleDeltas(0.5)
+        for location in locations:
+            assert interpolator.getCoordinates("I", location) == expected(location)
+
+        pen = RecordingPen()
+        glyphset["I"].draw(pen)
+        assert pen.value == [
+            ("moveTo", ((151.5, 0.0),)),
+            ("lineTo", ((458.5, 0.0),)),
+            ("lineTo", ((458.5, 1456.0),)),
+            ("lineTo", ((151.5, 1456.0),)),
+            ("closePath", ()),
+        ]
+
     def test_glyphset_varComposite_components(self):
         font = TTFont(self.getpath("varc-ac00-ac01.ttf"))
         glyphset = font.getGlyphSet()
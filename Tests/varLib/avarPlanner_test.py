@@ -0,0 +1,91 @@
+from fontTools.ttLib import TTFont
+from fontTools.varLib import avarPlanner
+from io import BytesIO
+import multiprocessing as mp
+import os
+import pytest
+
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
+
+
+@pytest.fixture(scope="module")
+def varfont():
+    font = TTFont()
+    font.importXML(os.path.join(DATA_DIR, "MutatorSans_All_Variable.ttx"))
+    buf = BytesIO()
+    font.save(buf)
+    buf.seek(0)
+    return TTFont(buf)
+
+
+@pytest.mark.parametrize(
+    "measureFunc",
+    [avarPlanner.measureWeight, avarPlanner.measureWidth, avarPlanner.measureSlant],
+)
+@pytest.mark.parametrize("location", [{}, {"wght": 700}, {"wght": 300, "wdth": 800}])
+def test_measure_cached_glyphset(varfont, measureFunc, location):
+    glyphs = varfont.getGlyphOrder()[1:]
+    # Components are measured once per location; the result is the same.
+    assert any(varfont["glyf"][g].isComposite() for g in glyphs)
+    expected = measureFunc(varfont.getGlyphSet(location=location), glyphs)
+
+    glyphset = avarPlanner._CachedGlyphSet(varfont.getGlyphSet(location=location))
+    assert measureFunc(glyphset, glyphs) == expected
+    assert measureFunc(glyphset, glyphs) == expected
+
+
+def test_planWeightAxis_jobs_and_cache(varfont):
+    axisLimits = (0, 0, 1000)
+    glyphs = varfont.getGlyphOrder()
+    expected = avarPlanner.planWeightAxis(
+        varfont.getGlyphSet, axisLimits, glyphs=glyphs
+    )
+    assert expected[0]
+
+    cache = {}
+    assert (
+        avarPlanner.planWeightAxis(
+            varfont.getGlyphSet, axisLimits, glyphs=glyphs, jobs=2, cache=cache
+        )
+        == expected
+    )
+    assert cache
+
+    def glyphSetFunc(location):
+        raise AssertionError("measurements should all be cached")
+
+    assert (
+        avarPlanner.planWeightAxis(glyphSetFunc, axisLimits, glyphs=glyphs, cache=cache)
+        == expected
+    )
+
+
+def test_planWeightAxis_jobs_spawn(varfont, tmp_path, monkeypatch):
+    # The worker processes load the font from its data, rather than inherit
+    # it, as with the default start method on macOS and Windows.
+    monkeypatch.setattr(avarPlanner, "mp", mp.get_context("spawn"))
+    axisLimits = (0, 0, 1000)
+    glyphs = ["A", "B", "C"]
+    expected = avarPlanner.planWeightAxis(
+        varfont.getGlyphSet, axisLimits, glyphs=glyphs
+    )
+
+    path = tmp_path / "MutatorSans.ttf"
+    varfont.save(path)
+    font = TTFont(path)
+    # The glyph variations of a font read lazily can't be pickled.
+    font.getGlyphSet()
+    assert (
+        avarPlanner.planWeightAxis(font.getGlyphSet, axisLimits, glyphs=glyphs, jobs=2)
+        == expected
+    )
+
+    # Other callables can't be sent to the workers, and are measured serially.
+    def glyphSetFunc(location):
+        return font.getGlyphSet(location=location)
+
+    assert (
+        avarPlanner.planWeightAxis(glyphSetFunc, axisLimits, glyphs=glyphs, jobs=2)
+        == expected
+    )
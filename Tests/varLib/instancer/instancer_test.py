@@ -10,6 +10,7 @@ from fontTools.ttLib.tables import otTables
 from fontTools.ttLib.tables.TupleVariation import TupleVariation
 from fontTools import varLib
 from fontTools.varLib import instancer
+from fontTools.varLib.iup import iup_delta
 from fontTools.varLib.mvar import MVAR_ENTRIES
 from fontTools.varLib import builder
 from fontTools.varLib import featureVars
@@ -216,6 +217,24 @@ class InstantiateGvarTest(object):
             for t in tuples
         )
 
+    def test_pin_axis_fast_iup(self, varfont):
+        location = instancer.NormalizedAxisLimits(wdth=-0.5)
+        unoptimized = deepcopy(varfont)
+
+        instancer.instantiateGvar(varfont, location, fastIUP=True)
+        instancer.instantiateGvar(unoptimized, location, optimize=False)
+
+        glyf, hMetrics = varfont["glyf"], varfont["hmtx"].metrics
+        assert list(varfont["gvar"].variations) == list(unoptimized["gvar"].variations)
+        for glyphName, variations in varfont["gvar"].variations.items():
+            coords, control = glyf._getCoordinatesAndControls(glyphName, hMetrics)
+            expected = unoptimized["gvar"].variations[glyphName]
+            for var, expectedVar in zip(variations, expected):
+                assert var.axes == expectedVar.axes
+                deltas = iup_delta(var.coordinates, coords, list(control.endPts))
+                for (x, y), (p, q) in zip(deltas, expectedVar.coordinates):
+                    assert abs(complex(x - p, y - q)) <= 0.5
+
     def test_full_instance(self, varfont, optimize):
         location = instancer.NormalizedAxisLimits(wght=0.0, wdth=-0.5)
 
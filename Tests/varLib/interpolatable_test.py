@@ -1,5 +1,11 @@
+import fontTools
 from fontTools.ttLib import TTFont
-from fontTools.varLib.interpolatable import main as interpolatable_main
+from fontTools.varLib.interpolatable import (
+    load_cache,
+    main as interpolatable_main,
+    save_cache,
+)
+import json
 import os
 import shutil
 import sys
@@ -7,18 +13,7 @@ import tempfile
 import unittest
 import pytest
 
-try:
-    import scipy
-except:
-    scipy = None
 
-try:
-    import munkres
-except ImportError:
-    munkres = None
-
-
-@unittest.skipUnless(scipy or munkres, "scipy or munkres not installed")
 class InterpolatableTest(unittest.TestCase):
     def __init__(self, methodName):
         unittest.TestCase.__init__(self, methodName)
@@ -124,12 +119,68 @@ class InterpolatableTest(unittest.TestCase):
             ],
         )
 
+    def test_interpolatable_jobs_and_cache(self):
+        suffix = ".otf"
+        ttx_dir = self.get_test_input("variable_ttx_interpolatable_cff2")
+        ttx_path = os.path.abspath(os.path.join(ttx_dir, "interpolatable-test.ttx"))
+
+        self.temp_dir()
+        self.compile_font(ttx_path, suffix, self.tempdir)
+
+        otf_path = self.get_file_list(self.tempdir, suffix)[0]
+        cache_path = os.path.join(self.tempdir, "cache.pickle")
+
+        expected = interpolatable_main(["--quiet", otf_path])
+        self.assertTrue(expected)
+        self.assertEqual(
+            interpolatable_main(["--quiet", "-j", "2", otf_path]), expected
+        )
+        # A first run fills the cache in, a second one reuses it.
+        for _ in range(2):
+            self.assertEqual(
+                interpolatable_main(
+                    ["--quiet", "-j", "2", "--cache", cache_path, otf_path]
+                ),
+                expected,
+            )
+            self.assertTrue(os.path.exists(cache_path))
+        self.assertEqual(
+            interpolatable_main(["--quiet", "--cache", cache_path, otf_path]),
+            expected,
+        )
+
+        # Statistics of outlines that are gone are dropped from the cache.
+        cache = load_cache(cache_path)
+        keys = set(cache)
+        for jobs in ("1", "2"):
+            cache["stale"] = cache[next(iter(keys))]
+            save_cache(cache, cache_path)
+            self.assertEqual(
+                interpolatable_main(
+                    ["--quiet", "-j", jobs, "--cache", cache_path, otf_path]
+                ),
+                expected,
+            )
+            cache = load_cache(cache_path)
+            self.assertEqual(set(cache), keys)
+
+        # The cache is plain JSON, and is ignored by other fontTools versions.
+        with open(cache_path, encoding="utf-8") as f:
+            data = json.load(f)
+        self.assertEqual(data["version"], fontTools.version)
+        data["version"] = "0.0"
+        with open(cache_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        self.assertEqual(load_cache(cache_path), {})
+
     def test_interpolatable_ufo(self):
+        pytest.importorskip("fs")
         ttx_dir = self.get_test_input("master_ufo")
         ufo_paths = self.get_file_list(ttx_dir, ".ufo", "TestFamily2-")
         self.assertIsNone(interpolatable_main(ufo_paths))
 
     def test_designspace(self):
+        pytest.importorskip("fs")
         designspace_path = self.get_test_input("InterpolateLayout.designspace")
         self.assertIsNone(interpolatable_main([designspace_path]))
 
@@ -198,6 +249,7 @@ class InterpolatableTest(unittest.TestCase):
         )
 
     def test_sparse_interpolatable_ufos(self):
+        pytest.importorskip("fs")
         ttx_dir = self.get_test_input("master_ufo")
         ufo_paths = self.get_file_list(ttx_dir, ".ufo", "SparseMasters-")
 
@@ -236,6 +288,7 @@ class InterpolatableTest(unittest.TestCase):
         )
 
     def test_sparse_designspace(self):
+        pytest.importorskip("fs")
         designspace_path = self.get_test_input("SparseMasters_ufo.designspace")
 
         problems = interpolatable_main(["--quiet", designspace_path])
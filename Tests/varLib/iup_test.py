@@ -1,4 +1,6 @@
 import fontTools.varLib.iup as iup
+import math
+import random
 import sys
 import pytest
 
@@ -118,6 +120,60 @@ class IupTest:
         assert chain1 == chain2, f
         assert costs1 == costs2, f
 
+    @pytest.mark.parametrize("tolerance", [0, 0.5, 2])
+    def test_iup_delta_optimize_fast(self, tolerance):
+        coords, deltas, ends = self.random_glyph(random.Random(0))
+        optimal = iup.iup_delta_optimize(deltas, coords, ends, tolerance)
+        fast = iup.iup_delta_optimize(deltas, coords, ends, tolerance, fast=True)
+
+        assert 0 < fast.count(None) <= optimal.count(None)
+        for (x, y), (p, q) in zip(deltas, iup.iup_delta(fast, coords, ends)):
+            assert abs(complex(x - p, y - q)) <= tolerance
+
+    @pytest.mark.parametrize("tolerance", [0, 0.5, 2])
+    def test_iup_delta_optimize_numpy(self, monkeypatch, tolerance):
+        pytest.importorskip("numpy")
+        coords, deltas, ends = self.random_glyph(random.Random(1))
+        monkeypatch.setattr(iup, "NUMPY_MIN_POINTS", 0)
+        monkeypatch.setattr(iup, "NUMPY_MAX_FORCED", 1)
+        vectorized = iup.iup_delta_optimize(deltas, coords, ends, tolerance)
+        monkeypatch.setattr(iup, "np", None)
+        expected = iup.iup_delta_optimize(deltas, coords, ends, tolerance)
+
+        assert vectorized == expected
+
+    @pytest.mark.parametrize("tolerance", [0, 0.5, 2])
+    def test_iup_delta_optimize_geometry(self, tolerance):
+        coords, deltas, ends = self.random_glyph(random.Random(2))
+        masters = [
+            deltas,
+            [(2 * x, -y) for x, y in deltas],
+            [(y, x) for x, y in deltas],
+        ]
+        geometry = iup.IUPGeometry(coords, ends)
+        for deltas in masters:
+            assert iup.iup_delta_optimize(
+                deltas, coords, ends, tolerance, geometry=geometry
+            ) == iup.iup_delta_optimize(deltas, coords, ends, tolerance)
+
+    @staticmethod
+    def random_glyph(rng):
+        # A few roundish contours of various sizes, and deltas that mostly
+        # scale them, so that many of them can be interpolated.
+        coords, deltas, ends = [], [], []
+        for n in (1, 2, 3, 5, 8, 13, 40):
+            scale = rng.uniform(-0.2, 0.2)
+            for k in range(n):
+                angle = 2 * math.pi * k / n + rng.gauss(0, 0.1)
+                x = round(200 * math.cos(angle))
+                y = round(100 * math.sin(angle))
+                coords.append((x, y))
+                deltas.append((round(x * scale + rng.gauss(0, 0.3)), round(y * scale)))
+            ends.append(len(coords) - 1)
+        coords.extend([(0, 0), (500, 0), (0, 0), (0, 0)])
+        deltas.extend([(0, 0), (10, 0), (0, 0), (0, 0)])
+        return coords, deltas, ends
+
 
 if __name__ == "__main__":
     sys.exit(pytest.main(sys.argv))
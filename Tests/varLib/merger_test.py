@@ -1942,3 +1942,52 @@ class SparsePositioningMergerTest:
         font.save(b)
 
         assert font["GDEF"].table.VarStore.VarData[0].Item[0] == [-100, 0]
+
+
+class PairPosMergerTest:
+    @staticmethod
+    def build_masters(ttFont):
+        from fontTools.otlLib.builder import buildPairPosClassesSubtable, buildValue
+
+        glyphMap = ttFont.getReverseGlyphMap()
+        masters = []
+        for scale, classes in [
+            (1, [("a", "b"), ("c", "d"), ("e",)]),
+            (2, [("a",), ("b",), ("c", "d"), ("e",)]),
+            (3, [("a", "b"), ("c", "d", "e")]),
+        ]:
+            pairs = {}
+            for i, left in enumerate(classes):
+                for j, right in enumerate(classes):
+                    if (i + j) % 2:
+                        value = buildValue({"XAdvance": -10 * (i + j) * scale})
+                        pairs[left, right] = (value, None)
+            masters.append(buildPairPosClassesSubtable(pairs, glyphMap))
+        return masters
+
+    def merge(self, ttFont, masters):
+        from fontTools.varLib.merger import VariationMerger
+
+        model = VariationModel([{}, {"wght": 1}, {"wght": -1}])
+        merger = VariationMerger(model, ["wght"], ttFont)
+        merger.lookup_subtables = [[l] for l in masters]
+        out = deepcopy(masters[0])
+        merger.mergeThings(out, masters)
+        store = merger.store_builder.finish()
+        xml = "\n".join(getXML(out.toXML, ttFont))
+        storeXML = "\n".join(getXML(store.toXML, ttFont))
+        return xml, storeXML
+
+    def test_merge_class_kerning(self, ttFont, monkeypatch):
+        from fontTools.varLib import merger
+
+        masters = self.build_masters(ttFont)
+        xml, storeXML = self.merge(ttFont, deepcopy(masters))
+        assert '<Class1Record index="3">' in xml
+        assert '<VarData index="0">' in storeXML
+
+        # Merging the kerning values record by record gives the same result.
+        monkeypatch.setattr(
+            merger, "_PairPosFormat2_merge_variations", lambda *args: False
+        )
+        assert self.merge(ttFont, masters) == (xml, storeXML)
@@ -1,9 +1,12 @@
 from fontTools.varLib.models import (
     normalizeLocation,
     supportScalar,
+    RegionScalars,
     VariationModel,
     VariationModelError,
 )
+from fontTools.misc.roundTools import noRound, otRound
+import random
 import pytest
 
 
@@ -157,6 +160,37 @@ def test_model_extrapolate():
         assert expectedValue == model.interpolateFromMasters(loc, masterValues)
 
 
+@pytest.mark.parametrize("extrapolate", [False, True])
+def test_RegionScalars(extrapolate):
+    random.seed(0)
+    axisRanges = {"wght": (-1, 1), "wdth": (-1, 1)}
+    supports = [
+        {},
+        {"wght": (0, 1, 1)},
+        {"wght": (-1, -0.5, 0)},
+        {"wght": (0, 0.5, 1), "wdth": (0, 1, 1)},
+        {"wght": (-1, 0.5, 1)},  # spans zero: ignored by OpenType
+        {"wght": (0, 0, 1), "wdth": (-1, -1, 0)},  # zero peak: ignored
+        {"wght": (0.5, 0.2, 1)},  # invalid triple: ignored
+    ]
+    regionScalars = RegionScalars(
+        supports, extrapolate=extrapolate, axisRanges=axisRanges, cacheSize=4
+    )
+    locations = [{}, {"wght": 0, "wdth": 0}, {"wght": 1}, {"wdth": -1}] + [
+        {"wght": random.uniform(-1.5, 1.5), "wdth": random.uniform(-1.5, 1.5)}
+        for _ in range(20)
+    ]
+    for location in locations + locations:
+        expected = [
+            supportScalar(
+                location, support, extrapolate=extrapolate, axisRanges=axisRanges
+            )
+            for support in supports
+        ]
+        assert regionScalars(location) == expected
+    assert len(regionScalars._cache) == 4
+
+
 @pytest.mark.parametrize(
     "numLocations, numSamples",
     [
@@ -534,3 +568,54 @@ class VariationModelTest(object):
     def test_getMasterScalars(self, masterLocations, location, expected):
         model = VariationModel(masterLocations)
         assert model.getMasterScalars(location) == expected
+
+    @pytest.mark.parametrize("masterLocations", [locationsA, locationsB, locationsC])
+    @pytest.mark.parametrize("rounding", [noRound, round, otRound])
+    def test_getDeltasMany(self, masterLocations, rounding):
+        random.seed(0)
+        model = VariationModel(masterLocations)
+        numValues = 20
+        masterVectors = [
+            [random.uniform(-1000, 1000) for _ in range(numValues)]
+            for _ in masterLocations
+        ]
+        expected = [
+            model.getDeltas([v[k] for v in masterVectors], round=rounding)
+            for k in range(numValues)
+        ]
+        expected = [list(deltas) for deltas in zip(*expected)]
+
+        assert model.getDeltasMany(masterVectors, round=rounding) == expected
+        assert model._getDeltasManyPure(masterVectors, rounding) == expected
+
+        pytest.importorskip("numpy")
+        assert model._getDeltasManyNumpy(masterVectors, rounding) == expected
+
+    def test_getDeltasAndSupportsMany(self):
+        model = VariationModel(locationsC)
+        itemsList = [
+            [100, 120, 150, 110, 180],
+            [100, None, 150, 110, 180],
+            [100, 130, 160, 90, None],
+            [100, None, 151, 111, 181],
+        ]
+        assert model.getDeltasAndSupportsMany(itemsList, round=round) == [
+            model.getDeltasAndSupports(items, round=round) for items in itemsList
+        ]
+
+    def test_getSubModel_cache(self):
+        model = VariationModel(locationsC)
+        model.subModelCacheSize = 2
+        itemsA = [100, None, 150, 110, 180]
+        itemsB = [100, 130, None, 110, 180]
+        itemsC = [100, 130, 150, None, 180]
+
+        subModelA, _ = model.getSubModel(itemsA)
+        subModelB, _ = model.getSubModel(itemsB)
+        assert model.getSubModel(itemsA)[0] is subModelA
+        model.getSubModel(itemsC)  # evicts B, the least recently used
+        assert model.getSubModel(itemsA)[0] is subModelA
+        assert model.getSubModel(itemsB)[0] is not subModelB
+        assert model.getSubModel([100, 120, 150, 110, 180])[0] is model
+
+        assert model.getSubModelCacheInfo() == (2, 4, 2, 2)
@@ -11,12 +11,14 @@ from fontTools.varLib import (
 from fontTools.varLib.errors import VarLibValidationError
 import fontTools.varLib.errors as varLibErrors
 from fontTools.varLib.models import VariationModel
+from fontTools.varLib.iup import iup_delta
 from fontTools.varLib.mutator import instantiateVariableFont
 from fontTools.varLib import main as varLib_main, load_masters
 from fontTools.varLib import set_default_weight_width_slant
 from fontTools.designspaceLib import (
     DesignSpaceDocumentError,
     DesignSpaceDocument,
+    RangeAxisSubsetDescriptor,
     SourceDescriptor,
 )
 from fontTools.feaLib.builder import addOpenTypeFeaturesFromString
@@ -665,6 +667,151 @@ class BuildTest(unittest.TestCase):
         tables = [table_tag for table_tag in varfont.keys() if table_tag != "head"]
         self.expect_ttx(varfont, expected_ttx_path, tables)
 
+    def test_varlib_build_gvar_jobs(self):
+        ds_path = self.get_test_input("Build.designspace")
+        ttx_dir = self.get_test_input("master_ttx_interpolatable_ttf")
+
+        ds = DesignSpaceDocument.fromfile(ds_path)
+        for source in ds.sources:
+            source.path = os.path.join(
+                ttx_dir, os.path.basename(source.filename).replace(".ufo", ".ttx")
+            )
+        ds.updatePaths()
+
+        serial, _, _ = build(ds)
+        parallel, _, _ = build(ds, jobs=2)
+
+        assert parallel["gvar"].compile(parallel) == serial["gvar"].compile(serial)
+
+    def test_varlib_build_gvar_fast_iup(self):
+        ds_path = self.get_test_input("Build.designspace")
+        ttx_dir = self.get_test_input("master_ttx_interpolatable_ttf")
+
+        ds = DesignSpaceDocument.fromfile(ds_path)
+        for source in ds.sources:
+            source.path = os.path.join(
+                ttx_dir, os.path.basename(source.filename).replace(".ufo", ".ttx")
+            )
+        ds.updatePaths()
+
+        unoptimized, _, _ = build(ds, optimize=False)
+        fast, _, _ = build(ds, fast_iup=True)
+
+        glyf, hMetrics = fast["glyf"], fast["hmtx"].metrics
+        for glyph, variations in fast["gvar"].variations.items():
+            coords, control = glyf._getCoordinatesAndControls(glyph, hMetrics)
+            expected = unoptimized["gvar"].variations[glyph]
+            assert [var.axes for var in variations] == [var.axes for var in expected]
+            for var, expectedVar in zip(variations, expected):
+                deltas = iup_delta(var.coordinates, coords, list(control.endPts))
+                for (x, y), (p, q) in zip(deltas, expectedVar.coordinates):
+                    assert abs(complex(x - p, y - q)) <= 0.5
+
+    def test_varlib_build_incremental(self):
+        ds_path = self.get_test_input("Build.designspace")
+        ttx_dir = self.get_test_input("master_ttx_interpolatable_ttf")
+
+        def load_ds():
+            ds = DesignSpaceDocument.fromfile(ds_path)
+            for source in ds.sources:
+                source.path = os.path.join(
+                    ttx_dir, os.path.basename(source.filename).replace(".ufo", ".ttx")
+                )
+            ds.updatePaths()
+            load_masters(ds)
+            return ds
+
+        previous, _, _ = build(load_ds())
+        previous = reload_font(previous)
+
+        # Move a point of glyph "a" in a non-default master.
+        ds = load_ds()
+        glyph = ds.sources[1].font["glyf"]["uni0061"]
+        glyph.coordinates[0] = (glyph.coordinates[0][0] + 10, glyph.coordinates[0][1])
+        expected, _, _ = build(ds)
+        expected = reload_font(expected)
+
+        for changed_glyphs in (None, {"uni0061"}):
+            with self.assertLogs("fontTools.varLib", "INFO") as logs:
+                vf, _, _ = build(
+                    ds,
+                    previous_vf=previous,
+                    changed_glyphs=changed_glyphs,
+                    reuse_layout=True,
+                )
+            numGlyphs = len(vf.getGlyphOrder())
+            assert (
+                "INFO:fontTools.varLib:Reusing 'gvar' variations of %d glyphs"
+                % (numGlyphs - 1)
+            ) in logs.output
+            assert any(
+                "WARNING:fontTools.varLib:Reusing the merged 'GDEF' and 'GPOS'" in line
+                for line in logs.output
+            )
+            vf = reload_font(vf)
+            assert sorted(vf.keys()) == sorted(expected.keys())
+            for tag in vf.keys():
+                if tag not in ("GlyphOrder", "head"):
+                    assert vf.getTableData(tag) == expected.getTableData(tag)
+
+    def test_varlib_build_many_jobs(self):
+        ds_path = self.get_test_input("Build.designspace")
+        ttx_dir = self.get_test_input("master_ttx_interpolatable_ttf")
+
+        ds = DesignSpaceDocument.fromfile(ds_path)
+        for source in ds.sources:
+            source.path = os.path.join(
+                ttx_dir, os.path.basename(source.filename).replace(".ufo", ".ttx")
+            )
+        ds.updatePaths()
+        ds.addVariableFontDescriptor(
+            name="TestFamilyVF",
+            axisSubsets=[
+                RangeAxisSubsetDescriptor(name="weight"),
+                RangeAxisSubsetDescriptor(name="contrast"),
+            ],
+        )
+        ds.addVariableFontDescriptor(
+            name="TestFamilyWeightVF",
+            axisSubsets=[RangeAxisSubsetDescriptor(name="weight")],
+        )
+
+        serial = build_many(ds)
+        parallel = build_many(ds, jobs=2)
+
+        assert list(parallel) == list(serial) == ["TestFamilyVF", "TestFamilyWeightVF"]
+        for name, vf in serial.items():
+            vf = reload_font(vf)
+            for tag in vf.keys():
+                if tag not in ("GlyphOrder", "head"):
+                    assert parallel[name].getTableData(tag) == vf.getTableData(tag)
+
+    def test_load_masters_jobs(self):
+        ds_path = self.get_test_input("Build.designspace")
+        ttx_dir = self.get_test_input("master_ttx_interpolatable_ttf")
+
+        self.temp_dir()
+        for path in self.get_file_list(ttx_dir, ".ttx", "TestFamily-"):
+            self.compile_font(path, ".ttf", self.tempdir)
+
+        ds = DesignSpaceDocument.fromfile(ds_path)
+        for source in ds.sources:
+            source.path = os.path.join(
+                self.tempdir, os.path.basename(source.filename).replace(".ufo", ".ttf")
+            )
+        ds.updatePaths()
+        # A master given by the caller is prefetched too.
+        given = ds.sources[1].font = TTFont(ds.sources[1].path)
+
+        fonts = load_masters(ds, jobs=2, prefetch=["glyf", "GDEF", "CFF "])
+
+        assert fonts[1] is given
+        assert fonts[0] is fonts[4]  # Same path, loaded once
+        assert [f.reader.file.name for f in fonts] == [s.path for s in ds.sources]
+        for font in fonts:
+            assert font.isLoaded("glyf") and font.isLoaded("GDEF")
+            assert not font.isLoaded("hmtx")
+
     def test_varlib_build_sparse_masters(self):
         ds_path = self.get_test_input("SparseMasters.designspace")
         expected_ttx_path = self.get_test_output("SparseMasters.ttx")
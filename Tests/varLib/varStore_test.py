@@ -275,6 +275,29 @@ def test_quantize(quantization, expectedBytes):
     assert len(data) == expectedBytes, xml
 
 
+def test_onlineVarStoreBuilder_dedup():
+    builder = OnlineVarStoreBuilder(["wght"])
+    builder.setSupports([{}, {"wght": (0, 1, 1)}])
+
+    # The hashes of (-1,) and (-2,) collide.
+    assert hash((-1,)) == hash((-2,))
+    varIdxs = [builder.storeDeltas(deltas) for deltas in ([-1], [-2], [-1], [-2])]
+    assert varIdxs == [0, 1, 0, 1]
+    assert builder.storeDeltasMany([[-2], [3]]) == 2
+    assert builder.storeDeltasMany([[-2], [3]]) == 2
+    assert builder.storeDeltas([3]) == 3
+
+    builder.setSupports([{}, {"wght": (0, 1, 1)}, {"wght": (-1, -1, 0)}])
+    assert builder.storeDeltas([0, 5, -5]) == 1 << 16
+
+    varStore = builder.finish()
+    assert [data.Item for data in varStore.VarData] == [
+        [[-1], [-2], [-2], [3]],
+        [[5, -5]],
+    ]
+    assert [data.ItemCount for data in varStore.VarData] == [4, 1]
+
+
 def test_optimize_overflow():
     numRegions = 1
     locations = [{"wght": 0}, {"wght": 0.5}]
@@ -78,6 +78,9 @@ if with_cython is True or (with_cython is None and has_cython):
     ext_modules.append(
         Extension("fontTools.misc.bezierTools", ["Lib/fontTools/misc/bezierTools.py"]),
     )
+    ext_modules.append(
+        Extension("fontTools.misc.hungarian", ["Lib/fontTools/misc/hungarian.py"]),
+    )
     ext_modules.append(
         Extension("fontTools.pens.momentsPen", ["Lib/fontTools/pens/momentsPen.py"]),
     )